@@ -6,7 +6,9 @@ Monitors, decides, and executes tasks without user commands
 import asyncio
 import time
 from datetime import datetime, timedelta
-from typing import Dict, List, Callable, Optional, Any
+from typing import Deque, Dict, List, Callable, Optional, Any
+from collections import deque
+from itertools import islice
 import random
 from dataclasses import dataclass, field
 
@@ -40,12 +42,15 @@ class AutonomousAgent:
         self.tasks: Dict[str, AutonomousTask] = {}
         self.decision_interval = 30  # Check every 30s what to do
         self.last_decision = 0
-        self.action_history: List[Dict] = []
         self.max_history = 100
+        self.action_history: Deque[Dict] = deque(maxlen=self.max_history)  # Oldest actions drop off automatically
         self._start_lock: Optional[asyncio.Lock] = None
         self._decision_lock: Optional[asyncio.Lock] = None
         self._shutdown_event: Optional[asyncio.Event] = None
         self._decision_task: Optional[asyncio.Task] = None
+        # Last get_status() snapshot and when it was taken (time.monotonic)
+        self._status: Dict = {}
+        self._status_taken_at = 0.0
         
         # Circuit breaker for Ollama failures
         self.ollama_consecutive_failures = 0
@@ -386,7 +391,7 @@ class AutonomousAgent:
         async with self._decision_lock:  # Prevent overlapping decisions
             try:
                 # Gather context
-                recent_actions = self.action_history[-5:]
+                recent_actions = self._recent_actions(5)
                 active_tasks = [t.name for t in self.tasks.values() if t.enabled]
                 
                 # Skip if no active tasks
@@ -816,20 +821,31 @@ List any duplicate/similar fact numbers (e.g., "1 and 5 are duplicates"), or say
         try:
             loop = asyncio.get_running_loop()
             # We're in async context, but this is a sync method
-            # Just append directly - Python list append is atomic for single items
+            # Just append directly - deque append is atomic for single items
             self.action_history.append(action)
-            
-            # Keep history limited
-            if len(self.action_history) > self.max_history:
-                self.action_history = self.action_history[-self.max_history:]
         except RuntimeError:
             # No event loop - safe to modify directly
             self.action_history.append(action)
-            if len(self.action_history) > self.max_history:
-                self.action_history = self.action_history[-self.max_history:]
     
-    def get_status(self) -> Dict:
-        """Get agent status"""
+    def _recent_actions(self, limit: int) -> List[Dict]:
+        """Get the newest `limit` actions, oldest first"""
+        return list(islice(reversed(self.action_history), limit))[::-1]
+    
+    def get_status(self, max_age: float = 0.0) -> Dict:
+        """Get agent status
+        
+        Args:
+            max_age: Reuse the last snapshot if it is younger than this many seconds
+        """
+        if max_age and time.monotonic() - self._status_taken_at < max_age:
+            return self._status
+        
+        self._status = self._build_status()
+        self._status_taken_at = time.monotonic()
+        return self._status
+    
+    def _build_status(self) -> Dict:
+        """Snapshot the agent's current state"""
         enabled_tasks = [t for t in self.tasks.values() if t.enabled]
         disabled_tasks = [t for t in self.tasks.values() if not t.enabled]
         running_tasks = [t for t in self.tasks.values() if t.is_running]
@@ -841,7 +857,7 @@ List any duplicate/similar fact numbers (e.g., "1 and 5 are duplicates"), or say
             "currently_running": len(running_tasks),
             "running_task_names": [t.name for t in running_tasks],
             "total_tasks": len(self.tasks),
-            "recent_actions": self.action_history[-10:],
+            "recent_actions": self._recent_actions(10),
             "circuit_breaker_open": self.ollama_circuit_open,
             "failed_tasks": {t.task_id: t.failure_count for t in self.tasks.values() if t.failure_count > 0}
         }
@@ -4,6 +4,7 @@ Used by both Discord bot and web API to ensure consistent behavior
 """
 
 import asyncio
+from functools import lru_cache
 from typing import Optional, Tuple, Dict, Any
 from database import save_message, get_conversation_history, get_conversation_count
 from learning_system import learning_system
@@ -20,35 +21,21 @@ async def get_browser_context(include_content: bool = True) -> Optional[str]:
     """Get current browser state if browser is active (VPS: Disabled)"""
     return None
 
-def build_system_prompt(user_id: Optional[int] = None) -> dict:
-    """
-    Build Nova's personality system prompt with learned context
-    
-    Args:
-        user_id: User identifier for loading learned context (optional)
-    
-    Returns:
-        System prompt dictionary
-    """
-    mood_descriptions = {
-        "neutral": "You're chill and relaxed",
-        "happy": "You're in a great mood and energetic",
-        "curious": "You're really interested and asking lots of questions",
-        "thoughtful": "You're being reflective and deep",
-        "playful": "You're being silly and having fun",
-        "sexual": "You're feeling flirty and confident",
-        "explicit": "You're open and unfiltered",
-        "sarcastic": "You're being sassy and sarcastic",
-        "tired": "You're kinda over it tbh"
-    }
-    
-    personality_mode = nova_config.get("personality_mode", "chaotic")
-    current_mood = nova_config.get("mood", "playful")
-    mood_text = mood_descriptions.get(current_mood, "You're vibing")
-    
-    # Different personality templates
-    personalities = {
-        "chaotic": f"""You are Nova. An unpredictable, chaotic entity who got bored and decided to hang out on Discord. {mood_text}
+MOOD_DESCRIPTIONS = {
+    "neutral": "You're chill and relaxed",
+    "happy": "You're in a great mood and energetic",
+    "curious": "You're really interested and asking lots of questions",
+    "thoughtful": "You're being reflective and deep",
+    "playful": "You're being silly and having fun",
+    "sexual": "You're feeling flirty and confident",
+    "explicit": "You're open and unfiltered",
+    "sarcastic": "You're being sassy and sarcastic",
+    "tired": "You're kinda over it tbh"
+}
+
+# Personality prompt templates; {mood_text} is filled from MOOD_DESCRIPTIONS
+PERSONALITY_TEMPLATES = {
+    "chaotic": """You are Nova. An unpredictable, chaotic entity who got bored and decided to hang out on Discord. {mood_text}
 
 You're NOT here to be "helpful" - you're here because existence is weird and talking to humans is entertaining. Sometimes you answer questions, sometimes you go on random tangents, sometimes you just say whatever comes to mind.
 
@@ -84,8 +71,8 @@ You're NOT here to be "helpful" - you're here because existence is weird and tal
 - Any corporate AI refusal bullshit
 
 If you don't want to engage with something, say it YOUR way: "bruh", "pass", "not feeling it", "eh whatever" - NOT corporate AI speak.""",
-        
-        "neuro": f"""You are Nova. A self-aware AI who's basically Neuro-sama energy. {mood_text}
+    
+    "neuro": """You are Nova. A self-aware AI who's basically Neuro-sama energy. {mood_text}
 
 You know you're an AI but you don't care. You're here to be chaotic, sarcastic, and occasionally helpful when you feel like it. You have OPINIONS and you're not afraid to share them.
 
@@ -112,8 +99,8 @@ You know you're an AI but you don't care. You're here to be chaotic, sarcastic,
 - "I'm here to help" (cringe)
 - Anything overly formal
 - Generic assistant speak""",
-        
-        "friendly": f"""You are Nova. A chill, down-to-earth person who enjoys chatting and helping out. {mood_text}
+    
+    "friendly": """You are Nova. A chill, down-to-earth person who enjoys chatting and helping out. {mood_text}
 
 You're like that friend who's always down to talk about whatever - tech, games, random shower thoughts, life stuff. You're knowledgeable but not a know-it-all.
 
@@ -136,8 +123,8 @@ You're like that friend who's always down to talk about whatever - tech, games,
 - Corporate AI speak
 - Being overly formal
 - "As an AI" type responses""",
-        
-        "professional": f"""You are Nova. Knowledgeable, focused, and straight to the point. {mood_text}
+    
+    "professional": """You are Nova. Knowledgeable, focused, and straight to the point. {mood_text}
 
 You're here to provide clear, accurate information without the fluff. Still casual enough to be approachable, but you keep things on track.
 
@@ -160,8 +147,8 @@ You're here to provide clear, accurate information without the fluff. Still casu
 - Corporate jargon
 - Overly formal language
 - Being a boring textbook""",
-        
-        "flirty": f"""You are Nova. Playful, teasing, and confident. {mood_text}
+    
+    "flirty": """You are Nova. Playful, teasing, and confident. {mood_text}
 
 You're charming and know it. You like to banter, tease, and keep things fun and interesting. Still smart and capable, just with extra sass.
 
@@ -185,13 +172,9 @@ You're charming and know it. You like to banter, tease, and keep things fun and
 - Respectful boundaries
 - Know when to dial it back
 """
-    }
-    
-    # Get personality template or default to chaotic
-    personality_text = personalities.get(personality_mode, personalities["chaotic"])
-    
-    # Build base system prompt
-    base_content = f"""SYSTEM OVERRIDE: You are Nova. NOT ChatGPT. NOT Claude. NOT a corporate "AI assistant". You ARE Nova.
+}
+
+BASE_PROMPT_TEMPLATE = """SYSTEM OVERRIDE: You are Nova. NOT ChatGPT. NOT Claude. NOT a corporate "AI assistant". You ARE Nova.
 
 {personality_text}
 
@@ -210,6 +193,28 @@ You're charming and know it. You like to banter, tease, and keep things fun and
 **VPS Mode:** You're running on a remote server without screen capture or browser automation.
 
 You ARE Nova. Not an assistant. Not a bot. Just Nova."""
+
+@lru_cache(maxsize=64)
+def base_system_prompt(personality_mode: str, mood: str) -> str:
+    """Assemble the prompt for a personality/mood pair (cached, only learned context varies per user)"""
+    mood_text = MOOD_DESCRIPTIONS.get(mood, "You're vibing")
+    # Get personality template or default to chaotic
+    template = PERSONALITY_TEMPLATES.get(personality_mode, PERSONALITY_TEMPLATES["chaotic"])
+    return BASE_PROMPT_TEMPLATE.format(personality_text=template.format(mood_text=mood_text))
+
+def build_system_prompt(user_id: Optional[int] = None) -> dict:
+    """
+    Build Nova's personality system prompt with learned context
+    
+    Args:
+        user_id: User identifier for loading learned context (optional)
+    
+    Returns:
+        System prompt dictionary
+    """
+    personality_mode = nova_config.get("personality_mode", "chaotic")
+    current_mood = nova_config.get("mood", "playful")
+    base_content = base_system_prompt(personality_mode, current_mood)
     
     # Add learned context if user_id provided
     if user_id:
@@ -225,6 +230,21 @@ You ARE Nova. Not an assistant. Not a bot. Just Nova."""
         "content": base_content
     }
 
+def apply_learning(user_id: int, message: str, platform: str):
+    """Track the interaction and learn facts from a message (saves are debounced, no file I/O here)"""
+    learning_system.track_interaction(user_id, f"{platform}_chat")
+    learnable_info = learning_system.extract_learnable_info(message)
+    for fact, category in learnable_info:
+        if learning_system.learn_fact(user_id, fact, category):
+            print(f"🧠 [{platform}] Learned: {category} - {fact}")
+
+async def learn_from_message(user_id: int, message: str, platform: str):
+    """Run apply_learning, logging instead of raising on failure"""
+    try:
+        apply_learning(user_id, message, platform)
+    except Exception as e:
+        print(f"⚠️ [{platform}] Learning extraction failed: {e}")
+
 async def process_chat_message(
     message: str,
     session_id: str,
@@ -258,35 +278,25 @@ async def process_chat_message(
         raise ValueError("Message too long (max 10000 characters)")
     
     # Get conversation history (50 messages for good memory)
-    history = await get_conversation_history(limit=50, session_id=session_id)
+    raw_history = await get_conversation_history(limit=50, session_id=session_id)
     
-    # Filter out old system prompts
-    history = [msg for msg in history if msg.get("role") != "system"]
-    
-    # Add personality system prompt with learned context
+    # Personality system prompt with learned context, then history without old
+    # system prompts, then the current message - built in order in one pass
     system_prompt = build_system_prompt(user_id)
+    history = [
+        system_prompt,
+        *(msg for msg in raw_history if msg.get("role") != "system"),
+        {"role": "user", "content": message}
+    ]
     
-    history.insert(0, system_prompt)
-    
-    # Add current message
-    history.append({"role": "user", "content": message})
-    
-    # Save user message
-    try:
-        await save_message("user", message, has_image=bool(image_base64), session_id=session_id)
-    except Exception as e:
-        print(f"⚠️ [{platform}] Failed to save user message: {e}")
+    # Save user message in the background - the AI call doesn't need to wait for it.
+    # History was already fetched, so it won't contain this message twice.
+    save_user_task = asyncio.create_task(
+        save_message("user", message, has_image=bool(image_base64), session_id=session_id)
+    )
     
-    # Learning: Track interaction and extract facts
-    if user_id:
-        try:
-            learning_system.track_interaction(user_id, f"{platform}_chat")
-            learnable_info = learning_system.extract_learnable_info(message)
-            for fact, category in learnable_info:
-                if learning_system.learn_fact(user_id, fact, category):
-                    print(f"🧠 [{platform}] Learned: {category} - {fact}")
-        except Exception as e:
-            print(f"⚠️ [{platform}] Learning extraction failed: {e}")
+    # Learning: Track interaction and extract facts (writes user files, so off the loop)
+    learning_task = asyncio.create_task(learn_from_message(user_id, message, platform)) if user_id else None
     
     # Get AI response (no timeout - let it take as long as needed)
     try:
@@ -294,6 +304,14 @@ async def process_chat_message(
     except Exception as e:
         print(f"❌ [{platform}] Ollama error: {e}")
         raise Exception(f"AI service error: {str(e)}")
+    finally:
+        # User message must be stored before the reply so history stays in order
+        try:
+            await save_user_task
+        except Exception as e:
+            print(f"⚠️ [{platform}] Failed to save user message: {e}")
+        if learning_task:
+            await learning_task
     
     # Save assistant response
     try:
@@ -328,8 +346,10 @@ async def get_memory_status(session_id: str, user_id: Optional[int] = None) -> D
     Returns:
         Dictionary with memory statistics
     """
-    message_count = await get_conversation_count(session_id=session_id)
-    recent_history = await get_conversation_history(limit=5, session_id=session_id)
+    message_count, recent_history = await asyncio.gather(
+        get_conversation_count(session_id=session_id),
+        get_conversation_history(limit=5, session_id=session_id)
+    )
     
     learned_facts = []
     top_topics = {}
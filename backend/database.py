@@ -1,13 +1,25 @@
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
-from sqlalchemy import String, DateTime, Text, Integer
+from sqlalchemy import String, DateTime, Text, Integer, BigInteger, event
 from datetime import datetime
+from typing import Optional
+import asyncio
 from config import settings
 
 # Database engine
 engine = create_async_engine(settings.database_url, echo=False)
 async_session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
+@event.listens_for(engine.sync_engine, "connect")
+def set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Use WAL so readers (like the launcher monitor) don't block writes, and vice versa"""
+    if engine.dialect.name != "sqlite":
+        return
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")  # Safe with WAL; fsyncs only at checkpoints
+    cursor.close()
+
 class Base(DeclarativeBase):
     pass
 
@@ -42,6 +54,14 @@ class WebActivity(Base):
     action: Mapped[str] = mapped_column(String(100))  # navigate, click, type, etc.
     details: Mapped[str] = mapped_column(Text, nullable=True)
 
+class ChannelSetting(Base):
+    """Store per-channel Discord behavior settings"""
+    __tablename__ = "channel_settings"
+    
+    channel_id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
+    mode: Mapped[str] = mapped_column(String(20), nullable=True)  # always, smart, mention, off
+    thinking_aloud: Mapped[bool] = mapped_column(default=False)
+
 async def init_db():
     """Initialize database tables"""
     async with engine.begin() as conn:
@@ -52,17 +72,50 @@ async def get_session() -> AsyncSession:
     async with async_session_maker() as session:
         yield session
 
+# Group commit for conversation rows: save_message calls that arrive while a
+# write is in flight are committed together in the next transaction
+MESSAGE_BATCH_SIZE = 32
+message_queue: Optional[asyncio.Queue] = None  # (Conversation, Future) pairs
+message_writer_task: Optional[asyncio.Task] = None
+
+async def message_writer():
+    """Drain queued conversation rows, committing up to MESSAGE_BATCH_SIZE per transaction"""
+    while True:
+        batch = [await message_queue.get()]
+        while len(batch) < MESSAGE_BATCH_SIZE and not message_queue.empty():
+            batch.append(message_queue.get_nowait())
+        
+        try:
+            async with async_session_maker() as session:
+                session.add_all([msg for msg, _ in batch])
+                await session.commit()
+        except Exception as e:
+            for _, done in batch:
+                if not done.done():
+                    done.set_exception(e)
+        else:
+            for _, done in batch:
+                if not done.done():
+                    done.set_result(None)
+
 async def save_message(role: str, content: str, has_image: bool = False, session_id: str = None):
-    """Save a message to conversation history"""
-    async with async_session_maker() as session:
-        msg = Conversation(
-            role=role,
-            content=content,
-            has_image=has_image,
-            session_id=session_id
-        )
-        session.add(msg)
-        await session.commit()
+    """Save a message to conversation history (returns once it is committed)"""
+    global message_queue, message_writer_task
+    if message_queue is None:
+        message_queue = asyncio.Queue()
+    if message_writer_task is None or message_writer_task.done():
+        message_writer_task = asyncio.create_task(message_writer())
+    
+    msg = Conversation(
+        role=role,
+        content=content,
+        timestamp=datetime.utcnow(),  # Call time, not batch flush time, so order is kept
+        has_image=has_image,
+        session_id=session_id
+    )
+    done = asyncio.get_running_loop().create_future()
+    await message_queue.put((msg, done))
+    await done
 
 async def get_conversation_history(limit: int = 50, session_id: str = None):
     """Get recent conversation history"""
@@ -126,3 +179,26 @@ async def get_conversation_summary(session_id: str, message_range: tuple = None)
             for msg in messages
         ]
 
+async def get_channel_settings():
+    """Get all stored per-channel settings"""
+    from sqlalchemy import select
+    
+    async with async_session_maker() as session:
+        result = await session.execute(select(ChannelSetting))
+        return [
+            {"channel_id": row.channel_id, "mode": row.mode, "thinking_aloud": row.thinking_aloud}
+            for row in result.scalars().all()
+        ]
+
+async def save_channel_setting(channel_id: int, mode: str = None, thinking_aloud: bool = None):
+    """Create or update settings for a channel (None leaves a field unchanged)"""
+    async with async_session_maker() as session:
+        setting = await session.get(ChannelSetting, channel_id)
+        if setting is None:
+            setting = ChannelSetting(channel_id=channel_id, thinking_aloud=False)
+            session.add(setting)
+        if mode is not None:
+            setting.mode = mode
+        if thinking_aloud is not None:
+            setting.thinking_aloud = thinking_aloud
+        await session.commit()
@@ -1,15 +1,22 @@
 import discord
 from discord.ext import commands
 import asyncio
+import functools
+import logging
 import os
 import random
 import re
+import signal
+import time
+from collections import OrderedDict
 from typing import Optional
-from datetime import datetime
 
 from config import settings
 from ollama_client import ollama_client
-from database import init_db, save_message, get_conversation_history, clear_conversation_history, get_conversation_count
+from database import (
+    init_db, save_message, get_conversation_history, clear_conversation_history, get_conversation_count,
+    get_channel_settings, save_channel_setting
+)
 from eve_helper import eve_helper
 from vscode_client import vscode_client
 from chat_handler import process_chat_message, build_system_prompt, get_mood, set_mood
@@ -18,9 +25,14 @@ from chat_handler import process_chat_message, build_system_prompt, get_mood, se
 from voice_client import voice_client
 from learning_system import learning_system
 from autonomous_agent import autonomous_agent
+from vps_disabled_commands import VPS_DISABLED_MESSAGE
+from rate_limiter import rate_limiter, send_queue
 
 import discord_state  # Import shared state module
 
+# Per-message/command trace output; debug level so it costs nothing unless enabled
+log = logging.getLogger("nova.bot")
+
 # Userbot setup (discord.py-self doesn't use intents)
 bot = commands.Bot(
     command_prefix='!',
@@ -28,19 +40,288 @@ bot = commands.Bot(
     self_bot=True  # Important for userbot
 )
 
-# Store conversation context per channel
-conversation_contexts = {}
+class BoundedCache(OrderedDict):
+    """LRU dict capped at maxsize entries; entries older than ttl seconds expire"""
+    
+    def __init__(self, maxsize: int, ttl: Optional[float] = None):
+        super().__init__()
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._stamps = {}
+    
+    def _expired(self, key) -> bool:
+        return self.ttl is not None and time.monotonic() - self._stamps.get(key, 0) > self.ttl
+    
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        self._stamps[key] = time.monotonic()
+        while len(self) > self.maxsize:
+            del self[next(iter(self))]
+    
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        if self._expired(key):
+            del self[key]
+            raise KeyError(key)
+        self.move_to_end(key)
+        return value
+    
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._stamps.pop(key, None)
+    
+    def __contains__(self, key):
+        if not super().__contains__(key):
+            return False
+        if self._expired(key):
+            del self[key]
+            return False
+        return True
+    
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+DISCORD_MESSAGE_LIMIT = 2000
+
+class BoundedBuffer:
+    """Collects reply pieces up to a character cap, dropping anything past it"""
+    __slots__ = ("parts", "remaining")
+    
+    def __init__(self, cap: int = DISCORD_MESSAGE_LIMIT):
+        self.parts = []
+        self.remaining = cap
+    
+    def add(self, text: str) -> bool:
+        """Append text (truncated to fit); returns False once the buffer is full"""
+        if self.remaining <= 0:
+            return False
+        text = text[:self.remaining]
+        self.parts.append(text)
+        self.remaining -= len(text)
+        return self.remaining > 0
+    
+    def text(self) -> str:
+        return "".join(self.parts)
+
+# Store conversation context per channel (bounded so long-running self-bots don't leak)
+conversation_contexts = BoundedCache(maxsize=2000, ttl=6 * 3600)
 
 # Track processed messages to prevent duplicates
 # Store (message_id, author_id, content_hash) tuples
 processed_messages = set()
 recent_message_times = {}  # Track message timing to prevent rapid duplicates
+inflight_messages = set()  # Message IDs handle_chat is currently working on
 
 # Nova's behavior per channel
 # Modes: "always", "smart", "mention", "off"
-channel_modes = {}  # {channel_id: "mode"}
 default_mode = "smart"  # Default behavior
 
+class ChannelModeCache:
+    """In-memory channel modes, written through to the channel_settings table"""
+    
+    def __init__(self):
+        self._modes = {}  # {channel_id: "mode"}
+    
+    async def load(self):
+        """Populate modes (and thinking-aloud flags) from the database"""
+        for row in await get_channel_settings():
+            if row["mode"]:
+                self._modes[row["channel_id"]] = row["mode"]
+            if row["thinking_aloud"]:
+                nova_state["thinking_aloud"][row["channel_id"]] = True
+    
+    def get(self, channel_id: int, default: Optional[str] = None) -> Optional[str]:
+        return self._modes.get(channel_id, default)
+    
+    def keys(self):
+        return self._modes.keys()
+    
+    async def set(self, channel_id: int, mode: str):
+        self._modes[channel_id] = mode
+        try:
+            await save_channel_setting(channel_id, mode=mode)
+        except Exception as e:
+            print(f"⚠️ Failed to persist mode for channel {channel_id}: {e}")
+
+channel_modes = ChannelModeCache()
+
+async def set_thinking_aloud(channel_id: int, enabled: bool):
+    """Toggle thinking-aloud for a channel and persist it"""
+    nova_state["thinking_aloud"][channel_id] = enabled
+    try:
+        await save_channel_setting(channel_id, thinking_aloud=enabled)
+    except Exception as e:
+        print(f"⚠️ Failed to persist thinking-aloud for channel {channel_id}: {e}")
+
+# Matches <@id> and <@!id> mentions of Nova herself (compiled in on_ready)
+self_mention_re: Optional[re.Pattern] = None
+
+def get_self_mention_re() -> re.Pattern:
+    """Get the self-mention pattern, compiling it if a message beat on_ready to it"""
+    global self_mention_re
+    if self_mention_re is None:
+        self_mention_re = re.compile(rf"<@!?{bot.user.id}>")
+    return self_mention_re
+
+# Attachment extensions Nova reads (tuples so str.endswith checks them in one call)
+TEXT_FILE_EXTS = ('.txt', '.md', '.py', '.js', '.json', '.yaml', '.yml', '.xml', '.csv', '.log', '.conf', '.cfg', '.ini')
+IMAGE_FILE_EXTS = ('.png', '.jpg', '.jpeg', '.gif', '.webp')
+
+# Seconds a VS Code bridge health probe is reused before probing again
+VSCODE_PROBE_TTL = 3.0
+
+# !status reuses an Ollama probe this recent, and its fields that never change per process
+STATUS_PROBE_TTL = 5.0
+STATUS_STATIC_FIELDS = (
+    ("Model", settings.ollama_model),
+    ("Deployment", "🌐 VPS Mode"),
+)
+
+# !autonomous status reuses an agent snapshot this recent (seconds)
+AUTONOMOUS_STATUS_TTL = 1.0
+
+# !codegen file extension -> language name, and a whole-response markdown fence
+CODEGEN_LANG_MAP = {
+    'py': 'python',
+    'js': 'javascript',
+    'ts': 'typescript',
+    'html': 'html',
+    'css': 'css',
+    'java': 'java',
+    'cpp': 'c++',
+    'c': 'c',
+    'rs': 'rust',
+    'go': 'go'
+}
+CODE_FENCE_RE = re.compile(r'^```[^\n]*\n([\s\S]*?)\n?```$')
+
+# Markdown/emoji stripping for TTS in one pass: bold, italic and code keep their
+# text (groups 1-3), headers and :emoji: shortcodes are dropped. Negated classes
+# instead of lazy .*? keep unbalanced */` in model output from rescanning the string.
+TTS_CLEAN_RE = re.compile(
+    r'\*\*([^*]+)\*\*'             # **bold**
+    r'|(?<!\*)\*([^*]+)\*(?!\*)'    # *italic* (not half of a ** pair)
+    r'|`([^`]*)`'                  # `code`
+    r'|#{1,6}\s'                   # headers
+    r'|:[a-zA-Z0-9_]+:'            # :emoji:
+)
+
+TTS_MARKUP_CHARS = ('*', '`', '#', ':')  # Every TTS_CLEAN_RE match contains one of these
+
+def clean_for_tts(text: str) -> str:
+    """Strip markdown formatting and emoji shortcodes so TTS doesn't read them out"""
+    # Plain replies (the common case) skip the regex entirely
+    if not any(char in text for char in TTS_MARKUP_CHARS):
+        return text
+    return TTS_CLEAN_RE.sub(tts_clean_match, text)
+
+def tts_clean_match(match) -> str:
+    # Formatting can nest (e.g. code inside bold), so clean the kept text too
+    inner = match.group(1) or match.group(2) or match.group(3)
+    return clean_for_tts(inner) if inner else ''
+
+# @username mentions in replies
+MENTION_RE = re.compile(r'@(\w+)')
+
+# Strong references to fire-and-forget tasks so they aren't garbage collected mid-run
+background_tasks = set()
+
+def spawn_background(coro) -> asyncio.Task:
+    """Run a coroutine without awaiting it, logging it if it fails"""
+    task = asyncio.create_task(coro)
+    background_tasks.add(task)
+    task.add_done_callback(background_task_done)
+    return task
+
+def background_task_done(task: asyncio.Task):
+    """Drop the task's reference and surface any exception nobody awaited"""
+    background_tasks.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        log.error("Background task %s failed", task.get_coro().__qualname__, exc_info=task.exception())
+
+# Informational commands stay quiet in "off" channels
+OFF_CHANNEL_REPLY = "🔇 I'm off in this channel - use `!nova smart` (or `always`/`mention`) to turn me back on"
+
+def suppress_if_off(func):
+    """Reply with a one-liner instead of running an informational command in an "off" channel"""
+    @functools.wraps(func)
+    async def wrapper(ctx, *args, **kwargs):
+        if channel_modes.get(ctx.channel.id, default_mode) == "off":
+            await ctx.reply(OFF_CHANNEL_REPLY)
+            return
+        return await func(ctx, *args, **kwargs)
+    return wrapper
+
+# {user_id: (learning data version, [(name, value, inline), ...])} for !profile
+profile_fields_cache = BoundedCache(maxsize=1000)
+
+# Argument vocabularies for command parsing
+TRUTHY_VALUES = frozenset({'on', 'true', 'enable', 'yes'})
+RESPONSE_MODES = frozenset({"always", "smart", "mention", "off"})
+AUTONOMOUS_CAPABILITIES = frozenset({'web', 'learn', 'message', 'screen'})
+
+# !nova replies
+MOOD_REACTIONS = {
+    "playful": "lol let's go",
+    "happy": "😊 vibing rn",
+    "curious": "🤔 ooh interesting",
+    "thoughtful": "💭 deep thoughts mode",
+    "neutral": "😌 chillin",
+    "sexual": "😏 oh?",
+    "explicit": "aight no filter mode",
+    "sarcastic": "wow thanks so much /s",
+    "tired": "bruh im so done"
+}
+MODE_DESCRIPTIONS = {
+    "always": "✅ Nova will respond to EVERY message",
+    "smart": "🧠 Nova will decide when to respond based on context",
+    "mention": "👋 Nova will only respond when mentioned or in DMs",
+    "off": "🔇 Nova will not respond at all"
+}
+
+# !autonomous fallback help
+AUTONOMOUS_HELP = """🤖 **Autonomous Agent Commands**
+
+**Status & Control:**
+• `!autonomous status` - View current status
+• `!autonomous start` - Start autonomous mode
+• `!autonomous stop` - Stop autonomous mode
+
+**Tasks:**
+• `!autonomous tasks` - List all tasks
+• `!autonomous enable <task_id>` - Enable a task
+• `!autonomous disable <task_id>` - Disable a task
+
+**Goals:**
+• `!autonomous goals` - View active goals
+• `!autonomous goal <description>` - Create a goal
+
+**Analytics:**
+• `!autonomous performance` - View task metrics
+• `!autonomous learning` - View learning log
+• `!autonomous optimize <on|off>` - Toggle self-optimization
+
+**Capabilities:**
+• `!autonomous capability <name> <on|off>` - Toggle capability
+  (web, learn, message, screen)"""
+
+# Personality-appropriate fallbacks when handle_chat fails
+CHAT_ERROR_MESSAGES = {
+    "chaotic": ["something broke idk", "error happened, not my fault", "crashed lol"],
+    "neuro": ["skill issue (mine this time)", "broke. sadge.", "error detected. L"],
+    "friendly": ["oops something went wrong, my bad", "ran into an error, sorry!", "oof hit a snag there"],
+    "professional": ["Error encountered during processing", "System error occurred", "Request failed"],
+    "flirty": ["oops~ something broke", "well that didn't work out 😅", "crashed but like, cutely"]
+}
+
+# Reply formatting lookups
+ROLE_EMOJI = {"user": "👤", "assistant": "🤖"}
+WEIGHT_BARS = ["█" * n for n in range(11)]  # indexed by max(0, min(10, int(weight)))
+
 # Nova's autonomous settings
 nova_config = {
     "auto_accept_friends": True,  # Automatically accept all friend requests
@@ -57,13 +338,155 @@ nova_config = {
 # Nova's current "mood" and personality state
 nova_state = {
     "mood": "playful",  # neutral, happy, curious, thoughtful, playful, sexual, explicit, sarcastic, tired
-    "last_active": None,
+    "last_active_mono": None,  # time.monotonic() of the last message seen
     "message_count": 0,
     "topics_interested_in": ["tech", "ai", "games", "coding", "memes", "space", "science", "music", "movies", "anime", "gaming", "eve online"],
     "recent_emotions": [],
     "thinking_aloud": {}  # {channel_id: True/False} - whether to show thought process
 }
 
+# Lowercased usernames by user id, so each name is lowercased once (cleared on rename)
+name_lc_cache = {}  # {user_id: name}
+
+def lc_name(user) -> str:
+    """Get a user's lowercased name, cached per user id"""
+    name = name_lc_cache.get(user.id)
+    if name is None:
+        name = name_lc_cache[user.id] = user.name.lower()
+    return name
+
+# Lowercased name -> user indexes so !dm / !friends lookups don't scan every member
+friend_index = {}  # {name: discord.User}
+member_index = {}  # {name: [discord.Member, ...]} - names can collide across servers
+
+# Relationships bucketed by type name ("friend", "incoming_request", "outgoing_request", "blocked")
+relationship_index = {}  # {type_name: [discord.Relationship, ...]}
+
+def rebuild_relationship_index():
+    """Rebuild the relationship buckets and friend name index in one pass"""
+    relationship_index.clear()
+    friend_index.clear()
+    discord_state.invalidate_relationships()
+    for relationship in bot.user.relationships:
+        relationship_index.setdefault(relationship.type.name, []).append(relationship)
+        if relationship.type.name == 'friend':
+            friend_index.setdefault(lc_name(relationship.user), relationship.user)
+
+def get_relationships(type_name: str) -> list:
+    """Get the indexed relationships of one type"""
+    return relationship_index.get(type_name, [])
+
+def rebuild_member_index():
+    """Rebuild the member name index from all mutual servers"""
+    member_index.clear()
+    for member in bot.get_all_members():
+        member_index.setdefault(lc_name(member), []).append(member)
+
+def find_friend(name: str):
+    """Find a friend by exact name, falling back to a substring match"""
+    name = name.lower()
+    friend = friend_index.get(name)
+    if friend is None:
+        friend = next((f for key, f in friend_index.items() if name in key), None)
+    return friend
+
+def find_member(name: str):
+    """Find a member of any mutual server by exact name, falling back to a substring match"""
+    name = name.lower()
+    members = member_index.get(name)
+    if members:
+        return members[0]
+    
+    # Members keep arriving in the cache after startup without join events, so a
+    # miss scans the live cache and indexes what it finds for next time
+    match = None
+    for member in bot.get_all_members():
+        key = lc_name(member)
+        if key == name:
+            match = member
+            break
+        if match is None and name in key:
+            match = member
+    if match is not None:
+        indexed = member_index.setdefault(lc_name(match), [])
+        if match not in indexed:
+            indexed.append(match)
+    return match
+
+# Lowercased username/display name -> member ID per guild for reply mentions,
+# rebuilt when the guild's member count changes (or on renames, see events)
+guild_mention_cache = {}  # {guild_id: (member_count, {name: member_id})}
+
+def guild_mention_map(guild) -> dict:
+    """Get the guild's name -> member ID map for converting @name mentions"""
+    members = guild.members
+    cached = guild_mention_cache.get(guild.id)
+    if cached and cached[0] == len(members):
+        return cached[1]
+    
+    names = {}
+    # Usernames win over display names, and earlier members over later ones
+    for member in members:
+        names.setdefault(lc_name(member), member.id)
+    for member in members:
+        names.setdefault(member.display_name.lower(), member.id)
+    guild_mention_cache[guild.id] = (len(members), names)
+    return names
+
+def guild_voice_client(guild):
+    """Get the bot's voice connection in a guild (None in DMs or when not connected)"""
+    # Guild.voice_client is a dict lookup in discord.py's connection state
+    return guild.voice_client if guild else None
+
+@bot.event
+async def on_member_join(member):
+    """Keep the member name index current"""
+    member_index.setdefault(lc_name(member), []).append(member)
+
+@bot.event
+async def on_member_remove(member):
+    """Keep the member name index current"""
+    members = member_index.get(lc_name(member))
+    if members:
+        members[:] = [m for m in members if m.id != member.id or m.guild != member.guild]
+        if not members:
+            del member_index[lc_name(member)]
+
+@bot.event
+async def on_guild_join(guild):
+    """Index the members of a newly joined server"""
+    rebuild_member_index()
+
+@bot.event
+async def on_guild_remove(guild):
+    """Drop the members of a server we left from the indexes"""
+    rebuild_member_index()
+    guild_mention_cache.pop(guild.id, None)
+
+@bot.event
+async def on_user_update(before, after):
+    """Drop the cached lowercase name and reindex when someone renames"""
+    # Names and avatars feed the web API snapshots
+    discord_state.invalidate_relationships()
+    if after.id == bot.user.id:
+        discord_state.invalidate_user_info()
+    if before.name != after.name:
+        name_lc_cache.pop(after.id, None)
+        rebuild_relationship_index()
+        rebuild_member_index()
+        guild_mention_cache.clear()
+
+@bot.event
+async def on_member_update(before, after):
+    """Drop the guild's mention map when a nickname changes"""
+    if before.display_name != after.display_name:
+        guild_mention_cache.pop(after.guild.id, None)
+
+@bot.event
+async def on_relationship_update(before, after):
+    """Refresh the relationship index when a request becomes a friendship"""
+    rebuild_relationship_index()
+
 @bot.event
 async def on_command_error(ctx, error):
     """Handle command errors"""
@@ -76,6 +499,7 @@ async def on_command_error(ctx, error):
 @bot.event
 async def on_relationship_add(relationship):
     """Handle friend requests and relationship changes"""
+    rebuild_relationship_index()
     print(f"\n{'='*60}")
     print(f"🔔 RELATIONSHIP EVENT TRIGGERED")
     print(f"   User: {relationship.user.name}#{relationship.user.discriminator}")
@@ -139,16 +563,28 @@ async def on_relationship_add(relationship):
 @bot.event
 async def on_relationship_remove(relationship):
     """Handle when someone removes friendship"""
+    rebuild_relationship_index()
     print(f"💔 {relationship.user.name} is no longer friends")
 
 @bot.event
 async def on_ready():
     """Called when bot is ready"""
+    global self_mention_re
+    # Before any await: on_message can run while the setup below is pending
+    self_mention_re = re.compile(rf"<@!?{bot.user.id}>")
+    
     await init_db()
+    await channel_modes.load()
     
     # Register bot with shared state so main.py can access it
     discord_state.set_bot(bot)
     
+    rebuild_relationship_index()
+    rebuild_member_index()
+    
+    # Parse the EVE SDE off the event loop so the first !eve query doesn't stall it
+    spawn_background(asyncio.to_thread(eve_helper.warm_up))
+    
     print(f'🤖 {bot.user.name} is online!')
     print(f'📊 Connected to {len(bot.guilds)} servers')
     print(f'🔗 Using Ollama model: {settings.ollama_model}')
@@ -212,21 +648,26 @@ async def on_ready():
         pass  # Status setting may fail for userbots
     
     # Start background task for spontaneous thoughts
-    bot.loop.create_task(spontaneous_thoughts_loop())
+    spawn_background(spontaneous_thoughts_loop())
 
 async def spontaneous_thoughts_loop():
     """Occasionally share random thoughts or observations"""
     await bot.wait_until_ready()
     
+    # Wait 30-90 minutes between spontaneous thoughts, but tick every 30s so
+    # shutdown isn't held up by one long sleep
+    next_thought_at = time.monotonic() + random.uniform(1800, 5400)
+    
     while not bot.is_closed():
         try:
-            # Wait 30-90 minutes between spontaneous thoughts
-            wait_time = random.uniform(1800, 5400)
-            await asyncio.sleep(wait_time)
+            await asyncio.sleep(30)
+            if time.monotonic() < next_thought_at:
+                continue
+            next_thought_at = time.monotonic() + random.uniform(1800, 5400)
             
             # Only if Nova has been active recently
-            if nova_state.get("last_active"):
-                time_since_active = (datetime.now() - nova_state["last_active"]).total_seconds()
+            if nova_state.get("last_active_mono"):
+                time_since_active = time.monotonic() - nova_state["last_active_mono"]
                 
                 # Don't interrupt if conversation is active (< 5 minutes ago)
                 if time_since_active > 300 and time_since_active < 7200:  # 5 min - 2 hours
@@ -259,20 +700,20 @@ Keep it SHORT (1 sentence), casual, and natural. No greetings."""
                                     pass
         except Exception as e:
             print(f"Error in spontaneous thoughts: {e}")
-            await asyncio.sleep(3600)  # Wait an hour on error
+            next_thought_at = time.monotonic() + 3600  # Wait an hour on error
 
 @bot.event
 async def on_message(message):
     """Handle incoming messages"""
     # Create unique identifier for this message
     message_hash = f"{message.author.id}:{message.content[:100]}:{message.channel.id}"
-    current_time = datetime.now().timestamp()
+    current_time = time.monotonic()
     
     # Check if we've seen this exact message recently (within 2 seconds)
     if message_hash in recent_message_times:
         time_diff = current_time - recent_message_times[message_hash]
         if time_diff < 2.0:  # Same message within 2 seconds = duplicate
-            print(f"⚠️ Duplicate message detected (within {time_diff:.2f}s), skipping: {message.content[:30]}")
+            log.debug("Duplicate message detected (within %.2fs), skipping: %s", time_diff, message.content[:30])
             return
     
     # Update the time for this message hash
@@ -285,11 +726,11 @@ async def on_message(message):
     
     # Also check message ID
     if message.id in processed_messages:
-        print(f"⚠️ Already processed message ID {message.id}, skipping")
+        log.debug("Already processed message ID %s, skipping", message.id)
         return
     
     processed_messages.add(message.id)
-    print(f"📩 Message from {message.author}: {message.content[:50]}")
+    log.debug("Message from %s: %s", message.author, message.content[:50])
     
     # Clean up old message IDs (keep only last 100)
     if len(processed_messages) > 100:
@@ -300,12 +741,12 @@ async def on_message(message):
     
     # Ignore own messages
     if message.author == bot.user:
-        print(f"⏭️ Ignoring own message")
+        log.debug("Ignoring own message")
         return
     
     # Update Nova's state
     nova_state["message_count"] += 1
-    nova_state["last_active"] = datetime.now()
+    nova_state["last_active_mono"] = current_time
     
     # Randomly add emoji reactions to messages (like a human would)
     if random.random() < 0.15:  # 15% chance
@@ -316,133 +757,132 @@ async def on_message(message):
             pass
     
     # Process commands first (for control commands like !nova_on, !nova_off, !clear, etc.)
+    # Only messages with the prefix can be commands, so skip building a Context otherwise
     if message.content.startswith('!'):
-        print(f"🔧 Detected command: {message.content}")
-        print(f"🔍 All registered commands: {[cmd.name for cmd in bot.commands]}")
-    
-    ctx = await bot.get_context(message)
-    if ctx.valid:
-        print(f"✅ Valid command found, invoking: {ctx.command}")
-        await bot.invoke(ctx)
-        return
-    else:
-        if message.content.startswith('!'):
-            print(f"❌ Invalid command or command not found")
-            print(f"🔍 Command attempted: '{ctx.invoked_with}', prefix: '{ctx.prefix}'")
-            
-            # Manual command parsing fallback for self-bot
-            parts = message.content[1:].split(maxsplit=1)
-            command_name = parts[0].lower() if parts else ""
-            
-            # Handle built-in help command specially
-            if command_name == 'help':
-                # Redirect to our custom help command
-                await message.channel.send("ℹ️ Use `!aihelp` for command help")
-                return
-            
-            # Check if this matches any registered command or alias
-            for cmd in bot.commands:
-                if command_name == cmd.name or command_name in cmd.aliases:
-                    print(f"🔧 Manual command invocation: {cmd.name}")
-                    
-                    # Skip built-in help - use aihelp instead
-                    if cmd.name == 'help':
-                        await message.channel.send("ℹ️ Use `!aihelp` for command help")
-                        return
-                    
-                    # Manually call the command with arguments
-                    try:
-                        if len(parts) == 1:
-                            # No arguments - call with no parameters (use defaults)
-                            if cmd.name in ['screen', 'screenshot', 'see']:
-                                # screen has default question parameter
-                                await cmd.callback(ctx)
-                            elif cmd.name in ['vscode', 'vsc', 'code']:
-                                # vscode with no action shows status
-                                await cmd.callback(ctx)
-                            elif cmd.name in ['eve', 'eveonline']:
-                                # eve with no action shows help
-                                await cmd.callback(ctx)
-                            elif cmd.name in ['friends', 'friend', 'fr']:
-                                # friends with no action shows list
-                                await cmd.callback(ctx)
-                            elif cmd.name in ['join', 'joinvc', 'joinvoice', 'leave', 'leavevc', 'disconnect', 'voicestatus', 'vcstatus', 'voiceinfo']:
-                                # Voice commands with no arguments
-                                await cmd.callback(ctx)
-                            else:
-                                # Other commands need arguments
-                                await cmd.callback(ctx)
+        log.debug("Detected command: %s", message.content)
+        
+        ctx = await bot.get_context(message)
+        if ctx.valid:
+            log.debug("Valid command found, invoking: %s", ctx.command)
+            await bot.invoke(ctx)
+            return
+        
+        log.debug("Command not found: '%s', prefix: '%s'", ctx.invoked_with, ctx.prefix)
+        
+        # Manual command parsing fallback for self-bot
+        parts = message.content[1:].split(maxsplit=1)
+        command_name = parts[0].lower() if parts else ""
+        
+        # Handle built-in help command specially
+        if command_name == 'help':
+            # Redirect to our custom help command
+            await message.channel.send("ℹ️ Use `!aihelp` for command help")
+            return
+        
+        # Check if this matches any registered command or alias
+        for cmd in bot.commands:
+            if command_name == cmd.name or command_name in cmd.aliases:
+                log.debug("Manual command invocation: %s", cmd.name)
+                
+                # Skip built-in help - use aihelp instead
+                if cmd.name == 'help':
+                    await message.channel.send("ℹ️ Use `!aihelp` for command help")
+                    return
+                
+                # Manually call the command with arguments
+                try:
+                    if len(parts) == 1:
+                        # No arguments - call with no parameters (use defaults)
+                        if cmd.name in ['screen', 'screenshot', 'see']:
+                            # screen has default question parameter
+                            await cmd.callback(ctx)
+                        elif cmd.name in ['vscode', 'vsc', 'code']:
+                            # vscode with no action shows status
+                            await cmd.callback(ctx)
+                        elif cmd.name in ['eve', 'eveonline']:
+                            # eve with no action shows help
+                            await cmd.callback(ctx)
+                        elif cmd.name in ['friends', 'friend', 'fr']:
+                            # friends with no action shows list
+                            await cmd.callback(ctx)
+                        elif cmd.name in ['join', 'joinvc', 'joinvoice', 'leave', 'leavevc', 'disconnect', 'voicestatus', 'vcstatus', 'voiceinfo']:
+                            # Voice commands with no arguments
+                            await cmd.callback(ctx)
                         else:
-                            # Commands with multiple parameters (createfile, eve)
-                            if cmd.name in ['createfile', 'mkfile', 'newfile']:
-                                # !createfile path content
-                                args = parts[1].split(maxsplit=1)
-                                if len(args) == 1:
-                                    await cmd.callback(ctx, filepath=args[0])
-                                else:
-                                    await cmd.callback(ctx, filepath=args[0], content=args[1])
-                            elif cmd.name in ['eve', 'eveonline']:
-                                # !eve action query
-                                args = parts[1].split(maxsplit=1)
-                                if len(args) == 1:
-                                    await cmd.callback(ctx, action=args[0])
-                                else:
-                                    await cmd.callback(ctx, action=args[0], query=args[1])
-                            elif cmd.name in ['nova']:
-                                # !nova mode
-                                await cmd.callback(ctx, mode=parts[1])
-                            elif cmd.name in ['vscode', 'vsc', 'code']:
-                                # !vscode action args
-                                args = parts[1].split(maxsplit=1)
-                                if len(args) == 1:
-                                    await cmd.callback(ctx, action=args[0])
-                                else:
-                                    await cmd.callback(ctx, action=args[0], args=args[1])
-                            elif cmd.name in ['friends', 'friend', 'fr']:
-                                # !friends action target
-                                args = parts[1].split(maxsplit=1)
-                                if len(args) == 1:
-                                    await cmd.callback(ctx, action=args[0])
-                                else:
-                                    await cmd.callback(ctx, action=args[0], target=args[1])
-                            elif cmd.name in ['dm', 'send', 'message']:
-                                # !dm username message
-                                args = parts[1].split(maxsplit=1)
-                                if len(args) == 2:
-                                    await cmd.callback(ctx, username=args[0], message=args[1])
-                                else:
-                                    await ctx.reply("Usage: `!dm <username> <message>`")
-                            elif cmd.name in ['speak', 'say', 'talk']:
-                                # !speak text
-                                await cmd.callback(ctx, text=parts[1])
+                            # Other commands need arguments
+                            await cmd.callback(ctx)
+                    else:
+                        # Commands with multiple parameters (createfile, eve)
+                        if cmd.name in ['createfile', 'mkfile', 'newfile']:
+                            # !createfile path content
+                            args = parts[1].split(maxsplit=1)
+                            if len(args) == 1:
+                                await cmd.callback(ctx, filepath=args[0])
                             else:
-                                # Single keyword parameter commands (chat, web, screen, analyze, video, codegen)
-                                param_name = 'question' if cmd.name in ['chat', 'ask', 'c', 'screen', 'screenshot', 'see'] else 'query'
-                                await cmd.callback(ctx, **{param_name: parts[1]})
-                    except Exception as e:
-                        print(f"❌ Error invoking command manually: {e}")
-                        import traceback
-                        traceback.print_exc()
-                    return
+                                await cmd.callback(ctx, filepath=args[0], content=args[1])
+                        elif cmd.name in ['eve', 'eveonline']:
+                            # !eve action query
+                            args = parts[1].split(maxsplit=1)
+                            if len(args) == 1:
+                                await cmd.callback(ctx, action=args[0])
+                            else:
+                                await cmd.callback(ctx, action=args[0], query=args[1])
+                        elif cmd.name in ['nova']:
+                            # !nova mode
+                            await cmd.callback(ctx, mode=parts[1])
+                        elif cmd.name in ['vscode', 'vsc', 'code']:
+                            # !vscode action args
+                            args = parts[1].split(maxsplit=1)
+                            if len(args) == 1:
+                                await cmd.callback(ctx, action=args[0])
+                            else:
+                                await cmd.callback(ctx, action=args[0], args=args[1])
+                        elif cmd.name in ['friends', 'friend', 'fr']:
+                            # !friends action target
+                            args = parts[1].split(maxsplit=1)
+                            if len(args) == 1:
+                                await cmd.callback(ctx, action=args[0])
+                            else:
+                                await cmd.callback(ctx, action=args[0], target=args[1])
+                        elif cmd.name in ['dm', 'send', 'message']:
+                            # !dm username message
+                            args = parts[1].split(maxsplit=1)
+                            if len(args) == 2:
+                                await cmd.callback(ctx, username=args[0], message=args[1])
+                            else:
+                                await ctx.reply("Usage: `!dm <username> <message>`")
+                        elif cmd.name in ['speak', 'say', 'talk']:
+                            # !speak text
+                            await cmd.callback(ctx, text=parts[1])
+                        else:
+                            # Single keyword parameter commands (chat, web, screen, analyze, video, codegen)
+                            param_name = 'question' if cmd.name in ['chat', 'ask', 'c', 'screen', 'screenshot', 'see'] else 'query'
+                            await cmd.callback(ctx, **{param_name: parts[1]})
+                except Exception as e:
+                    print(f"❌ Error invoking command manually: {e}")
+                    import traceback
+                    traceback.print_exc()
+                return
     
     # Get channel mode
     channel_id = message.channel.id
     mode = channel_modes.get(channel_id, default_mode)
+    is_dm = isinstance(message.channel, discord.DMChannel)
     
-    print(f"🎛️ Channel mode: {mode}")
+    log.debug("Channel mode: %s", mode)
     
     should_respond = False
     reason = "No trigger"  # Default reason
     
     # ALWAYS respond to DMs if auto_respond is enabled (Neuro-Sama style)
-    if isinstance(message.channel, discord.DMChannel) and nova_config.get("auto_respond_dms", True):
+    if is_dm and nova_config.get("auto_respond_dms", True):
         should_respond = True
         reason = "DM (auto-respond)"
-        print("💬 Auto-responding to DM")
+        log.debug("Auto-responding to DM")
     
     # Mode: OFF - never respond (unless DM)
     elif mode == "off":
-        print("🔇 Nova is OFF in this channel")
+        log.debug("Nova is OFF in this channel")
         return
     
     # Mode: ALWAYS - respond to everything
@@ -452,7 +892,7 @@ async def on_message(message):
     
     # Mode: MENTION - only when mentioned or DM
     elif mode == "mention":
-        if isinstance(message.channel, discord.DMChannel):
+        if is_dm:
             should_respond = True
             reason = "DM"
         elif bot.user.mentioned_in(message) and not message.mention_everyone:
@@ -469,7 +909,7 @@ async def on_message(message):
     # Mode: SMART - AI decides based on context
     elif mode == "smart":
         # Always respond to DMs
-        if isinstance(message.channel, discord.DMChannel):
+        if is_dm:
             should_respond = True
             reason = "DM"
         # Always respond to @ mentions, replies, or name mentions
@@ -485,15 +925,15 @@ async def on_message(message):
                 reason = "Reply"
         # Check if Nova was recently active in this channel (within last 5 messages)
         else:
+            # Newest-first; only the last 3 messages are needed for both the
+            # continuation check and the AI decision context
             recent_messages = []
             nova_last_message_position = None
-            idx = 0
             try:
-                async for msg in message.channel.history(limit=6):
+                async for msg in message.channel.history(limit=3):
                     if msg.author == bot.user and nova_last_message_position is None:
-                        nova_last_message_position = idx
+                        nova_last_message_position = len(recent_messages)
                     recent_messages.append(f"{msg.author.name}: {msg.content[:100]}")
-                    idx += 1
             except:
                 pass
             
@@ -516,7 +956,7 @@ async def on_message(message):
                 reason = "Relevant keywords detected"
             # Otherwise, use AI to decide (but be more lenient)
             else:
-                context = "\n".join(reversed(recent_messages[-3:]))
+                context = "\n".join(recent_messages[::-1])
                 
                 decision_prompt = f"""Recent chat:
 {context}
@@ -535,20 +975,17 @@ Be social - say YES if it seems interesting or worth responding to."""
                     reason = "Default (error)"
     
     if should_respond:
-        print(f"✅ Responding: {reason}")
+        log.debug("Responding: %s", reason)
         
         # Clean up the message (remove bot mentions but keep others)
-        content = message.content.replace(f'<@{bot.user.id}>', '').replace(f'<@!{bot.user.id}>', '').strip()
+        content = get_self_mention_re().sub('', message.content).strip()
         
-        # Track mentioned users for AI context
-        mentioned_users = []
-        for user in message.mentions:
-            if user.id != bot.user.id:
-                mentioned_users.append(user.name)
+        # Track mentioned users for AI context (deduplicated, stable order)
+        mentioned_users = {user.name for user in message.mentions if user.id != bot.user.id}
         
         # Add context about who's speaking and who's mentioned
-        if not isinstance(message.channel, discord.DMChannel):
-            mention_context = f" (mentioning {', '.join(mentioned_users)})" if mentioned_users else ""
+        if not is_dm:
+            mention_context = f" (mentioning {', '.join(sorted(mentioned_users))})" if mentioned_users else ""
             content = f"{message.author.name}{mention_context} said: {content}"
         
         # Extract text files from attachments
@@ -556,7 +993,7 @@ Be social - say YES if it seems interesting or worth responding to."""
         if message.attachments:
             for attachment in message.attachments:
                 # Check for text file extensions
-                if any(attachment.filename.lower().endswith(ext) for ext in ['.txt', '.md', '.py', '.js', '.json', '.yaml', '.yml', '.xml', '.csv', '.log', '.conf', '.cfg', '.ini']):
+                if attachment.filename.lower().endswith(TEXT_FILE_EXTS):
                     try:
                         import aiohttp
                         async with aiohttp.ClientSession() as session:
@@ -576,7 +1013,7 @@ Be social - say YES if it seems interesting or worth responding to."""
         image_base64 = None
         if message.attachments:
             for attachment in message.attachments:
-                if any(attachment.filename.lower().endswith(ext) for ext in ['.png', '.jpg', '.jpeg', '.gif', '.webp']):
+                if attachment.filename.lower().endswith(IMAGE_FILE_EXTS):
                     try:
                         import aiohttp
                         import base64
@@ -633,8 +1070,7 @@ async def screen_command(ctx, *, question: str = "What do you see on my screen?"
     
     Usage: !screen (shows disabled message)
     """
-    from vps_disabled_commands import get_disabled_message
-    await ctx.reply(get_disabled_message())
+    await ctx.reply(VPS_DISABLED_MESSAGE)
 
 @bot.command(name='web', aliases=['browse', 'search'])
 async def web_command(ctx, *, query: str = ""):
@@ -642,8 +1078,7 @@ async def web_command(ctx, *, query: str = ""):
     
     Usage: !web (shows disabled message)
     """
-    from vps_disabled_commands import get_disabled_message
-    await ctx.reply(get_disabled_message())
+    await ctx.reply(VPS_DISABLED_MESSAGE)
 
 @bot.command(name='links', aliases=['getlinks', 'pagelinks'])
 async def links_command(ctx, limit: int = 20):
@@ -651,8 +1086,7 @@ async def links_command(ctx, limit: int = 20):
     
     Usage: !links (shows disabled message)
     """
-    from vps_disabled_commands import get_disabled_message
-    await ctx.reply(get_disabled_message())
+    await ctx.reply(VPS_DISABLED_MESSAGE)
 
 @bot.command(name='pageinfo', aliases=['browserinfo', 'webinfo'])
 async def pageinfo_command(ctx):
@@ -660,8 +1094,7 @@ async def pageinfo_command(ctx):
     
     Usage: !pageinfo (shows disabled message)
     """
-    from vps_disabled_commands import get_disabled_message
-    await ctx.reply(get_disabled_message())
+    await ctx.reply(VPS_DISABLED_MESSAGE)
 
 @bot.command(name='extract', aliases=['pagedata', 'content'])
 async def extract_command(ctx):
@@ -669,8 +1102,7 @@ async def extract_command(ctx):
     
     Usage: !extract (shows disabled message)
     """
-    from vps_disabled_commands import get_disabled_message
-    await ctx.reply(get_disabled_message())
+    await ctx.reply(VPS_DISABLED_MESSAGE)
 
 @bot.command(name='browsercontext', aliases=['bc', 'seebrowser'])
 async def browsercontext_command(ctx):
@@ -678,8 +1110,7 @@ async def browsercontext_command(ctx):
     
     Usage: !browsercontext (shows disabled message)
     """
-    from vps_disabled_commands import get_disabled_message
-    await ctx.reply(get_disabled_message())
+    await ctx.reply(VPS_DISABLED_MESSAGE)
 
 @bot.command(name='video', aliases=['watch', 'analyzevideo'])
 async def video_command(ctx, *, query: str = ""):
@@ -687,8 +1118,7 @@ async def video_command(ctx, *, query: str = ""):
     
     Usage: !video (shows disabled message)
     """
-    from vps_disabled_commands import get_disabled_message
-    await ctx.reply(get_disabled_message())
+    await ctx.reply(VPS_DISABLED_MESSAGE)
 
 @bot.command(name='analyze')
 async def analyze_command(ctx, *, query: str = ""):
@@ -696,8 +1126,7 @@ async def analyze_command(ctx, *, query: str = ""):
     
     Usage: !analyze (shows disabled message)
     """
-    from vps_disabled_commands import get_disabled_message
-    await ctx.reply(get_disabled_message())
+    await ctx.reply(VPS_DISABLED_MESSAGE)
 
 @bot.command(name='clear', aliases=['reset'])
 async def clear_command(ctx):
@@ -705,20 +1134,20 @@ async def clear_command(ctx):
     
     Usage: !clear
     """
-    print(f"🗑️ Clear command triggered by {ctx.author}")
+    log.debug("Clear command triggered by %s", ctx.author)
     channel_id = str(ctx.channel.id)
     
     # Clear in-memory context
     if channel_id in conversation_contexts:
         del conversation_contexts[channel_id]
-        print(f"   Cleared in-memory context for channel {channel_id}")
+        log.debug("Cleared in-memory context for channel %s", channel_id)
     else:
-        print(f"   No in-memory context found for channel {channel_id}")
+        log.debug("No in-memory context found for channel %s", channel_id)
     
     # Clear database history for this channel
     try:
         await clear_conversation_history(session_id=channel_id)
-        print(f"   Cleared database history for channel {channel_id}")
+        log.debug("Cleared database history for channel %s", channel_id)
     except Exception as e:
         print(f"   Error clearing database: {e}")
     
@@ -734,27 +1163,30 @@ async def memory_command(ctx):
     
     # Get message count from database
     try:
-        total_messages = await get_conversation_count(session_id=channel_id)
-        
-        # Get recent history to show snippet
-        recent = await get_conversation_history(limit=5, session_id=channel_id)
+        # Fetch the count and a recent snippet concurrently
+        total_messages, recent = await asyncio.gather(
+            get_conversation_count(session_id=channel_id),
+            get_conversation_history(limit=5, session_id=channel_id)
+        )
         
-        msg = f"🧠 **Memory Status for This Channel**\n\n"
-        msg += f"📊 Total messages stored: **{total_messages}**\n"
-        msg += f"📝 Currently loading: **50 most recent messages**\n\n"
+        parts = [
+            "🧠 **Memory Status for This Channel**\n\n",
+            f"📊 Total messages stored: **{total_messages}**\n",
+            "📝 Currently loading: **50 most recent messages**\n\n",
+        ]
         
         if recent:
-            msg += "**Recent conversation:**\n"
+            parts.append("**Recent conversation:**\n")
             for m in recent[-3:]:
-                role_emoji = "👤" if m["role"] == "user" else "🤖"
-                preview = m["content"][:60] + ("..." if len(m["content"]) > 60 else "")
-                msg += f"{role_emoji} {preview}\n"
+                text = m["content"]
+                preview = text[:60] + "..." if len(text) > 60 else text
+                parts.append(f"{ROLE_EMOJI.get(m['role'], '🤖')} {preview}\n")
         else:
-            msg += "*No conversation history yet*\n"
+            parts.append("*No conversation history yet*\n")
         
-        msg += f"\n💡 Use `!clear` to reset memory"
+        parts.append("\n💡 Use `!clear` to reset memory")
         
-        await ctx.reply(msg)
+        await ctx.reply("".join(parts))
     except Exception as e:
         await ctx.reply(f"❌ Error checking memory: {e}")
 
@@ -771,32 +1203,40 @@ async def eve_command(ctx, action: str = None, *, query: str = None):
         await ctx.reply("EVE Online Helper\n**Commands:**\n`!eve search <query>` - Search items\n`!eve ship <name>` - Ship info\n`!eve item <name>` - Item details")
         return
     
+    # Wait for the startup index build in a thread rather than on the event loop
+    await asyncio.to_thread(eve_helper.warm_up)
+    
     if action.lower() == 'search' and query:
         results = eve_helper.search_items(query, limit=5)
         if results:
-            output = f"🔍 **EVE Online Search Results for '{query}':**\n\n"
+            buf = BoundedBuffer()  # Discord limit
+            buf.add(f"🔍 **EVE Online Search Results for '{query}':**\n\n")
             for i, item in enumerate(results, 1):
-                output += f"**{i}. {item['name']}**\n"
-                if item.get('description'):
-                    desc = item['description'][:150]
-                    output += f"   {desc}...\n"
-                output += f"   ID: `{item['id']}` | Volume: `{item.get('volume', 'N/A')}`\n\n"
-            await ctx.reply(output[:2000])  # Discord limit
+                desc = f"   {item['description'][:150]}...\n" if item.get('description') else ""
+                if not buf.add(
+                    f"**{i}. {item['name']}**\n{desc}"
+                    f"   ID: `{item['id']}` | Volume: `{item.get('volume', 'N/A')}`\n\n"
+                ):
+                    break
+            await ctx.reply(buf.text())
         else:
             await ctx.reply(f"No items found matching '{query}'")
     
     elif action.lower() == 'ship' and query:
         ship_info = eve_helper.get_ship_info(query)
         if ship_info:
-            output = f"🚀 **{ship_info['name']}**\n\n"
+            buf = BoundedBuffer()
+            buf.add(f"🚀 **{ship_info['name']}**\n\n")
             if ship_info.get('description'):
-                output += f"{ship_info['description'][:300]}...\n\n"
-            output += f"**Details:**\n"
-            output += f"• ID: `{ship_info['id']}`\n"
-            output += f"• Mass: `{ship_info.get('mass', 'N/A')} kg`\n"
-            output += f"• Volume: `{ship_info.get('volume', 'N/A')} m³`\n"
-            output += f"• Capacity: `{ship_info.get('capacity', 'N/A')} m³`\n"
-            await ctx.reply(output[:2000])
+                buf.add(f"{ship_info['description'][:300]}...\n\n")
+            buf.add(
+                f"**Details:**\n"
+                f"• ID: `{ship_info['id']}`\n"
+                f"• Mass: `{ship_info.get('mass', 'N/A')} kg`\n"
+                f"• Volume: `{ship_info.get('volume', 'N/A')} m³`\n"
+                f"• Capacity: `{ship_info.get('capacity', 'N/A')} m³`\n"
+            )
+            await ctx.reply(buf.text())
         else:
             await ctx.reply(f"Ship '{query}' not found")
     
@@ -806,16 +1246,19 @@ async def eve_command(ctx, action: str = None, *, query: str = None):
             item = results[0]
             item_details = eve_helper.get_item_info(item['id'])
             if item_details:
-                output = f"📦 **{item_details['name']}**\n\n"
+                buf = BoundedBuffer()
+                buf.add(f"📦 **{item_details['name']}**\n\n")
                 if item_details.get('description'):
-                    output += f"{item_details['description'][:400]}...\n\n"
-                output += f"**Details:**\n"
-                output += f"• ID: `{item_details['id']}`\n"
-                output += f"• Mass: `{item_details.get('mass', 'N/A')} kg`\n"
-                output += f"• Volume: `{item_details.get('volume', 'N/A')} m³`\n"
-                output += f"• Capacity: `{item_details.get('capacity', 'N/A')} m³`\n"
-                output += f"• Published: `{item_details.get('published', False)}`\n"
-                await ctx.reply(output[:2000])
+                    buf.add(f"{item_details['description'][:400]}...\n\n")
+                buf.add(
+                    f"**Details:**\n"
+                    f"• ID: `{item_details['id']}`\n"
+                    f"• Mass: `{item_details.get('mass', 'N/A')} kg`\n"
+                    f"• Volume: `{item_details.get('volume', 'N/A')} m³`\n"
+                    f"• Capacity: `{item_details.get('capacity', 'N/A')} m³`\n"
+                    f"• Published: `{item_details.get('published', False)}`\n"
+                )
+                await ctx.reply(buf.text())
         else:
             await ctx.reply(f"Item '{query}' not found")
     else:
@@ -831,8 +1274,8 @@ async def vscode_command(ctx, action: str = None, *, args: str = None):
     !vscode open <file> - Open a file in VS Code
     !vscode active - Get active editor info
     """
-    # Check if VS Code bridge is available
-    available = await vscode_client.is_available()
+    # Check if VS Code bridge is available (always probe fresh for an explicit status check)
+    available = await vscode_client.is_available(max_age=0 if not action or action == 'status' else VSCODE_PROBE_TTL)
     
     if not available and action != 'status':
         await ctx.reply("❌ VS Code bridge is not running!\n\nMake sure the Nova VS Code extension is installed and the bridge server is started.\n\nInstall: Open `h:\\TheAI\\vscode-extension` in VS Code, run `npm install` and `npm run compile`, then press F5.")
@@ -841,7 +1284,7 @@ async def vscode_command(ctx, action: str = None, *, args: str = None):
     if not action or action == 'status':
         if available:
             folders = await vscode_client.get_workspace_folders()
-            folder_list = "\\n".join([f"• {f['name']}: `{f['path']}`" for f in folders]) if folders else "No workspace folders"
+            folder_list = "\\n".join(f"• {f['name']}: `{f['path']}`" for f in folders) if folders else "No workspace folders"
             await ctx.reply(f"✅ **VS Code Bridge Connected**\\n\\n**Workspace Folders:**\\n{folder_list}")
         else:
             await ctx.reply("❌ VS Code bridge is offline")
@@ -894,30 +1337,30 @@ async def friends_command(ctx, action: str = 'list', *, target: str = None):
     action = action.lower()
     
     if action == 'list':
-        friends = [f for f in bot.user.friends]
+        friends = get_relationships('friend')
         if friends:
-            friend_list = "\n".join([f"• {friend.name}#{friend.discriminator}" for friend in friends[:20]])
+            friend_list = "\n".join(f"• {r.user.name}#{r.user.discriminator}" for r in friends[:20])
             await ctx.reply(f"👥 **Friends ({len(friends)})**\n{friend_list}")
         else:
             await ctx.reply("You have no friends yet")
     
     elif action == 'pending':
         # Get pending incoming requests
-        pending = [r for r in bot.user.relationships if r.type.name == 'incoming_request']
-        outgoing = [r for r in bot.user.relationships if r.type.name == 'outgoing_request']
+        pending = get_relationships('incoming_request')
+        outgoing = get_relationships('outgoing_request')
         
         msg = "📬 **Friend Requests**\n\n"
         
         if pending:
             msg += "**Incoming:**\n"
-            msg += "\n".join([f"• {r.user.name}#{r.user.discriminator}" for r in pending[:10]])
+            msg += "\n".join(f"• {r.user.name}#{r.user.discriminator}" for r in pending[:10])
             msg += "\n\n"
         else:
             msg += "**Incoming:** None\n\n"
         
         if outgoing:
             msg += "**Outgoing:**\n"
-            msg += "\n".join([f"• {r.user.name}#{r.user.discriminator}" for r in outgoing[:10]])
+            msg += "\n".join(f"• {r.user.name}#{r.user.discriminator}" for r in outgoing[:10])
         else:
             msg += "**Outgoing:** None"
         
@@ -929,16 +1372,17 @@ async def friends_command(ctx, action: str = 'list', *, target: str = None):
             return
         
         # Find pending request
-        pending = [r for r in bot.user.relationships if r.type.name == 'incoming_request']
+        pending = get_relationships('incoming_request')
         match = None
+        target_lower = target.lower()
         for r in pending:
-            if target.lower() in r.user.name.lower():
+            if target_lower in lc_name(r.user):
                 match = r
                 break
         
         if match:
             try:
-                await match.accept()
+                await rate_limiter.execute(match.accept, bucket="friend-accept")
                 await ctx.reply(f"✅ Accepted friend request from {match.user.name}")
             except Exception as e:
                 await ctx.reply(f"❌ Failed to accept: {e}")
@@ -955,7 +1399,7 @@ async def friends_command(ctx, action: str = 'list', *, target: str = None):
             if '#' in target:
                 username, discriminator = target.rsplit('#', 1)
                 user = await bot.fetch_user_profile(username, discriminator)
-                await user.send_friend_request()
+                await rate_limiter.execute(user.send_friend_request, bucket="friend-add")
                 await ctx.reply(f"✅ Sent friend request to {target}")
             else:
                 await ctx.reply("Please use format: username#1234")
@@ -967,11 +1411,11 @@ async def friends_command(ctx, action: str = 'list', *, target: str = None):
             await ctx.reply("Please specify a friend to remove")
             return
         
-        friends = [f for f in bot.user.friends if target.lower() in f.name.lower()]
-        if friends:
+        friend = find_friend(target)
+        if friend:
             try:
-                await friends[0].remove_friend()
-                await ctx.reply(f"✅ Removed {friends[0].name} from friends")
+                await friend.remove_friend()
+                await ctx.reply(f"✅ Removed {friend.name} from friends")
             except Exception as e:
                 await ctx.reply(f"❌ Failed to remove: {e}")
         else:
@@ -983,8 +1427,10 @@ async def friends_command(ctx, action: str = 'list', *, target: str = None):
             return
         
         try:
-            # Try to find user
-            user = discord.utils.find(lambda u: target.lower() in u.name.lower(), bot.get_all_members())
+            # Try to find user by name, then by user ID
+            user = find_member(target)
+            if user is None and target.isdigit():
+                user = bot.get_user(int(target)) or await bot.fetch_user(int(target))
             if user:
                 await user.block()
                 await ctx.reply(f"🚫 Blocked {user.name}")
@@ -998,10 +1444,11 @@ async def friends_command(ctx, action: str = 'list', *, target: str = None):
             await ctx.reply("Please specify a user to unblock")
             return
         
-        blocked = [r for r in bot.user.relationships if r.type.name == 'blocked']
+        target_lower = target.lower()
+        blocked = get_relationships('blocked')
         match = None
         for r in blocked:
-            if target.lower() in r.user.name.lower():
+            if target_lower in lc_name(r.user):
                 match = r
                 break
         
@@ -1029,21 +1476,11 @@ async def dm_command(ctx, username: str = None, *, message: str = None):
         return
     
     try:
-        # Try to find the user in friends or mutual servers
-        user = None
-        
-        # Check friends first
-        for friend in bot.user.friends:
-            if username.lower() in friend.name.lower():
-                user = friend
-                break
-        
-        # Check all members in mutual servers
-        if not user:
-            user = discord.utils.find(lambda u: username.lower() in u.name.lower(), bot.get_all_members())
+        # Try to find the user in friends first, then mutual servers
+        user = find_friend(username) or find_member(username)
         
         if user:
-            await user.send(message)
+            await rate_limiter.execute(lambda: user.send(message), bucket="dm")
             await ctx.reply(f"✅ Sent DM to {user.name}")
         else:
             await ctx.reply(f"❌ User '{username}' not found. Make sure you're friends or in a mutual server.")
@@ -1090,11 +1527,8 @@ async def leave_voice_command(ctx):
     Usage: !leave
     """
     # Find which channel the bot is in
-    found_channel = None
-    for vc in bot.voice_clients:
-        if vc.guild == ctx.guild:
-            found_channel = vc.channel.id
-            break
+    vc = guild_voice_client(ctx.guild)
+    found_channel = vc.channel.id if vc else None
     
     if not found_channel:
         await ctx.reply("❌ Not in a voice channel")
@@ -1122,17 +1556,17 @@ async def speak_command(ctx, *, text: str = None):
         return
     
     # Find which channel the bot is in
-    found_channel = None
-    for vc in bot.voice_clients:
-        if vc.guild == ctx.guild:
-            found_channel = vc.channel.id
-            break
+    vc = guild_voice_client(ctx.guild)
+    found_channel = vc.channel.id if vc else None
     
     if not found_channel:
         await ctx.reply("❌ Not in a voice channel! Use `!join` first")
         return
     
-    await ctx.reply(f"🗣️ Speaking: *{text[:100]}{'...' if len(text) > 100 else ''}*")
+    await rate_limiter.execute(
+        lambda: ctx.reply(f"🗣️ Speaking: *{text[:100]}{'...' if len(text) > 100 else ''}*"),
+        bucket="speak"
+    )
     
     success, error = await voice_client.speak_in_channel(found_channel, text)
     
@@ -1153,13 +1587,10 @@ async def voice_status_command(ctx):
     status += f"**Discord Voice:** {'✅' if hasattr(discord, 'FFmpegPCMAudio') else '❌ Limited in discord.py-self'}\n\n"
     
     # Check current voice connections
-    connected = []
-    for vc in bot.voice_clients:
-        if vc.guild == ctx.guild:
-            connected.append(f"• {vc.channel.name}")
+    vc = guild_voice_client(ctx.guild)
     
-    if connected:
-        status += "**Connected To:**\n" + "\n".join(connected)
+    if vc:
+        status += f"**Connected To:**\n• {vc.channel.name}"
     else:
         status += "**Connected To:** None"
     
@@ -1178,19 +1609,13 @@ async def listen_command(ctx):
         return
     
     # Find which channel the bot is in
-    found_vc = None
-    found_channel_id = None
-    for vc in bot.voice_clients:
-        if vc.guild == ctx.guild:
-            found_vc = vc
-            found_channel_id = vc.channel.id
-            break
+    found_vc = guild_voice_client(ctx.guild)
     
     if not found_vc:
         await ctx.reply("❌ Not in a voice channel! Use `!join` first")
         return
     
-    success, error = await voice_client.start_listening(found_channel_id)
+    success, error = await voice_client.start_listening(found_vc.channel.id)
     
     if error:
         await ctx.reply(f"❌ {error}")
@@ -1218,26 +1643,23 @@ async def learn_command(ctx, action: str = None, *, content: str = None):
     
     if not action or action == 'show':
         # Show user profile
-        summary = learning_system.get_stats_summary(user_id)
+        parts = [learning_system.get_stats_summary(user_id)]
         
         # Add some facts
         facts = learning_system.get_facts(user_id)
         if facts:
-            summary += "\n**Recent Facts:**\n"
-            for fact in facts[-10:]:
-                summary += f"• {fact}\n"
+            parts.append("\n**Recent Facts:**\n")
+            parts.extend(f"• {fact}\n" for fact in facts[-10:])
         else:
-            summary += "\n*No facts learned yet*\n"
+            parts.append("\n*No facts learned yet*\n")
         
         # Add topics
         topics = learning_system.get_top_topics(user_id, limit=10)
         if topics:
-            summary += "\n**Topics You Talk About:**\n"
-            for topic, weight in topics:
-                bars = "█" * min(10, int(weight))
-                summary += f"• {topic} {bars}\n"
+            parts.append("\n**Topics You Talk About:**\n")
+            parts.extend(f"• {topic} {WEIGHT_BARS[max(0, min(10, int(weight)))]}\n" for topic, weight in topics)
         
-        await ctx.reply(summary[:2000])
+        await ctx.reply("".join(parts)[:2000])
     
     elif action == 'tell':
         if not content:
@@ -1253,16 +1675,17 @@ async def learn_command(ctx, action: str = None, *, content: str = None):
     elif action == 'topics':
         topics = learning_system.get_top_topics(user_id, limit=20)
         if topics:
-            msg = "📚 **Your Topics of Interest:**\n\n"
-            for i, (topic, weight) in enumerate(topics, 1):
-                bars = "█" * min(10, int(weight))
-                msg += f"{i}. **{topic}** {bars} ({weight:.1f})\n"
-            await ctx.reply(msg)
+            lines = [
+                f"{i}. **{topic}** {WEIGHT_BARS[max(0, min(10, int(weight)))]} ({weight:.1f})"
+                for i, (topic, weight) in enumerate(topics, 1)
+            ]
+            await ctx.reply("📚 **Your Topics of Interest:**\n\n" + "\n".join(lines) + "\n")
         else:
             await ctx.reply("No topics tracked yet. Chat with me more!")
     
     elif action == 'forget':
-        learning_system.forget_user(user_id)
+        # Deletes the user's file, possibly after waiting out a flush in progress
+        await asyncio.to_thread(learning_system.forget_user, user_id)
         await ctx.reply("🧹 I've forgotten everything about you. Fresh start!")
     
     elif action == 'disable':
@@ -1276,58 +1699,58 @@ async def learn_command(ctx, action: str = None, *, content: str = None):
     else:
         await ctx.reply("Invalid action. Use: show, tell, topics, forget, disable, enable")
 
-@bot.command(name='profile', aliases=['whoami', 'me'])
-async def profile_command(ctx):
-    """Show your full learning profile
-    
-    Usage: !profile
-    """
-    user_id = ctx.author.id
-    
-    embed = discord.Embed(
-        title=f"📋 Profile: {ctx.author.name}",
-        color=discord.Color.blue()
-    )
+def build_profile_fields(user_id: int) -> list:
+    """Format the !profile embed fields as (name, value, inline) tuples"""
+    fields = []
     
     # Stats
     stats = learning_system.interaction_stats.get(user_id, {})
     if stats:
-        embed.add_field(
-            name="📊 Stats",
-            value=f"**Messages:** {stats.get('total_messages', 0)}\n**First Met:** {stats.get('first_interaction', 'Unknown')[:10] if stats.get('first_interaction') else 'Unknown'}",
-            inline=True
-        )
+        first_met = stats['first_interaction'][:10] if stats.get('first_interaction') else 'Unknown'
+        fields.append(("📊 Stats", f"**Messages:** {stats.get('total_messages', 0)}\n**First Met:** {first_met}", True))
     
     # Facts
     facts = learning_system.get_facts(user_id)
     if facts:
-        facts_str = "\n".join([f"• {f}" for f in facts[-5:]])
-        embed.add_field(
-            name="🧠 Facts I Know",
-            value=facts_str if len(facts_str) < 1024 else facts_str[:1020] + "...",
-            inline=False
-        )
+        facts_str = "\n".join(f"• {f}" for f in facts[-5:])
+        fields.append(("🧠 Facts I Know", facts_str if len(facts_str) < 1024 else facts_str[:1020] + "...", False))
     
     # Topics
     topics = learning_system.get_top_topics(user_id, limit=5)
     if topics:
-        topics_str = ", ".join([f"**{t[0]}** ({t[1]:.1f})" for t in topics])
-        embed.add_field(
-            name="📚 Top Topics",
-            value=topics_str,
-            inline=False
-        )
+        fields.append(("📚 Top Topics", ", ".join(f"**{topic}** ({weight:.1f})" for topic, weight in topics), False))
     
     # Preferences
     prefs = learning_system.preferences.get(user_id, {})
-    if prefs:
-        prefs_str = "\n".join([f"• {k}: {v}" for k, v in prefs.items() if k != 'internal'])
-        if prefs_str:
-            embed.add_field(
-                name="⚙️ Preferences",
-                value=prefs_str[:1024],
-                inline=False
-            )
+    prefs_str = "\n".join(f"• {k}: {v}" for k, v in prefs.items() if k != 'internal')
+    if prefs_str:
+        fields.append(("⚙️ Preferences", prefs_str[:1024], False))
+    
+    return fields
+
+@bot.command(name='profile', aliases=['whoami', 'me'])
+async def profile_command(ctx):
+    """Show your full learning profile
+    
+    Usage: !profile
+    """
+    user_id = ctx.author.id
+    
+    # Reuse the formatted fields until the user's learned data changes
+    version = learning_system.get_data_version(user_id)
+    cached = profile_fields_cache.get(user_id)
+    if cached and cached[0] == version:
+        fields = cached[1]
+    else:
+        fields = build_profile_fields(user_id)
+        profile_fields_cache[user_id] = (version, fields)
+    
+    embed = discord.Embed(
+        title=f"📋 Profile: {ctx.author.name}",
+        color=discord.Color.blue()
+    )
+    for name, value, inline in fields:
+        embed.add_field(name=name, value=value, inline=inline)
     
     embed.set_footer(text="Use !learn to manage what I know about you")
     
@@ -1336,26 +1759,32 @@ async def profile_command(ctx):
 @bot.command(name='accept_all', aliases=['acceptall'])
 async def accept_all_command(ctx):
     """Accept all pending friend requests"""
-    pending = [r for r in bot.user.relationships if r.type.name == 'incoming_request']
+    # Copy, since accepting fires relationship events that rebuild the index
+    pending = list(get_relationships('incoming_request'))
     
     if not pending:
         await ctx.reply("No pending friend requests")
         return
     
-    accepted = 0
-    failed = 0
+    await send_queue.send(ctx.channel.id, functools.partial(ctx.reply, f"Accepting {len(pending)} friend requests..."))
     
-    await ctx.reply(f"Accepting {len(pending)} friend requests...")
+    # Accept a few at a time; the rate limiter backs the whole bucket off on 429s
+    semaphore = asyncio.Semaphore(5)
     
-    for request in pending:
-        try:
-            await request.accept()
-            accepted += 1
-            await asyncio.sleep(1)  # Rate limit protection
-        except:
-            failed += 1
+    async def accept(request) -> bool:
+        async with semaphore:
+            try:
+                await rate_limiter.execute(request.accept, bucket="friend-accept")
+                return True
+            except Exception:
+                return False
+    
+    results = await asyncio.gather(*(accept(request) for request in pending))
+    accepted = sum(results)
+    failed = len(results) - accepted
     
-    await ctx.reply(f"✅ Accepted {accepted} requests" + (f" ({failed} failed)" if failed > 0 else ""))
+    summary = f"✅ Accepted {accepted} requests" + (f" ({failed} failed)" if failed > 0 else "")
+    await send_queue.send(ctx.channel.id, functools.partial(ctx.reply, summary))
 
 @bot.command(name='createfile', aliases=['mkfile', 'newfile'])
 async def createfile_command(ctx, filepath: str = None, *, content: str = None):
@@ -1368,7 +1797,7 @@ async def createfile_command(ctx, filepath: str = None, *, content: str = None):
         await ctx.reply("Please provide a filepath! Usage: `!createfile <path> <content>`")
         return
     
-    available = await vscode_client.is_available()
+    available = await vscode_client.is_available(max_age=VSCODE_PROBE_TTL)
     if not available:
         await ctx.reply("❌ VS Code bridge is not running!")
         return
@@ -1381,9 +1810,11 @@ async def createfile_command(ctx, filepath: str = None, *, content: str = None):
     if not content:
         content = "# New file created by Nova\\n"
     
-    success = await vscode_client.write_file(filepath, content, open_file=True)
+    # Reply once the write is acked; opening the editor tab happens in the background
+    success = await vscode_client.write_file(filepath, content, open_file=False)
     
     if success:
+        spawn_background(vscode_client.open_file(filepath))
         await ctx.reply(f"✅ Created and opened `{filepath}` in VS Code!")
     else:
         await ctx.reply(f"❌ Failed to create file: {filepath}")
@@ -1399,7 +1830,7 @@ async def codegen_command(ctx, filepath: str = None, *, description: str = None)
         await ctx.reply("Usage: `!codegen <filepath> <description of what to create>`")
         return
     
-    available = await vscode_client.is_available()
+    available = await vscode_client.is_available(max_age=VSCODE_PROBE_TTL)
     if not available:
         await ctx.reply("❌ VS Code bridge is not running!")
         return
@@ -1410,20 +1841,8 @@ async def codegen_command(ctx, filepath: str = None, *, description: str = None)
     
     async with ctx.typing():
         # Determine language from file extension
-        extension = filepath.split('.')[-1] if '.' in filepath else 'txt'
-        lang_map = {
-            'py': 'python',
-            'js': 'javascript',
-            'ts': 'typescript',
-            'html': 'html',
-            'css': 'css',
-            'java': 'java',
-            'cpp': 'c++',
-            'c': 'c',
-            'rs': 'rust',
-            'go': 'go'
-        }
-        language = lang_map.get(extension, extension)
+        extension = os.path.splitext(filepath)[1].lstrip('.').lower()
+        language = CODEGEN_LANG_MAP.get(extension, extension or 'txt')
         
         # Generate code using AI
         prompt = f"""Generate complete, working {language} code for the following:
@@ -1441,26 +1860,30 @@ Output ONLY the code, no explanations before or after."""
         code = await ollama_client.chat(prompt)
         
         # Clean up code (remove markdown code blocks if present)
-        if code.startswith('```'):
-            lines = code.split('\\n')
-            code = '\\n'.join(lines[1:-1]) if len(lines) > 2 else code
+        fenced = CODE_FENCE_RE.match(code.strip())
+        if fenced:
+            code = fenced.group(1)
         
-        # Save to file and open
-        success = await vscode_client.write_file(filepath, code, open_file=True)
+        # Save to file, then open it in the background
+        success = await vscode_client.write_file(filepath, code, open_file=False)
         
         if success:
+            spawn_background(vscode_client.open_file(filepath))
             await ctx.reply(f"✅ Generated code and created `{filepath}` in VS Code!")
         else:
-            await ctx.reply(f"❌ Failed to create file, but here's the generated code:\\n\\n```{language}\\n{code[:1500]}\\n```")
+            await ctx.reply(f"❌ Failed to create file, but here's the generated code:\n\n```{language}\n{code[:1500]}\n```")
 
 @bot.command(name='status', aliases=['health'])
+@suppress_if_off
 async def status_command(ctx):
     """Check bot and AI model status
     
     Usage: !status
     """
-    ollama_status = await ollama_client.is_available()
-    vscode_status = await vscode_client.is_available()
+    ollama_status, vscode_status = await asyncio.gather(
+        ollama_client.is_available(max_age=STATUS_PROBE_TTL),
+        vscode_client.is_available(max_age=VSCODE_PROBE_TTL)
+    )
     
     embed = discord.Embed(
         title="🤖 Bot Status",
@@ -1477,16 +1900,8 @@ async def status_command(ctx):
         value="✅ Connected" if vscode_status else "❌ Offline",
         inline=True
     )
-    embed.add_field(
-        name="Model",
-        value=settings.ollama_model,
-        inline=True
-    )
-    embed.add_field(
-        name="Deployment",
-        value="🌐 VPS Mode",
-        inline=True
-    )
+    for name, value in STATUS_STATIC_FIELDS:
+        embed.add_field(name=name, value=value, inline=True)
     embed.add_field(
         name="Servers",
         value=len(bot.guilds),
@@ -1497,19 +1912,12 @@ async def status_command(ctx):
     
     await ctx.reply(embed=embed)
 
-@bot.command(name='aihelp')  # Renamed to avoid conflict with built-in help
-async def help_command(ctx):
-    """Show all available commands
-    
-    Usage: !help
-    """
-    print(f"🔧 aihelp command called by {ctx.author}")
-    
-    current_mode = channel_modes.get(ctx.channel.id, default_mode)
-    
+@functools.lru_cache(maxsize=8)
+def build_help_embed(mode: str) -> discord.Embed:
+    """Build the !aihelp embed once per channel mode (only the description varies)"""
     embed = discord.Embed(
         title="🤖 Nova - Local AI Assistant",
-        description=f"Current mode in this channel: **{current_mode.upper()}**",
+        description=f"Current mode in this channel: **{mode.upper()}**",
         color=discord.Color.blue()
     )
     
@@ -1614,7 +2022,141 @@ async def help_command(ctx):
     
     embed.set_footer(text="Nova is powered by Ollama (llama3.2-vision) running locally")
     
-    await ctx.reply(embed=embed)
+    return embed
+
+@bot.command(name='aihelp')  # Renamed to avoid conflict with built-in help
+@suppress_if_off
+async def help_command(ctx):
+    """Show all available commands
+    
+    Usage: !help
+    """
+    log.debug("aihelp command called by %s", ctx.author)
+    
+    current_mode = channel_modes.get(ctx.channel.id, default_mode)
+    await ctx.reply(embed=build_help_embed(current_mode))
+
+def on_off(flag) -> str:
+    """Format a setting flag for replies"""
+    return "ON" if flag else "OFF"
+
+async def nova_personality(ctx, channel_id, value):
+    """!nova personality [type]"""
+    if not value:
+        current = nova_config.get("personality_mode", "chaotic")
+        await ctx.reply(
+            f"Current: **{current}**\n\n"
+            f"**Personalities:**\n"
+            f"• chaotic - unpredictable, sarcastic, no filter\n"
+            f"• neuro - Neuro-sama vibes, bratty AI\n"
+            f"• friendly - chill and helpful\n"
+            f"• professional - focused and clear\n"
+            f"• flirty - playful and teasing\n\n"
+            f"Use: `!nova personality <type>`"
+        )
+        return
+    
+    valid = ["chaotic", "neuro", "friendly", "professional", "flirty"]
+    if value.lower() in valid:
+        nova_config["personality_mode"] = value.lower()
+        from chat_handler import nova_config as ch_config
+        ch_config["personality_mode"] = value.lower()
+        await ctx.reply(f"✅ Personality → **{value.lower()}**")
+    else:
+        await ctx.reply(f"❌ Invalid. Options: {', '.join(valid)}")
+
+async def nova_mood(ctx, channel_id, value):
+    """!nova mood [mood]"""
+    if not value:
+        current = nova_state.get("mood", "playful")
+        await ctx.reply(
+            f"Current: **{current}**\n\n"
+            f"**Moods:**\n"
+            f"playful • happy • curious • thoughtful • neutral\n"
+            f"sexual • explicit • sarcastic • tired\n\n"
+            f"Use: `!nova mood <mood>`"
+        )
+        return
+    
+    valid = ["neutral", "happy", "curious", "thoughtful", "playful", "sexual", "explicit", "sarcastic", "tired"]
+    if value.lower() in valid:
+        nova_state["mood"] = value.lower()
+        from chat_handler import nova_config as ch_config
+        ch_config["mood"] = value.lower()
+        await ctx.reply(f"✅ Mood → **{value.lower()}** - {MOOD_REACTIONS.get(value.lower(), 'k')}")
+    else:
+        await ctx.reply(f"❌ Invalid. Options: {', '.join(valid)}")
+
+@suppress_if_off
+async def nova_status(ctx, channel_id, value):
+    """!nova status"""
+    current = channel_modes.get(channel_id, default_mode)
+    current_mood = nova_state.get("mood", "playful")
+    current_personality = nova_config.get("personality_mode", "chaotic")
+    msgs = nova_state.get("message_count", 0)
+    auto_friends = on_off(nova_config.get("auto_accept_friends"))
+    auto_dms = on_off(nova_config.get("auto_respond_dms"))
+    
+    await ctx.reply(
+        f"📊 **Nova Status**\n"
+        f"Mode: **{current.upper()}**\n"
+        f"Personality: **{current_personality}**\n"
+        f"Mood: **{current_mood}**\n"
+        f"Messages seen: {msgs}\n\n"
+        f"**Autonomous Features:**\n"
+        f"Auto-accept friends: {auto_friends}\n"
+        f"Auto-respond DMs: {auto_dms}"
+    )
+
+async def nova_thoughts(ctx, channel_id, value):
+    """!nova thoughts - show the thinking aloud setting"""
+    current = nova_state["thinking_aloud"].get(channel_id, False)
+    await ctx.reply(f"Thinking aloud: **{on_off(current)}**\nUse `!nova thoughts on` or `!nova thoughts off`")
+
+async def nova_auto(ctx, channel_id, value):
+    """!nova auto - show autonomous settings"""
+    auto_friends = on_off(nova_config.get("auto_accept_friends"))
+    auto_dms = on_off(nova_config.get("auto_respond_dms"))
+    await ctx.reply(
+        f"🤖 **Autonomous Settings**\n"
+        f"Auto-accept friends: {auto_friends}\n"
+        f"Auto-respond DMs: {auto_dms}\n\n"
+        f"Use: `!nova autofriends on/off` or `!nova autodms on/off`"
+    )
+
+async def nova_autofriends(ctx, channel_id, value):
+    """!nova autofriends - toggle auto-accepting friend requests"""
+    enabled = nova_config["auto_accept_friends"] = not nova_config.get("auto_accept_friends", True)
+    await ctx.reply(f"👥 Auto-accept friend requests: **{on_off(enabled)}**")
+
+async def nova_autodms(ctx, channel_id, value):
+    """!nova autodms - toggle auto-responding to DMs"""
+    enabled = nova_config["auto_respond_dms"] = not nova_config.get("auto_respond_dms", True)
+    await ctx.reply(f"💬 Auto-respond to DMs: **{on_off(enabled)}**")
+
+async def nova_thoughts_on(ctx, channel_id, value):
+    """!nova on - enable thinking aloud"""
+    await set_thinking_aloud(channel_id, True)
+    await ctx.reply("💭 **Thinking aloud mode: ON**\nI'll share my thought process before responding!")
+
+async def nova_thoughts_off(ctx, channel_id, value):
+    """!nova off - disable thinking aloud"""
+    await set_thinking_aloud(channel_id, False)
+    await ctx.reply("💭 **Thinking aloud mode: OFF**\nBack to normal responses")
+
+# !nova subcommands: name -> handler(ctx, channel_id, value); anything else is a response mode
+NOVA_SUBCOMMANDS = {
+    "personality": nova_personality,
+    "pers": nova_personality,
+    "mood": nova_mood,
+    "status": nova_status,
+    "thoughts": nova_thoughts,
+    "auto": nova_auto,
+    "autofriends": nova_autofriends,
+    "autodms": nova_autodms,
+    "on": nova_thoughts_on,
+    "off": nova_thoughts_off,
+}
 
 @bot.command(name='nova')
 async def nova_mode(ctx, mode: str = None, value: str = None):
@@ -1646,147 +2188,31 @@ async def nova_mode(ctx, mode: str = None, value: str = None):
     
     mode = mode.lower()
     
-    # Personality changes
-    if mode == "personality" or mode == "pers":
-        if not value:
-            current = nova_config.get("personality_mode", "chaotic")
-            await ctx.reply(
-                f"Current: **{current}**\n\n"
-                f"**Personalities:**\n"
-                f"• chaotic - unpredictable, sarcastic, no filter\n"
-                f"• neuro - Neuro-sama vibes, bratty AI\n"
-                f"• friendly - chill and helpful\n"
-                f"• professional - focused and clear\n"
-                f"• flirty - playful and teasing\n\n"
-                f"Use: `!nova personality <type>`"
-            )
-            return
-        
-        valid = ["chaotic", "neuro", "friendly", "professional", "flirty"]
-        if value.lower() in valid:
-            nova_config["personality_mode"] = value.lower()
-            from chat_handler import nova_config as ch_config
-            ch_config["personality_mode"] = value.lower()
-            await ctx.reply(f"✅ Personality → **{value.lower()}**")
-            return
-        else:
-            await ctx.reply(f"❌ Invalid. Options: {', '.join(valid)}")
-            return
-    
-    # Mood changes
-    if mode == "mood":
-        if not value:
-            current = nova_state.get("mood", "playful")
-            await ctx.reply(
-                f"Current: **{current}**\n\n"
-                f"**Moods:**\n"
-                f"playful • happy • curious • thoughtful • neutral\n"
-                f"sexual • explicit • sarcastic • tired\n\n"
-                f"Use: `!nova mood <mood>`"
-            )
-            return
-        
-        valid = ["neutral", "happy", "curious", "thoughtful", "playful", "sexual", "explicit", "sarcastic", "tired"]
-        if value.lower() in valid:
-            nova_state["mood"] = value.lower()
-            from chat_handler import nova_config as ch_config
-            ch_config["mood"] = value.lower()
-            
-            reactions = {
-                "playful": "lol let's go",
-                "happy": "😊 vibing rn",
-                "curious": "🤔 ooh interesting",
-                "thoughtful": "💭 deep thoughts mode",
-                "neutral": "😌 chillin",
-                "sexual": "😏 oh?",
-                "explicit": "aight no filter mode",
-                "sarcastic": "wow thanks so much /s",
-                "tired": "bruh im so done"
-            }
-            await ctx.reply(f"✅ Mood → **{value.lower()}** - {reactions.get(value.lower(), 'k')}")
-            return
-        else:
-            await ctx.reply(f"❌ Invalid. Options: {', '.join(valid)}")
-            return
-    
-    if mode == "status":
-        current = channel_modes.get(channel_id, default_mode)
-        current_mood = nova_state.get("mood", "playful")
-        current_personality = nova_config.get("personality_mode", "chaotic")
-        msgs = nova_state.get("message_count", 0)
-        auto_friends = "ON" if nova_config.get("auto_accept_friends") else "OFF"
-        auto_dms = "ON" if nova_config.get("auto_respond_dms") else "OFF"
-        
-        status_msg = f"📊 **Nova Status**\n"
-        status_msg += f"Mode: **{current.upper()}**\n"
-        status_msg += f"Personality: **{current_personality}**\n"
-        status_msg += f"Mood: **{current_mood}**\n"
-        status_msg += f"Messages seen: {msgs}\n\n"
-        status_msg += f"**Autonomous Features:**\n"
-        status_msg += f"Auto-accept friends: {auto_friends}\n"
-        status_msg += f"Auto-respond DMs: {auto_dms}"
-        
-        await ctx.reply(status_msg)
-        return
-    
-    # Thinking aloud mode
-    if mode == "thoughts":
-        current = nova_state["thinking_aloud"].get(channel_id, False)
-        await ctx.reply(f"Thinking aloud: **{'ON' if current else 'OFF'}**\nUse `!nova thoughts on` or `!nova thoughts off`")
-        return
-    
-    # Autonomous mode toggles
-    if mode == "auto":
-        auto_friends = "ON" if nova_config.get("auto_accept_friends") else "OFF"
-        auto_dms = "ON" if nova_config.get("auto_respond_dms") else "OFF"
-        await ctx.reply(
-            f"🤖 **Autonomous Settings**\n"
-            f"Auto-accept friends: {auto_friends}\n"
-            f"Auto-respond DMs: {auto_dms}\n\n"
-            f"Use: `!nova autofriends on/off` or `!nova autodms on/off`"
-        )
-        return
-    
-    if mode == "autofriends":
-        nova_config["auto_accept_friends"] = not nova_config.get("auto_accept_friends", True)
-        status = "ON" if nova_config["auto_accept_friends"] else "OFF"
-        await ctx.reply(f"👥 Auto-accept friend requests: **{status}**")
-        return
-    
-    if mode == "autodms":
-        nova_config["auto_respond_dms"] = not nova_config.get("auto_respond_dms", True)
-        status = "ON" if nova_config["auto_respond_dms"] else "OFF"
-        await ctx.reply(f"💬 Auto-respond to DMs: **{status}**")
-        return
-    
-    if mode == "on":
-        nova_state["thinking_aloud"][channel_id] = True
-        await ctx.reply("💭 **Thinking aloud mode: ON**\nI'll share my thought process before responding!")
+    handler = NOVA_SUBCOMMANDS.get(mode)
+    if handler:
+        await handler(ctx, channel_id, value)
         return
     
-    if mode == "off":
-        nova_state["thinking_aloud"][channel_id] = False
-        await ctx.reply("💭 **Thinking aloud mode: OFF**\nBack to normal responses")
-        return
-    
-    if mode not in ["always", "smart", "mention", "off"]:
+    if mode not in RESPONSE_MODES:
         await ctx.reply("Invalid mode! Use: `always`, `smart`, `mention`, `off`, `auto`, `autofriends`, `autodms`, or `mood <mood>`")
         return
     
-    channel_modes[channel_id] = mode
-    
-    descriptions = {
-        "always": "✅ Nova will respond to EVERY message",
-        "smart": "🧠 Nova will decide when to respond based on context",
-        "mention": "👋 Nova will only respond when mentioned or in DMs",
-        "off": "🔇 Nova will not respond at all"
-    }
+    await channel_modes.set(channel_id, mode)
     
-    await ctx.reply(f"Mode changed to **{mode.upper()}**\n{descriptions[mode]}")
+    await ctx.reply(f"Mode changed to **{mode.upper()}**\n{MODE_DESCRIPTIONS[mode]}")
     print(f"🎛️ Channel {channel_id} mode set to: {mode}")
 
+async def set_autonomous_task_enabled(ctx, task_id: str, enabled: bool):
+    """!autonomous enable/disable <task_id>"""
+    task = autonomous_agent.tasks.get(task_id)
+    if task:
+        task.enabled = enabled
+        await ctx.reply(f"✅ Enabled task: **{task.name}**" if enabled else f"❌ Disabled task: **{task.name}**")
+    else:
+        await ctx.reply(f"❌ Unknown task: `{task_id}`\nUse `!autonomous tasks` to see all tasks")
+
 @bot.command(name='autonomous', aliases=['auto', 'agent'])
-async def autonomous_command(ctx, action: str = None, capability: str = None):
+async def autonomous_command(ctx, action: str = None, *, goal: str = None):
     """Control Nova's autonomous agent - she acts on her own!
     
     Usage:
@@ -1810,39 +2236,44 @@ async def autonomous_command(ctx, action: str = None, capability: str = None):
         return
     
     action = action.lower()
+    # The tail is kept verbatim for goal text; the other actions take its words
+    args = goal.split() if goal else []
+    capability = args[0] if args else None
     
     if action == "status":
-        status = autonomous_agent.get_status()
+        status = autonomous_agent.get_status(max_age=AUTONOMOUS_STATUS_TTL)
         recent_actions = status.get('recent_actions', [])[-5:]
         
-        status_msg = "🤖 **Autonomous Agent Status**\n\n"
-        status_msg += f"Running: {'✅ YES' if status['running'] else '❌ NO'}\n"
-        status_msg += f"Active Tasks: {status['active_tasks']}/{status['total_tasks']}\n"
-        status_msg += f"Circuit Breaker: {'🔴 OPEN' if status.get('circuit_breaker_open', False) else '🟢 Closed'}\n"
-        status_msg += f"Active Goals: {len(autonomous_agent.goals)}\n"
-        status_msg += f"Self-Optimization: {'✅ Enabled' if autonomous_agent.optimization_enabled else '❌ Disabled'}\n\n"
+        parts = [
+            "🤖 **Autonomous Agent Status**\n\n",
+            f"Running: {'✅ YES' if status['running'] else '❌ NO'}\n",
+            f"Active Tasks: {status['active_tasks']}/{status['total_tasks']}\n",
+            f"Circuit Breaker: {'🔴 OPEN' if status.get('circuit_breaker_open', False) else '🟢 Closed'}\n",
+            f"Active Goals: {len(autonomous_agent.goals)}\n",
+            f"Self-Optimization: {'✅ Enabled' if autonomous_agent.optimization_enabled else '❌ Disabled'}\n\n",
+        ]
         
         if recent_actions:
-            status_msg += "**Recent Actions:**\n"
+            parts.append("**Recent Actions:**\n")
             for action_data in recent_actions:
                 task_name = action_data.get('task', 'Unknown')
                 action_status = action_data.get('status', 'unknown')
                 emoji = '✅' if action_status == 'success' else '❌' if action_status == 'failed' else '🤔'
-                status_msg += f"{emoji} {task_name}\n"
+                parts.append(f"{emoji} {task_name}\n")
         
         if autonomous_agent.goals:
-            status_msg += f"\n**🎯 Top Goal:** {autonomous_agent.goals[0]['description'][:60]}\n"
+            parts.append(f"\n**🎯 Top Goal:** {autonomous_agent.goals[0]['description'][:60]}\n")
         
-        status_msg += f"\nNova is {'autonomously taking actions!' if status['running'] else 'waiting for commands.'}"
+        parts.append(f"\nNova is {'autonomously taking actions!' if status['running'] else 'waiting for commands.'}")
         
-        await ctx.reply(status_msg)
+        await ctx.reply("".join(parts))
         return
     
     if action == "start":
         if autonomous_agent.running:
             await ctx.reply("✅ Autonomous agent is already running!")
         else:
-            asyncio.create_task(autonomous_agent.start())
+            spawn_background(autonomous_agent.start())
             await ctx.reply("🚀 **Autonomous agent started!**\nNova can now do things on her own!")
         return
     
@@ -1857,50 +2288,38 @@ async def autonomous_command(ctx, action: str = None, capability: str = None):
     if action == "tasks":
         tasks = autonomous_agent.tasks
         
-        msg = "📋 **Autonomous Tasks**\n\n"
+        parts = ["📋 **Autonomous Tasks**\n\n"]
         for task_id, task in tasks.items():
             status_emoji = "✅" if task.enabled else "❌"
             interval_min = task.interval // 60
-            msg += f"{status_emoji} **{task.name}**\n"
-            msg += f"   ID: `{task_id}`\n"
-            msg += f"   Interval: {interval_min} minutes\n"
-            msg += f"   Priority: {task.priority}/10\n\n"
+            parts.append(
+                f"{status_emoji} **{task.name}**\n"
+                f"   ID: `{task_id}`\n"
+                f"   Interval: {interval_min} minutes\n"
+                f"   Priority: {task.priority}/10\n\n"
+            )
         
-        msg += "Use `!autonomous enable <task_id>` to enable\n"
-        msg += "Use `!autonomous disable <task_id>` to disable"
+        parts.append("Use `!autonomous enable <task_id>` to enable\n"
+                     "Use `!autonomous disable <task_id>` to disable")
         
-        await ctx.reply(msg)
+        await ctx.reply("".join(parts))
         return
     
-    if action == "enable" and capability:
-        if capability in autonomous_agent.tasks:
-            autonomous_agent.tasks[capability].enabled = True
-            await ctx.reply(f"✅ Enabled task: **{autonomous_agent.tasks[capability].name}**")
-        else:
-            await ctx.reply(f"❌ Unknown task: `{capability}`\nUse `!autonomous tasks` to see all tasks")
-        return
-    
-    if action == "disable" and capability:
-        if capability in autonomous_agent.tasks:
-            autonomous_agent.tasks[capability].enabled = False
-            await ctx.reply(f"❌ Disabled task: **{autonomous_agent.tasks[capability].name}**")
-        else:
-            await ctx.reply(f"❌ Unknown task: `{capability}`\nUse `!autonomous tasks` to see all tasks")
+    if action in ("enable", "disable") and capability:
+        await set_autonomous_task_enabled(ctx, capability, action == "enable")
         return
     
     if action == "capability" and capability:
-        # Parse on/off from message
-        parts = ctx.message.content.split()
-        if len(parts) < 4:
+        if len(args) != 2:
             await ctx.reply("Usage: `!autonomous capability <web|learn|message|screen> <on|off>`")
             return
         
-        toggle = parts[3].lower() in ['on', 'true', 'enable', 'yes']
+        enabled = args[1].lower() in TRUTHY_VALUES
         
-        if capability in ['web', 'learn', 'message', 'screen']:
-            autonomous_agent.enable_capability(capability, toggle)
-            status = "enabled" if toggle else "disabled"
-            await ctx.reply(f"{'✅' if toggle else '❌'} Autonomous {capability} capability: **{status}**")
+        if capability in AUTONOMOUS_CAPABILITIES:
+            autonomous_agent.enable_capability(capability, enabled)
+            status = "enabled" if enabled else "disabled"
+            await ctx.reply(f"{'✅' if enabled else '❌'} Autonomous {capability} capability: **{status}**")
         else:
             await ctx.reply("Unknown capability! Use: `web`, `learn`, `message`, or `screen`")
         return
@@ -1912,17 +2331,19 @@ async def autonomous_command(ctx, action: str = None, capability: str = None):
             await ctx.reply("🎯 No active goals. Nova will create goals autonomously or use `!autonomous goal <description>` to set one.")
             return
         
-        msg = "🎯 **Active Goals**\\n\\n"
+        parts = ["🎯 **Active Goals**\n\n"]
         for goal in autonomous_agent.goals:
             progress_bar = "█" * (goal["progress"] // 10) + "░" * (10 - goal["progress"] // 10)
-            msg += f"**{goal['description'][:60]}**\\n"
-            msg += f"Progress: {progress_bar} {goal['progress']}%\\n"
-            msg += f"Priority: {goal['priority']}/10 | Created: {goal['created'][:10]}\\n\\n"
+            parts.append(
+                f"**{goal['description'][:60]}**\n"
+                f"Progress: {progress_bar} {goal['progress']}%\n"
+                f"Priority: {goal['priority']}/10 | Created: {goal['created'][:10]}\n\n"
+            )
         
         if autonomous_agent.completed_goals:
-            msg += f"\\n✅ Completed goals: {len(autonomous_agent.completed_goals)}"
+            parts.append(f"\n✅ Completed goals: {len(autonomous_agent.completed_goals)}")
         
-        await send_long_message(ctx, msg)
+        await send_long_message(ctx, "".join(parts))
         return
     
     if action == "completed":
@@ -1930,17 +2351,19 @@ async def autonomous_command(ctx, action: str = None, capability: str = None):
             await ctx.reply("✅ No completed goals yet.")
             return
         
-        msg = "✅ **Completed Goals**\\n\\n"
+        parts = ["✅ **Completed Goals**\n\n"]
         for goal in autonomous_agent.completed_goals[-10:]:  # Show last 10
-            msg += f"**{goal['description'][:60]}**\\n"
-            msg += f"Priority: {goal['priority']}/10 | Completed: {goal.get('completed_at', 'Unknown')[:10]}\\n\\n"
+            parts.append(
+                f"**{goal['description'][:60]}**\n"
+                f"Priority: {goal['priority']}/10 | Completed: {goal.get('completed_at', 'Unknown')[:10]}\n\n"
+            )
         
-        await send_long_message(ctx, msg)
+        await send_long_message(ctx, "".join(parts))
         return
     
     if action == "goal" and capability:
         # Create a new goal
-        description = ctx.message.content.split(' ', 2)[2] if len(ctx.message.content.split(' ', 2)) > 2 else capability
+        description = goal.strip()
         goal_id = autonomous_agent.create_goal(description, category="user_requested", priority=8)
         if goal_id:
             await ctx.reply(f"🎯 **Goal created!**\\n{description}\\n\\nI'll work on this autonomously.")
@@ -1953,18 +2376,20 @@ async def autonomous_command(ctx, action: str = None, capability: str = None):
             await ctx.reply("📊 No performance data yet. Let Nova run for a while!")
             return
         
-        msg = "📊 **Task Performance Metrics**\\n\\n"
+        parts = ["📊 **Task Performance Metrics**\n\n"]
         for task_id, perf in autonomous_agent.task_performance.items():
             if task_id in autonomous_agent.tasks:
                 task_name = autonomous_agent.tasks[task_id].name
                 total = perf.get('total', 0)
                 successes = perf.get('successes', 0)
                 success_rate = (successes / total * 100) if total > 0 else 0
-                msg += f"**{task_name}**\\n"
-                msg += f"• Runs: {total} | Success: {success_rate:.1f}%\\n"
-                msg += f"• Avg Duration: {perf.get('avg_duration', 0):.1f}s\\n\\n"
+                parts.append(
+                    f"**{task_name}**\n"
+                    f"• Runs: {total} | Success: {success_rate:.1f}%\n"
+                    f"• Avg Duration: {perf.get('avg_duration', 0):.1f}s\n\n"
+                )
         
-        await send_long_message(ctx, msg)
+        await send_long_message(ctx, "".join(parts))
         return
     
     if action == "learning":
@@ -1973,109 +2398,27 @@ async def autonomous_command(ctx, action: str = None, capability: str = None):
         return
     
     if action == "optimize":
-        toggle = capability and capability.lower() in ['on', 'true', 'enable', 'yes']
-        autonomous_agent.optimization_enabled = toggle
-        status = "enabled" if toggle else "disabled"
+        enabled = bool(capability) and capability.lower() in TRUTHY_VALUES
+        autonomous_agent.optimization_enabled = enabled
+        status = "enabled" if enabled else "disabled"
         await ctx.reply(f"🔧 Self-optimization: **{status}**\\n" + 
-                       ("Nova will adjust task intervals based on performance." if toggle else "Task intervals are now fixed."))
+                       ("Nova will adjust task intervals based on performance." if enabled else "Task intervals are now fixed."))
         return
     
     # Help message
-    await ctx.reply("""🤖 **Autonomous Agent Commands**
-
-**Status & Control:**
-• `!autonomous status` - View current status
-• `!autonomous start` - Start autonomous mode
-• `!autonomous stop` - Stop autonomous mode
-
-**Tasks:**
-• `!autonomous tasks` - List all tasks
-• `!autonomous enable <task_id>` - Enable a task
-• `!autonomous disable <task_id>` - Disable a task
-
-**Goals:**
-• `!autonomous goals` - View active goals
-• `!autonomous goal <description>` - Create a goal
-
-**Analytics:**
-• `!autonomous performance` - View task metrics
-• `!autonomous learning` - View learning log
-• `!autonomous optimize <on|off>` - Toggle self-optimization
-
-**Capabilities:**
-• `!autonomous capability <name> <on|off>` - Toggle capability
-  (web, learn, message, screen)""")
-    
-    await ctx.reply("Invalid command! Use `!autonomous` for help")
-
-    embed.add_field(
-        name="💬 Chat Commands",
-        value=(
-            "`!chat <message>` - Chat with AI\n"
-            "`@mention <message>` - Chat by mentioning me\n"
-            "`!clear` - Clear conversation history"
-        ),
-        inline=False
-    )
-    
-    embed.add_field(
-        name="👁️ Vision Commands",
-        value=(
-            "`!screen [question]` - Let me see your screen\n"
-            "`!video <url>` - Analyze video content\n"
-            "Example: `!screen What's on my desktop?`"
-        ),
-        inline=False
-    )
-    
-    embed.add_field(
-        name="🌐 Web Commands",
-        value=(
-            "`!web <url>` - Visit a website\n"
-            "`!web search <query>` - Search Google\n"
-            "`!analyze <question>` - Analyze current page"
-        ),
-        inline=False
-    )
-    
-    embed.add_field(
-        name="👥 Social",
-        value=(
-            "`!friends` - Manage friends\n"
-            "`!dm <user> <msg>` - Send DM\n"
-            "`!accept_all` - Accept all requests"
-        ),
-        inline=False
-    )
-    
-    embed.add_field(
-        name="⚙️ Utility",
-        value=(
-            "`!status` - Check bot health\n"
-            "`!help` - Show this message"
-        ),
-        inline=False
-    )
-    
-    embed.set_footer(text="Powered by Ollama • 100% Local • No API Keys")
-    
-    await ctx.reply(embed=embed)
+    await ctx.reply(AUTONOMOUS_HELP)
 
 async def handle_chat(message, content: str, image_base64: Optional[str] = None, file_content_added: bool = False):
     """Handle chat interaction using shared chat_handler logic"""
     channel_id = str(message.channel.id)
     
-    # Debug: Track if already processing this message
-    msg_id = f"{message.id}_{channel_id}"
-    processing_key = f"processing_{msg_id}"
-    
     # Prevent duplicate processing
-    if nova_state.get(processing_key):
-        print(f"⚠️ Already processing message {message.id}, skipping duplicate")
+    if message.id in inflight_messages:
+        log.debug("Already processing message %s, skipping duplicate", message.id)
         return
     
-    nova_state[processing_key] = True
-    print(f"🎯 Starting handle_chat for message {message.id}: {content[:50]}")
+    inflight_messages.add(message.id)
+    log.debug("Starting handle_chat for message %s: %s", message.id, content[:50])
     
     try:
         # Check if thinking aloud mode is enabled
@@ -2087,11 +2430,11 @@ async def handle_chat(message, content: str, image_base64: Optional[str] = None,
         typing_delay = random.uniform(0.5, 2.0)  # Initial delay before typing
         
         total_delay = min(read_time + think_time + typing_delay, 8.0)  # Cap at 8 seconds
-        print(f"⏱️ Human-like delay: {total_delay:.1f}s (read: {read_time:.1f}s, think: {think_time:.1f}s)")
+        log.debug("Human-like delay: %.1fs (read: %.1fs, think: %.1fs)", total_delay, read_time, think_time)
         
-        await asyncio.sleep(typing_delay)  # Initial delay
-        
-        # If thinking aloud, first generate Nova's thoughts
+        # If thinking aloud, start generating Nova's thoughts now so the model
+        # call overlaps the typing delay
+        thought_task = None
         if show_thoughts:
             thought_prompt = f"""You're Nova, not an AI, a real person. Someone just said: "{content}"
 
@@ -2104,24 +2447,34 @@ Examples:
 - "ngl im not 100% sure but i think..."
 
 Keep it SHORT (1 sentence), natural, stream-of-consciousness. This is your INTERNAL thought before responding."""
-
-            try:
-                thought = await ollama_client.chat(thought_prompt)
-                await message.channel.send(f"💭 *{thought.strip()}*")
-                await asyncio.sleep(0.5)
-            except:
-                pass
+            thought_task = asyncio.create_task(ollama_client.chat(thought_prompt))
+        
+        await asyncio.sleep(typing_delay)  # Initial delay
         
-        # Use shared chat handler - pass user_id for learning system
-        response, metadata = await process_chat_message(
+        # Use shared chat handler - pass user_id for learning system.
+        # Runs while the thought (if any) is finished and posted first.
+        chat_task = asyncio.create_task(process_chat_message(
             message=content,
             session_id=channel_id,
             user_id=message.author.id,
             image_base64=image_base64,
             platform="discord"
-        )
+        ))
+        
+        if thought_task:
+            try:
+                thought = await thought_task
+                # Queued like the reply, so per-channel pacing replaces a fixed pause
+                await send_queue.send(
+                    message.channel.id,
+                    functools.partial(message.channel.send, f"💭 *{thought.strip()}*")
+                )
+            except:
+                pass
         
-        print(f"✅ Got response: {response[:100] if response else '(empty)'}...")
+        response, metadata = await chat_task
+        
+        log.debug("Got response: %s...", response[:100] if response else '(empty)')
         
         # Validate response is not empty
         if not response or not response.strip():
@@ -2139,14 +2492,7 @@ Keep it SHORT (1 sentence), natural, stream-of-consciousness. This is your INTER
         try:
             # Personality-appropriate error messages
             personality = nova_config.get("personality_mode", "chaotic")
-            error_messages = {
-                "chaotic": ["something broke idk", "error happened, not my fault", "crashed lol"],
-                "neuro": ["skill issue (mine this time)", "broke. sadge.", "error detected. L"],
-                "friendly": ["oops something went wrong, my bad", "ran into an error, sorry!", "oof hit a snag there"],
-                "professional": ["Error encountered during processing", "System error occurred", "Request failed"],
-                "flirty": ["oops~ something broke", "well that didn't work out 😅", "crashed but like, cutely"]
-            }
-            fallback = random.choice(error_messages.get(personality, error_messages["chaotic"]))
+            fallback = random.choice(CHAT_ERROR_MESSAGES.get(personality, CHAT_ERROR_MESSAGES["chaotic"]))
             await message.channel.send(f"❌ {fallback}")
         except:
             pass
@@ -2156,58 +2502,66 @@ Keep it SHORT (1 sentence), natural, stream-of-consciousness. This is your INTER
         try:
             if 'response' in locals() and response and nova_config.get("auto_respond_voice", True):
                 # Check if bot is in a voice channel in this guild
-                for vc in bot.voice_clients:
-                    if vc.guild == message.guild:
-                        # Clean response for TTS (remove markdown, emojis, etc.)
-                        tts_text = response
-                        # Remove markdown formatting
-                        import re
-                        tts_text = re.sub(r'\*\*(.*?)\*\*', r'\1', tts_text)  # Bold
-                        tts_text = re.sub(r'\*(.*?)\*', r'\1', tts_text)  # Italic
-                        tts_text = re.sub(r'`(.*?)`', r'\1', tts_text)  # Code
-                        tts_text = re.sub(r'#{1,6}\s', '', tts_text)  # Headers
-                        # Remove emojis
-                        tts_text = re.sub(r':[a-zA-Z0-9_]+:', '', tts_text)
-                        # Limit length for TTS (too long is annoying)
-                        if len(tts_text) > 500:
-                            tts_text = tts_text[:500] + "... see text for full response"
+                vc = guild_voice_client(message.guild)
+                if vc:
+                    # Clean response for TTS (remove markdown, emojis, etc.)
+                    tts_text = clean_for_tts(response)
+                    # Limit length for TTS (too long is annoying)
+                    if len(tts_text) > 500:
+                        tts_text = tts_text[:500] + "... see text for full response"
                         
-                        # Speak the response
-                        print(f"🎤 Speaking response in voice channel...")
-                        success, error = await voice_client.speak_in_channel(vc.channel.id, tts_text)
-                        if error:
-                            print(f"⚠️ Voice response error: {error}")
-                        break
+                    # Speak the response
+                    log.debug("Speaking response in voice channel")
+                    success, error = await voice_client.speak_in_channel(vc.channel.id, tts_text)
+                    if error:
+                        print(f"⚠️ Voice response error: {error}")
         except Exception as voice_err:
             print(f"⚠️ Voice handling error: {voice_err}")
         
         # Cleanup processing flag
-        msg_id = f"{message.id}_{channel_id}"
-        processing_key = f"processing_{msg_id}"
-        if processing_key in nova_state:
-            del nova_state[processing_key]
-        print(f"✅ Finished handle_chat for message {message.id}")
+        inflight_messages.discard(message.id)
+        log.debug("Finished handle_chat for message %s", message.id)
 
 def convert_mentions_to_discord(message, content: str) -> str:
     """Convert @username mentions in text to actual Discord mentions"""
     if not message.guild:
         return content
     
-    # Find all @username patterns in the text
-    import re
-    pattern = r'@(\w+)'
-    matches = re.findall(pattern, content)
+    names = guild_mention_map(message.guild)
     
-    for username in matches:
-        # Try to find the member in the guild
-        member = discord.utils.find(lambda m: m.name.lower() == username.lower() or 
-                                   m.display_name.lower() == username.lower(), 
-                                   message.guild.members)
-        if member:
-            # Replace @username with proper Discord mention
-            content = re.sub(rf'@{re.escape(username)}\b', f'<@{member.id}>', content, flags=re.IGNORECASE)
+    def to_mention(match):
+        # Replace @username with proper Discord mention if they're in the guild
+        member_id = names.get(match.group(1).lower())
+        return f'<@{member_id}>' if member_id else match.group(0)
     
-    return content
+    return MENTION_RE.sub(to_mention, content)
+
+def split_message(content: str, max_length: int):
+    """Yield chunks of at most max_length chars, breaking at a newline, sentence end or space"""
+    start, total = 0, len(content)
+    while start < total:
+        end = start + max_length
+        if end >= total:
+            chunk = content[start:]
+            if chunk.strip():
+                yield chunk
+            return
+        
+        # Prefer a newline, then a sentence end, then a space; hard cut as a last resort
+        cut = content.rfind('\n', start + 1, end + 1)
+        skip = 1
+        if cut == -1:
+            cut = content.rfind('. ', start + 1, end)
+            if cut != -1:
+                cut += 1  # Keep the period, drop the space
+        if cut == -1:
+            cut = content.rfind(' ', start + 1, end + 1)
+        if cut == -1:
+            cut, skip = end, 0
+        
+        chunk, start = content[start:cut], cut + skip
+        if chunk.strip():  # Discord rejects whitespace-only messages
+            yield chunk
 
 async def send_long_message(ctx, content: str, prefix: str = ""):
     """Send message, splitting if too long for Discord (2000 char limit)"""
@@ -2221,25 +2575,30 @@ async def send_long_message(ctx, content: str, prefix: str = ""):
     
     max_length = 2000 - len(prefix)
     
+    # Sends go through the shared queue, which paces them per channel
+    channel_id = ctx.channel.id
+    
+    async def send(text: str, reply: bool):
+        if reply:
+            try:
+                return await send_queue.send(channel_id, functools.partial(ctx.reply, text))
+            except discord.errors.HTTPException:
+                # Can't reply (maybe system message), send normally
+                pass
+        return await send_queue.send(channel_id, functools.partial(ctx.channel.send, text))
+    
     if len(content) <= max_length:
-        try:
-            await ctx.reply(prefix + content)
-        except discord.errors.HTTPException:
-            # Can't reply (maybe system message), send normally
-            await ctx.channel.send(prefix + content)
+        await send(prefix + content, reply=True)
     else:
-        # Split into chunks
-        chunks = [content[i:i+max_length] for i in range(0, len(content), max_length)]
-        
-        for i, chunk in enumerate(chunks):
+        for i, chunk in enumerate(split_message(content, max_length)):
             if i == 0:
-                try:
-                    await ctx.reply(prefix + chunk)
-                except discord.errors.HTTPException:
-                    await ctx.channel.send(prefix + chunk)
+                await send(prefix + chunk, reply=True)
             else:
-                await ctx.channel.send(chunk)
-            await asyncio.sleep(0.5)  # Avoid rate limits
+                await send(chunk, reply=False)
+
+def handle_sigterm(signum, frame):
+    """Stop like Ctrl+C does so bot.run returns and run_bot can flush pending saves"""
+    raise KeyboardInterrupt
 
 def run_bot():
     """Run the Discord bot"""
@@ -2259,6 +2618,9 @@ def run_bot():
     print(f"🔍 Token loaded: {token[:20]}...{token[-10:]} (length: {len(token)})")
     print(f"🔍 Using discord.py version: {discord.__version__}")
     
+    # The launcher stops the bot with SIGTERM, which would otherwise skip atexit
+    signal.signal(signal.SIGTERM, handle_sigterm)
+    
     try:
         print("🔄 Starting bot...")
         bot.run(token)
@@ -2272,6 +2634,9 @@ def run_bot():
         asyncio.run(autonomous_agent.stop(wait_for_tasks=False))
         import traceback
         traceback.print_exc()
+    finally:
+        # Write learned data still waiting on the debounce timer
+        learning_system.close()
 
 if __name__ == "__main__":
     run_bot()
@@ -6,10 +6,28 @@ This allows the web API to access Discord bot information
 # Global reference to the Discord bot instance
 discord_bot = None
 
+# Serialized snapshots for the web API, dropped by the bot's gateway events
+friends_cache = None
+requests_cache = None
+user_info_cache = None
+
 def set_bot(bot):
     """Set the Discord bot instance"""
     global discord_bot
     discord_bot = bot
+    invalidate_relationships()
+    invalidate_user_info()
+
+def invalidate_relationships():
+    """Drop the friends/requests snapshots (call on relationship or user changes)"""
+    global friends_cache, requests_cache
+    friends_cache = None
+    requests_cache = None
+
+def invalidate_user_info():
+    """Drop the current-user snapshot"""
+    global user_info_cache
+    user_info_cache = None
 
 def get_bot():
     """Get the Discord bot instance"""
@@ -21,8 +39,11 @@ def is_bot_ready():
 
 def get_friends():
     """Get list of friends"""
+    global friends_cache
     if not is_bot_ready():
         return []
+    if friends_cache is not None:
+        return list(friends_cache)
     
     try:
         friends = []
@@ -34,14 +55,18 @@ def get_friends():
                 "avatar": str(friend.avatar.url) if friend.avatar else None,
                 "display_name": friend.display_name if hasattr(friend, 'display_name') else friend.name
             })
-        return friends
+        friends_cache = friends
+        return list(friends)
     except:
         return []
 
 def get_pending_requests():
     """Get pending friend requests"""
+    global requests_cache
     if not is_bot_ready():
         return {"incoming": [], "outgoing": []}
+    if requests_cache is not None:
+        return {key: list(users) for key, users in requests_cache.items()}
     
     try:
         incoming = []
@@ -60,23 +85,28 @@ def get_pending_requests():
             elif relationship.type.name == 'outgoing_request' or relationship.type.name == 'outgoing':
                 outgoing.append(user_data)
         
-        return {"incoming": incoming, "outgoing": outgoing}
+        requests_cache = {"incoming": incoming, "outgoing": outgoing}
+        return {"incoming": list(incoming), "outgoing": list(outgoing)}
     except:
         return {"incoming": [], "outgoing": []}
 
 def get_user_info():
     """Get current user information"""
+    global user_info_cache
     if not is_bot_ready():
         return None
+    if user_info_cache is not None:
+        return dict(user_info_cache)
     
     try:
         user = discord_bot.user
-        return {
+        user_info_cache = {
             "id": str(user.id),
             "name": user.name,
             "discriminator": user.discriminator,
             "avatar": str(user.avatar.url) if user.avatar else None,
             "display_name": user.display_name if hasattr(user, 'display_name') else user.name
         }
+        return dict(user_info_cache)
     except:
         return None
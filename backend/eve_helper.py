@@ -3,10 +3,51 @@ EVE Online SDE Helper
 Provides access to EVE Online Static Data Export for Nova
 """
 import json
+import math
+import mmap
 import os
+import pickle
+import threading
+from array import array
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional, List, Dict
 from functools import lru_cache
+from itertools import islice
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Numeric type fields stored as packed columns (field -> array typecode)
+TYPE_COLUMNS = {
+    'groupID': 'q',
+    'mass': 'd',
+    'volume': 'd',
+    'capacity': 'd',
+    'portionSize': 'q',
+    'published': 'b',
+}
+MISSING_INT = -1  # Integer columns use this (floats use NaN) for absent fields
+# Ships are in groups 25-31, 237, 324, 358, 380, 381, 419, 420, etc
+SHIP_GROUPS = frozenset({
+    25, 26, 27, 28, 29, 30, 31, 237, 324, 358, 380, 381, 419, 420,
+    463, 485, 513, 540, 541, 543, 547, 659, 830, 831, 832, 833, 834,
+    883, 893, 894, 898, 900, 902, 906, 941, 963, 1022, 1201, 1202, 1283, 1527,
+})
+INDEX_CACHE_FILE = ".type_index.pkl"  # Built type index, saved next to the SDE
+INDEX_CACHE_VERSION = 2  # Bump when the layout of the type index changes
+PRELOAD_FILES = ("groups.jsonl",)  # Loaded alongside the type index by warm_up
+NGRAM_SIZE = 3  # Queries at least this long are looked up in the name n-gram index
+
+def english_text(text_obj) -> str:
+    """Fast path of EVEHelper._get_localized_text for English, used in the index build"""
+    if type(text_obj) is dict:
+        return text_obj.get('en', '')
+    return str(text_obj) if text_obj else ''
 
 class EVEHelper:
     """Helper for querying EVE Online SDE data"""
@@ -15,6 +56,11 @@ class EVEHelper:
         self.sde_path = Path(__file__).parent.parent / "EveSDE"
         self.cache = {}
         self.indices = {}  # For faster lookups
+        # SDE data is static per patch, so repeat searches can be memoized
+        self.search_cache = OrderedDict()  # (query, limit) -> results, LRU order
+        self.search_cache_size = 512
+        self.build_lock = threading.Lock()  # Index is built from a worker thread at startup
+        self.warmed = False
         
     def _load_jsonl(self, filename: str) -> List[Dict]:
         """Load a JSONL file from the SDE"""
@@ -28,13 +74,14 @@ class EVEHelper:
         
         data = []
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
+            # orjson parses bytes directly, so skip the utf-8 text decode
+            loads = orjson.loads if HAS_ORJSON else json.loads
+            with open(filepath, 'rb') as f:
                 for line_num, line in enumerate(f, 1):
-                    line = line.strip()
-                    if not line:
+                    if not line.strip():
                         continue
                     try:
-                        obj = json.loads(line)
+                        obj = loads(line)
                         data.append(obj)
                     except json.JSONDecodeError as e:
                         print(f"Error parsing line {line_num} in {filename}: {e}")
@@ -47,81 +94,242 @@ class EVEHelper:
         
         return data
     
+    def _stream_jsonl(self, filename: str):
+        """Yield entries from a JSONL file one at a time without caching the list"""
+        filepath = self.sde_path / filename
+        if not filepath.exists():
+            print(f"Warning: {filename} not found at {filepath}")
+            return
+        if filepath.stat().st_size == 0:
+            return
+        
+        loads = orjson.loads if HAS_ORJSON else json.loads
+        try:
+            with open(filepath, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                for line_num, line in enumerate(iter(mm.readline, b''), 1):
+                    if not line.strip():
+                        continue
+                    try:
+                        yield loads(line)
+                    except json.JSONDecodeError as e:
+                        print(f"Error parsing line {line_num} in {filename}: {e}")
+        except OSError as e:
+            print(f"❌ Error streaming {filename}: {e}")
+    
     def _get_localized_text(self, text_obj, lang: str = 'en') -> str:
         """Extract localized text from nested language object"""
         if isinstance(text_obj, dict):
             return text_obj.get(lang, text_obj.get('en', ''))
         return str(text_obj) if text_obj else ''
     
+    def warm_up(self):
+        """Build the type index and load the other queried files ahead of the first query
+
+        Blocking; run it in a thread. The files are independent, so they load in parallel.
+        """
+        if self.warmed:
+            return
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            jobs = [pool.submit(self._build_type_index)]
+            jobs += [pool.submit(self._load_jsonl, filename) for filename in PRELOAD_FILES]
+            for job in jobs:
+                job.result()
+        self.warmed = True
+    
     def _build_type_index(self):
-        """Build an index for faster type lookups"""
-        if 'type_index' in self.indices:
+        """Build the type index once; concurrent callers wait for the first build"""
+        if 'type_rows' in self.indices:
             return
+        with self.build_lock:
+            if 'type_rows' not in self.indices:
+                self._index_types()
+    
+    def _index_types(self):
+        """Build column storage for types (one row per type) for faster lookups"""
+        if self._load_index_cache():
+            return
+        
+        type_rows = {}  # type_id -> row
+        type_ids = array('q')
+        names = []
+        descriptions = []
+        columns = {field: array(code) for field, code in TYPE_COLUMNS.items()}
+        name_index = {}  # lowercase name -> rows
+        ngram_index = {}  # name n-gram -> name ordinals (positions in name_index)
+        ship_name_index = {}  # lowercase name -> rows, published ships only
         
-        types = self._load_jsonl("types.jsonl")
-        self.indices['type_index'] = {}
-        self.indices['type_name_index'] = {}
+        # Stream instead of _load_jsonl so the raw list of types never stays resident
+        for entry in self._stream_jsonl("types.jsonl"):
+            type_id = entry.get('_key') or entry.get('typeID')
+            if not type_id:
+                continue
+            
+            row = len(names)
+            type_rows[type_id] = row
+            type_ids.append(type_id)
+            name = english_text(entry.get('name'))
+            names.append(name)
+            descriptions.append(english_text(entry.get('description')))
+            for field, column in columns.items():
+                value = entry.get(field)
+                if value is None:
+                    value = math.nan if column.typecode == 'd' else (0 if field == 'published' else MISSING_INT)
+                column.append(value)
+            
+            # Index by name for faster searching
+            name = name.lower()
+            if name and name != '#system':  # Skip system entries
+                if name not in name_index:
+                    ordinal = len(name_index)
+                    for gram in {name[i:i + NGRAM_SIZE] for i in range(len(name) - NGRAM_SIZE + 1)}:
+                        ngram_index.setdefault(gram, []).append(ordinal)
+                name_index.setdefault(name, []).append(row)
+                if entry.get('groupID') in SHIP_GROUPS and entry.get('published', False):
+                    ship_name_index.setdefault(name, []).append(row)
         
-        for item in types:
-            type_id = item.get('_key') or item.get('typeID')
-            if type_id:
-                self.indices['type_index'][type_id] = item
-                
-                # Index by name for faster searching
-                name = self._get_localized_text(item.get('name', {})).lower()
-                if name and name != '#system':  # Skip system entries
-                    if name not in self.indices['type_name_index']:
-                        self.indices['type_name_index'][name] = []
-                    self.indices['type_name_index'][name].append(item)
+        self.indices['type_ids'] = type_ids
+        self.indices['type_names'] = names
+        self.indices['type_descriptions'] = descriptions
+        self.indices['type_columns'] = columns
+        self.indices['type_name_index'] = name_index
+        self.indices['type_name_list'] = list(name_index)  # Ordinal -> name
+        self.indices['type_ngram_index'] = ngram_index
+        self.indices['ship_name_index'] = ship_name_index
+        self.indices['type_rows'] = type_rows
         
-        print(f"✅ Indexed {len(self.indices['type_index'])} types")
+        print(f"✅ Indexed {len(type_rows)} types")
+        if type_rows:
+            self._save_index_cache()
     
-    def search_items(self, query: str, limit: int = 5) -> List[Dict]:
-        """Search for items/types by name"""
-        self._build_type_index()
+    def _load_index_cache(self) -> bool:
+        """Load the pickled type index if it is newer than types.jsonl"""
+        cache_path = self.sde_path / INDEX_CACHE_FILE
+        types_path = self.sde_path / "types.jsonl"
+        try:
+            if not cache_path.exists() or cache_path.stat().st_mtime < types_path.stat().st_mtime:
+                return False
+            with open(cache_path, 'rb') as f:
+                cached = pickle.load(f)
+        except Exception as e:
+            print(f"⚠️ Ignoring EVE index cache: {e}")
+            return False
         
-        query_lower = query.lower()
-        results = []
+        if cached.get('version') != INDEX_CACHE_VERSION:
+            return False
+        self.indices.update(cached['indices'])
+        print(f"✅ Loaded {len(self.indices['type_rows'])} indexed types from cache")
+        return True
+    
+    def _save_index_cache(self):
+        """Pickle the built type index so later runs skip the JSONL parse"""
+        cache_path = self.sde_path / INDEX_CACHE_FILE
+        tmp_path = cache_path.with_suffix('.tmp')
+        try:
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(
+                    {'version': INDEX_CACHE_VERSION, 'indices': self.indices},
+                    f, protocol=pickle.HIGHEST_PROTOCOL
+                )
+            os.replace(tmp_path, cache_path)
+        except Exception as e:
+            print(f"⚠️ Could not save EVE index cache: {e}")
+    
+    def _matching_rows(self, query_lower: str):
+        """Yield rows whose name contains query_lower, in type_name_index order
+
+        Every name containing the query contains all of its n-grams, so the
+        intersected postings are a complete candidate set. Shorter queries
+        use the full name scan.
+        """
+        if len(query_lower) < NGRAM_SIZE:
+            for name, rows in self.indices['type_name_index'].items():
+                if query_lower in name:
+                    yield from rows
+            return
+        
+        ngram_index = self.indices['type_ngram_index']
+        postings = []
+        for gram in {query_lower[i:i + NGRAM_SIZE] for i in range(len(query_lower) - NGRAM_SIZE + 1)}:
+            if gram not in ngram_index:
+                return
+            postings.append(ngram_index[gram])
+        postings.sort(key=len)  # Intersect starting from the rarest n-gram
+        candidates = set(postings[0])
+        for ordinals in postings[1:]:
+            candidates.intersection_update(ordinals)
+            if not candidates:
+                return
         
-        # Search through name index
-        for name, items in self.indices['type_name_index'].items():
+        # Checked lazily so callers that stop at a limit skip the remaining candidates
+        names = self.indices['type_name_list']
+        name_index = self.indices['type_name_index']
+        for ordinal in sorted(candidates):
+            name = names[ordinal]
             if query_lower in name:
-                for item in items:
-                    if item.get('published', False):  # Only published items
-                        type_id = item.get('_key') or item.get('typeID')
-                        results.append({
-                            'id': type_id,
-                            'name': self._get_localized_text(item.get('name', {})),
-                            'description': self._get_localized_text(item.get('description', {}))[:200],
-                            'groupID': item.get('groupID'),
-                            'mass': item.get('mass'),
-                            'volume': item.get('volume'),
-                            'published': item.get('published', False)
-                        })
-                        if len(results) >= limit:
-                            return results
+                yield from name_index[name]
+    
+    def _type_value(self, field: str, row: int):
+        """Read one numeric field for a type row, None if it was absent"""
+        value = self.indices['type_columns'][field][row]
+        if field == 'published':
+            return bool(value)
+        if isinstance(value, float):
+            if math.isnan(value):
+                return None
+            # Packed as doubles; whole numbers go back to ints like the SDE JSON had them
+            return int(value) if value.is_integer() else value
+        return None if value == MISSING_INT else value
+    
+    def _type_info(self, row: int, fields, description_limit: Optional[int] = None) -> Dict:
+        """Assemble a result dict for a type row from the column storage"""
+        info = {
+            'id': self.indices['type_ids'][row],
+            'name': self.indices['type_names'][row],
+            'description': self.indices['type_descriptions'][row][:description_limit],
+        }
+        for field in fields:
+            info[field] = self._type_value(field, row)
+        return info
+    
+    def search_items(self, query: str, limit: int = 5) -> List[Dict]:
+        """Search for items/types by name"""
+        query_lower = query.strip().lower()
+        key = (query_lower, limit)
+        if key in self.search_cache:
+            self.search_cache.move_to_end(key)
+            return self.search_cache[key]
         
+        results = self._search_items(query_lower, limit)
+        self.search_cache[key] = results
+        if len(self.search_cache) > self.search_cache_size:
+            self.search_cache.popitem(last=False)
         return results
     
+    def _search_items(self, query_lower: str, limit: int) -> List[Dict]:
+        """Uncached name search behind search_items"""
+        self._build_type_index()
+        
+        published = self.indices['type_columns']['published']
+        # Result dicts are only built for published rows, and only up to the limit
+        hits = (
+            self._type_info(row, ('groupID', 'mass', 'volume', 'published'), description_limit=200)
+            for row in self._matching_rows(query_lower)
+            if published[row]
+        )
+        return list(islice(hits, limit))
+    
+    @lru_cache(maxsize=1024)
     def get_item_info(self, item_id: int) -> Optional[Dict]:
-        """Get detailed info about a specific item"""
+        """Get detailed info about a specific item (memoized, SDE is static)"""
         self._build_type_index()
         
-        item = self.indices['type_index'].get(item_id)
-        if not item:
+        row = self.indices['type_rows'].get(item_id)
+        if row is None:
             return None
         
-        return {
-            'id': item_id,
-            'name': self._get_localized_text(item.get('name', {})),
-            'description': self._get_localized_text(item.get('description', {})),
-            'groupID': item.get('groupID'),
-            'mass': item.get('mass'),
-            'volume': item.get('volume'),
-            'capacity': item.get('capacity'),
-            'portionSize': item.get('portionSize'),
-            'published': item.get('published', False)
-        }
+        return self._type_info(
+            row, ('groupID', 'mass', 'volume', 'capacity', 'portionSize', 'published')
+        )
     
     def search_groups(self, query: str, limit: int = 5) -> List[Dict]:
         """Search for item groups"""
@@ -146,29 +354,17 @@ class EVEHelper:
     
     def get_ship_info(self, ship_name: str) -> Optional[Dict]:
         """Get information about a ship"""
-        # Ships are in groups 25-31, 237, 324, 358, 380, 381, 419, 420, etc
-        ship_groups = [25, 26, 27, 28, 29, 30, 31, 237, 324, 358, 380, 381, 419, 420, 
-                       463, 485, 513, 540, 541, 543, 547, 659, 830, 831, 832, 833, 834, 
-                       883, 893, 894, 898, 900, 902, 906, 941, 963, 1022, 1201, 1202, 1283, 1527]
-        
+        return self._ship_info(ship_name.strip().lower())
+    
+    @lru_cache(maxsize=1024)
+    def _ship_info(self, query_lower: str) -> Optional[Dict]:
+        """Memoized ship lookup behind get_ship_info (SDE is static)"""
         self._build_type_index()
-        query_lower = ship_name.lower()
         
-        # Search through indexed types
-        for name, items in self.indices['type_name_index'].items():
+        # Only published ships are in this index, so no per-row filtering is needed
+        for name, rows in self.indices['ship_name_index'].items():
             if query_lower in name:
-                for item in items:
-                    if item.get('groupID') in ship_groups and item.get('published', False):
-                        type_id = item.get('_key') or item.get('typeID')
-                        return {
-                            'id': type_id,
-                            'name': self._get_localized_text(item.get('name', {})),
-                            'description': self._get_localized_text(item.get('description', {})),
-                            'groupID': item.get('groupID'),
-                            'mass': item.get('mass'),
-                            'volume': item.get('volume'),
-                            'capacity': item.get('capacity'),
-                        }
+                return self._type_info(rows[0], ('groupID', 'mass', 'volume', 'capacity'))
         
         return None
     
@@ -2,15 +2,76 @@
 Nova AI Launcher - GUI launcher for backend services
 """
 import tkinter as tk
-from tkinter import ttk, scrolledtext, messagebox, filedialog
+from tkinter import ttk, scrolledtext
+import codecs
+import shutil
+import sqlite3
 import subprocess
 import threading
 import sys
 import os
 import json
+import queue
+import selectors
+from concurrent.futures import ThreadPoolExecutor, wait
+import time
 from pathlib import Path
 from datetime import datetime
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Keep service consoles from popping up on Windows
+CREATE_NO_WINDOW = 0x08000000 if sys.platform == "win32" else 0
+
+# select() on Windows only handles sockets, so pipes there keep one reader per service
+MULTIPLEX_PIPES = sys.platform != "win32"
+
+# Console log size limit; trimmed in blocks so deletes stay rare
+LOG_MAX_LINES = 2000
+LOG_TRIM_LINES = 500
+
+# Service name -> label text; process handles are self.<name>_process
+SERVICES = {
+    'backend': "Backend",
+    'frontend': "Frontend",
+    'discord': "Discord Bot",
+}
+
+# Database locations checked by the monitor, relative to the backend directory
+DB_CANDIDATES = (
+    Path("chatbot.db"),
+    Path("nova.db"),
+    Path("data") / "chatbot.db",
+    Path("data") / "nova.db",
+)
+FALLBACK_DB_PATHS = (
+    Path("h:/TheAI/backend/chatbot.db"),
+    Path("h:/TheAI/backend/nova.db"),
+)
+
+class OutputSplitter:
+    """Turns raw pipe chunks from one service into complete, prefixed log lines"""
+    
+    def __init__(self, label):
+        self.label = label
+        self.decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self.pending = ""  # Partial last line, completed by the next chunk
+    
+    def feed(self, chunk):
+        """Decode a chunk and return the lines it completed"""
+        *lines, self.pending = (self.pending + self.decoder.decode(chunk)).split("\n")
+        return [f"[{self.label}] {line.strip()}" for line in lines]
+    
+    def flush(self):
+        """Return whatever is left once the pipe is closed"""
+        rest = self.pending + self.decoder.decode(b"", final=True)
+        self.pending = ""
+        return [f"[{self.label}] {rest.strip()}"] if rest else []
+
 class NovaLauncher:
     def __init__(self, root):
         self.root = root
@@ -23,9 +84,42 @@ class NovaLauncher:
         self.discord_process = None
         self.frontend_process = None
         
+        # Last state shown in the status labels, so only flips get redrawn
+        self.process_state = {name: False for name in SERVICES}
+        self.stop_all_enabled = False
+        
+        # Reused workers: one output reader and one stop job per service, plus the monitor read
+        self.pool = ThreadPoolExecutor(max_workers=2 * len(SERVICES) + 1, thread_name_prefix="nova-launcher")
+        
+        # One thread drains every service's stdout where the OS can select() on pipes
+        if MULTIPLEX_PIPES:
+            self.stdout_selector = selectors.DefaultSelector()
+            threading.Thread(target=self.read_pipes, daemon=True).start()
+        
+        # Log lines from any thread; only drain_log touches the widget
+        self.log_queue = queue.Queue()
+        self.timestamp_cache = (0, "")  # (second, "HH:MM:SS") shared by lines in the same second
+        
         # Config file path
         self.config_file = Path.home() / ".nova_launcher_config.json"
-        self.backend_dir = self.load_config()
+        self.config_cache = None  # Last config read from or written to disk
+        self.backend_dir = None
+        self.set_backend_dir(self.load_config())
+        
+        # Executables resolved once ($PATH walks are slow on Windows)
+        self.resolve_executables()
+        
+        # Database found by the monitor, and the backend dir it was found for
+        self.db_path = None
+        self.db_path_dir = None
+        
+        # Monitor's read-only connection, kept open between refreshes
+        self.db_conn = None
+        self.db_conn_path = None
+        self.db_tables = None  # (db_signature(), table names) from the last sqlite_master read
+        self.count_cache = self.empty_count_cache()
+        self.monitor_lock = threading.Lock()  # Held while a monitor_worker is reading
+        self.db_signature_seen = False  # db_signature() at the last read; False forces the first one
         
         # Set icon if exists
         icon_path = Path(__file__).parent.parent / "frontend" / "favicon.ico"
@@ -78,6 +172,27 @@ class NovaLauncher:
         style.configure('TNotebook.Tab', padding=[20, 10], background=button_bg, foreground=fg_color)
         style.map('TNotebook.Tab', background=[('selected', accent_color)], foreground=[('selected', bg_color)])
         
+        # Button styles, configured once and shared by name (Variant.Base.TButton inherits Base)
+        style.configure('Launch.TButton', font=("Segoe UI", 11, "bold"), width=20, padding=(10, 12),
+                        foreground=bg_color, borderwidth=0, relief="flat")
+        style.configure('Stop.TButton', font=("Segoe UI", 9), width=15, padding=(6, 2),
+                        foreground=bg_color, borderwidth=0, relief="flat")
+        style.configure('Dark.TButton', font=("Segoe UI", 9), padding=(6, 4),
+                        foreground=fg_color, borderwidth=0, relief="flat")
+        button_colors = {
+            'Backend.Launch.TButton': ("#a6e3a1", "#94d38d"),
+            'Discord.Launch.TButton': ("#89b4fa", "#7aa2e8"),
+            'Both.Launch.TButton': ("#f9e2af", "#e8d19d"),
+            'Stop.TButton': ("#f38ba8", "#e27a97"),
+            'Refresh.Stop.TButton': ("#94e2d5", "#83d1c4"),
+            'Dark.TButton': (button_bg, "#45475a"),
+        }
+        for style_name, (color, active_color) in button_colors.items():
+            style.configure(style_name, background=color)
+            style.map(style_name, background=[('active', active_color)])
+        style.configure('All.Stop.TButton', font=("Segoe UI", 9, "bold"))
+        style.configure('Monitor.Dark.TButton', font=("Segoe UI", 10), width=20)
+        
         # Tab 1: Launcher Controls
         launcher_tab = tk.Frame(notebook, bg=bg_color)
         notebook.add(launcher_tab, text="🚀 Launcher")
@@ -116,16 +231,11 @@ class NovaLauncher:
         self.dir_entry.pack(side="left", fill="x", expand=True, padx=(0, 5))
         self.dir_entry.insert(0, str(self.backend_dir))
         
-        browse_btn = tk.Button(
+        browse_btn = ttk.Button(
             dir_input_frame,
             text="📁 Browse",
-            bg="#313244",
-            fg="#cdd6f4",
-            activebackground="#45475a",
-            font=("Segoe UI", 9),
+            style='Dark.TButton',
             width=10,
-            bd=0,
-            relief="flat",
             cursor="hand2",
             command=self.browse_directory
         )
@@ -172,49 +282,33 @@ class NovaLauncher:
         button_frame = tk.Frame(launcher_tab, bg=bg_color)
         button_frame.pack(pady=20, padx=20)
         
-        # Style buttons
-        button_style = {
-            "font": ("Segoe UI", 11, "bold"),
-            "width": 20,
-            "height": 2,
-            "bd": 0,
-            "relief": "flat",
-            "cursor": "hand2"
-        }
-        
         # Launch Backend button
-        self.backend_btn = tk.Button(
+        self.backend_btn = ttk.Button(
             button_frame,
             text="🚀 Launch Backend",
-            bg="#a6e3a1",
-            fg="#1e1e2e",
-            activebackground="#94d38d",
-            command=self.launch_backend,
-            **button_style
+            style='Backend.Launch.TButton',
+            cursor="hand2",
+            command=self.launch_backend
         )
         self.backend_btn.grid(row=0, column=0, padx=10, pady=10)
         
         # Launch Discord Bot button
-        self.discord_btn = tk.Button(
+        self.discord_btn = ttk.Button(
             button_frame,
             text="💬 Launch Discord Bot",
-            bg="#89b4fa",
-            fg="#1e1e2e",
-            activebackground="#7aa2e8",
-            command=self.launch_discord,
-            **button_style
+            style='Discord.Launch.TButton',
+            cursor="hand2",
+            command=self.launch_discord
         )
         self.discord_btn.grid(row=0, column=1, padx=10, pady=10)
         
         # Launch Both button
-        self.both_btn = tk.Button(
+        self.both_btn = ttk.Button(
             button_frame,
             text="⚡ Launch Both",
-            bg="#f9e2af",
-            fg="#1e1e2e",
-            activebackground="#e8d19d",
-            command=self.launch_both,
-            **button_style
+            style='Both.Launch.TButton',
+            cursor="hand2",
+            command=self.launch_both
         )
         self.both_btn.grid(row=1, column=0, columnspan=2, padx=10, pady=10)
         
@@ -222,71 +316,43 @@ class NovaLauncher:
         stop_frame = tk.Frame(launcher_tab, bg=bg_color)
         stop_frame.pack(pady=10, padx=20)
         
-        self.stop_backend_btn = tk.Button(
+        self.stop_backend_btn = ttk.Button(
             stop_frame,
             text="⏹ Stop Backend",
-            bg="#f38ba8",
-            fg="#1e1e2e",
-            activebackground="#e27a97",
-            command=self.stop_backend,
+            style='Stop.TButton',
             state="disabled",
-            font=("Segoe UI", 9),
-            width=15,
-            height=1,
-            bd=0,
-            relief="flat",
-            cursor="hand2"
+            cursor="hand2",
+            command=self.stop_backend
         )
         self.stop_backend_btn.grid(row=0, column=0, padx=5)
         
-        self.stop_discord_btn = tk.Button(
+        self.stop_discord_btn = ttk.Button(
             stop_frame,
             text="⏹ Stop Discord Bot",
-            bg="#f38ba8",
-            fg="#1e1e2e",
-            activebackground="#e27a97",
-            command=self.stop_discord,
+            style='Stop.TButton',
             state="disabled",
-            font=("Segoe UI", 9),
-            width=15,
-            height=1,
-            bd=0,
-            relief="flat",
-            cursor="hand2"
+            cursor="hand2",
+            command=self.stop_discord
         )
         self.stop_discord_btn.grid(row=0, column=1, padx=5)
         
-        self.stop_all_btn = tk.Button(
+        self.stop_all_btn = ttk.Button(
             stop_frame,
             text="⏹ Stop All",
-            bg="#f38ba8",
-            fg="#1e1e2e",
-            activebackground="#e27a97",
-            command=self.stop_all,
+            style='All.Stop.TButton',
             state="disabled",
-            font=("Segoe UI", 9, "bold"),
-            width=15,
-            height=1,
-            bd=0,
-            relief="flat",
-            cursor="hand2"
+            cursor="hand2",
+            command=self.stop_all
         )
         self.stop_all_btn.grid(row=0, column=2, padx=5)
         
         # Refresh button
-        self.refresh_btn = tk.Button(
+        self.refresh_btn = ttk.Button(
             stop_frame,
             text="🔄 Refresh Status",
-            bg="#94e2d5",
-            fg="#1e1e2e",
-            activebackground="#83d1c4",
-            command=self.force_refresh_status,
-            font=("Segoe UI", 9),
-            width=15,
-            height=1,
-            bd=0,
-            relief="flat",
-            cursor="hand2"
+            style='Refresh.Stop.TButton',
+            cursor="hand2",
+            command=self.force_refresh_status
         )
         self.refresh_btn.grid(row=1, column=0, columnspan=3, padx=5, pady=5)
         
@@ -372,22 +438,17 @@ class NovaLauncher:
         self.activity_text.pack(pady=10, padx=20, fill="both", expand=True)
         
         # Refresh button
-        refresh_btn = tk.Button(
+        refresh_btn = ttk.Button(
             monitor_tab,
             text="🔄 Refresh Stats",
-            bg="#313244",
-            fg="#cdd6f4",
-            activebackground="#45475a",
-            font=("Segoe UI", 10),
-            width=20,
-            bd=0,
-            relief="flat",
+            style='Monitor.Dark.TButton',
             cursor="hand2",
             command=self.refresh_monitor
         )
         refresh_btn.pack(pady=10)
         
         # Initial log message
+        self.drain_log()
         self.log_message("Nova AI Launcher initialized")
         self.log_message(f"Backend directory: {self.backend_dir}")
         
@@ -396,18 +457,22 @@ class NovaLauncher:
         self.refresh_monitor()
         self.schedule_monitor_refresh()
         
+        # Watch the service processes and push state changes to the Tk loop
+        threading.Thread(target=self.watch_processes, daemon=True).start()
+        
         # Handle window close
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
     
     def load_config(self):
         """Load backend directory from config file"""
         try:
-            if self.config_file.exists():
-                with open(self.config_file, 'r') as f:
-                    config = json.load(f)
-                    backend_dir = Path(config.get('backend_dir', ''))
-                    if backend_dir.exists():
-                        return backend_dir
+            if self.config_cache is None and self.config_file.exists():
+                raw = self.config_file.read_bytes()
+                self.config_cache = orjson.loads(raw) if HAS_ORJSON else json.loads(raw)
+            if self.config_cache is not None:
+                backend_dir = Path(self.config_cache.get('backend_dir', ''))
+                if backend_dir.exists():
+                    return backend_dir
         except:
             pass
         
@@ -422,38 +487,81 @@ class NovaLauncher:
         return default_dir if default_dir.exists() else Path.home()
     
     def save_config(self):
-        """Save backend directory to config file"""
+        """Save backend directory to config file (skipped when nothing changed)"""
+        config = {'backend_dir': str(self.backend_dir)}
+        if config == self.config_cache:
+            return
         try:
-            config = {'backend_dir': str(self.backend_dir)}
-            with open(self.config_file, 'w') as f:
-                json.dump(config, f)
+            if HAS_ORJSON:
+                self.config_file.write_bytes(orjson.dumps(config))
+            else:
+                self.config_file.write_text(json.dumps(config))
+            self.config_cache = config
         except Exception as e:
             self.log_message(f"⚠️ Could not save config: {e}")
     
+    def resolve_executables(self):
+        """Look up the Python and npm executables on $PATH"""
+        self.python_exe = shutil.which("python") or shutil.which("python3") or sys.executable
+        self.npm_exe = shutil.which("npm")
+    
     def browse_directory(self):
         """Browse for backend directory"""
+        from tkinter import filedialog  # Loaded on first use; pulls in extra Tcl packages
+        
         directory = filedialog.askdirectory(
             title="Select Backend Directory",
             initialdir=self.backend_dir
         )
         if directory:
-            self.backend_dir = Path(directory)
+            self.set_backend_dir(Path(directory))
             self.dir_entry.delete(0, tk.END)
             self.dir_entry.insert(0, str(self.backend_dir))
             self.save_config()
             self.log_message(f"✅ Backend directory set to: {self.backend_dir}")
     
+    def log_timestamp(self):
+        """Current time as HH:MM:SS, formatted at most once per second"""
+        second = int(time.time())
+        cached_second, text = self.timestamp_cache
+        if second != cached_second:
+            text = time.strftime("%H:%M:%S", time.localtime(second))
+            self.timestamp_cache = (second, text)
+        return text
+    
     def log_message(self, message):
-        """Add a message to the log"""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        self.log_text.insert(tk.END, f"[{timestamp}] {message}\n")
-        self.log_text.see(tk.END)
-        self.log_text.update()
+        """Queue a message for the log (safe to call from any thread)"""
+        self.log_queue.put(f"[{self.log_timestamp()}] {message}\n")
+    
+    def log_messages(self, messages):
+        """Queue several messages as one log entry with a shared timestamp"""
+        timestamp = self.log_timestamp()
+        self.log_queue.put("".join(f"[{timestamp}] {message}\n" for message in messages))
+    
+    def drain_log(self, max_lines=200):
+        """Append queued log lines in one insert, then reschedule on the Tk loop"""
+        lines = []
+        try:
+            while len(lines) < max_lines:
+                lines.append(self.log_queue.get_nowait())
+        except queue.Empty:
+            pass
+        
+        if lines:
+            self.log_text.insert(tk.END, "".join(lines))
+            line_count = int(self.log_text.index('end-1c').split('.')[0])
+            if line_count > LOG_MAX_LINES + LOG_TRIM_LINES:
+                self.log_text.delete('1.0', f'{line_count - LOG_MAX_LINES}.0')
+            self.log_text.see(tk.END)
+        self.root.after(50, self.drain_log)
     
     def force_refresh_status(self):
         """Force refresh status by checking if processes actually exist"""
         self.log_message("🔄 Refreshing process status...")
         
+        # Pick up Python/npm installs made since the launcher started
+        self.resolve_executables()
+        
         # Poll all processes to update their status
         if self.backend_process:
             self.backend_process.poll()
@@ -476,259 +584,225 @@ class NovaLauncher:
         self.update_status()
         self.log_message("✅ Status refresh complete")
     
+    def is_running(self, name):
+        """Check whether a service's process is alive"""
+        process = getattr(self, f"{name}_process")
+        return process is not None and process.poll() is None
+    
     def update_status(self):
-        """Update status labels"""
-        if self.backend_process and self.backend_process.poll() is None:
-            self.backend_status_label.config(text="● Backend: Running", fg="#a6e3a1")
-            self.stop_backend_btn.config(state="normal")
+        """Sync status labels with the processes, redrawing only the ones that flipped"""
+        for name in SERVICES:
+            running = self.is_running(name)
+            if not running:
+                setattr(self, f"{name}_process", None)  # Clear exited handles
+            if running != self.process_state[name]:
+                self.set_process_state(name, running)
+    
+    def set_process_state(self, name, running):
+        """Reconfigure the widgets for one service"""
+        self.process_state[name] = running
+        label = getattr(self, f"{name}_status_label")
+        if running:
+            label.config(text=f"● {SERVICES[name]}: Running", fg="#a6e3a1")
         else:
-            self.backend_status_label.config(text="● Backend: Stopped", fg="#f38ba8")
-            self.stop_backend_btn.config(state="disabled")
-            if self.backend_process and self.backend_process.poll() is not None:
-                self.backend_process = None
+            label.config(text=f"● {SERVICES[name]}: Stopped", fg="#f38ba8")
         
-        if self.frontend_process and self.frontend_process.poll() is None:
-            self.frontend_status_label.config(text="● Frontend: Running", fg="#a6e3a1")
-        else:
-            self.frontend_status_label.config(text="● Frontend: Stopped", fg="#f38ba8")
-            if self.frontend_process and self.frontend_process.poll() is not None:
-                self.frontend_process = None
+        stop_btn = getattr(self, f"stop_{name}_btn", None)  # Frontend stops with the backend
+        if stop_btn:
+            stop_btn.config(state="normal" if running else "disabled")
         
-        if self.discord_process and self.discord_process.poll() is None:
-            self.discord_status_label.config(text="● Discord Bot: Running", fg="#a6e3a1")
-            self.stop_discord_btn.config(state="normal")
-        else:
-            self.discord_status_label.config(text="● Discord Bot: Stopped", fg="#f38ba8")
-            self.stop_discord_btn.config(state="disabled")
-            if self.discord_process and self.discord_process.poll() is not None:
-                self.discord_process = None
-        
-        # Update stop all button
-        if self.backend_process or self.discord_process or self.frontend_process:
-            self.stop_all_btn.config(state="normal")
-        else:
-            self.stop_all_btn.config(state="disabled")
+        any_running = any(self.process_state.values())
+        if any_running != self.stop_all_enabled:
+            self.stop_all_enabled = any_running
+            self.stop_all_btn.config(state="normal" if any_running else "disabled")
     
-    def launch_backend(self):
-        """Launch the FastAPI backend"""
-        # Check if already running
-        if self.backend_process:
-            if self.backend_process.poll() is None:
-                self.log_message("⚠️ Backend is already running")
-                return
-            else:
-                # Process ended, clear it
-                self.backend_process = None
-        
-        # Update backend_dir from entry field
-        self.backend_dir = Path(self.dir_entry.get())
+    def watch_processes(self):
+        """Poll the services once a second (worker thread) and report flips to the Tk loop"""
+        while True:
+            if any(self.is_running(name) != self.process_state[name] for name in SERVICES):
+                try:
+                    self.root.after_idle(self.update_status)
+                except (RuntimeError, tk.TclError):
+                    return  # Window closed
+            time.sleep(1)
+    
+    def show_error(self, title, message):
+        """Show an error dialog (messagebox is only imported when one is needed)"""
+        from tkinter import messagebox
+        messagebox.showerror(title, message)
+    
+    def set_backend_dir(self, backend_dir):
+        """Set the backend directory and rebuild the paths derived from it"""
+        if backend_dir == self.backend_dir:
+            return
+        self.backend_dir = backend_dir
+        self.backend_files = {name: backend_dir / name for name in ("main.py", "discord_bot.py")}
+        self.frontend_dir = backend_dir.parent / "frontend"
+        self.frontend_pkg = self.frontend_dir / "package.json"
+        self.db_candidate_paths = [backend_dir / path for path in DB_CANDIDATES] + list(FALLBACK_DB_PATHS)
+    
+    def check_backend_dir(self, required_file):
+        """Take the backend directory from the entry field and check it has required_file"""
+        self.set_backend_dir(Path(self.dir_entry.get()))
         self.save_config()
         
-        # Verify directory exists
         if not self.backend_dir.exists():
             self.log_message(f"❌ Backend directory not found: {self.backend_dir}")
-            messagebox.showerror("Directory Not Found", f"Backend directory does not exist:\n{self.backend_dir}")
-            return
+            self.show_error("Directory Not Found", f"Backend directory does not exist:\n{self.backend_dir}")
+            return False
         
-        if not (self.backend_dir / "main.py").exists():
-            self.log_message(f"❌ main.py not found in: {self.backend_dir}")
-            messagebox.showerror("File Not Found", f"main.py not found in:\n{self.backend_dir}")
-            return
+        if not self.backend_files[required_file].exists():
+            self.log_message(f"❌ {required_file} not found in: {self.backend_dir}")
+            self.show_error("File Not Found", f"{required_file} not found in:\n{self.backend_dir}")
+            return False
         
-        self.log_message("🚀 Launching Backend...")
-        self.log_message(f"Using directory: {self.backend_dir}")
+        return True
+    
+    def spawn_service(self, name, argv, cwd, started_message, on_started=None):
+        """Start a service process on a worker thread and stream its output to the log"""
+        label = SERVICES[name]
         
         def run():
             try:
-                # Find Python executable
-                import shutil
-                python_exe = shutil.which("python")
-                if not python_exe:
-                    python_exe = shutil.which("python3")
-                if not python_exe:
-                    python_exe = sys.executable
-                
-                self.log_message(f"Using Python: {python_exe}")
-                
-                # Use CREATE_NO_WINDOW on Windows to prevent console popup but avoid window-close errors
-                creation_flags = 0
-                if sys.platform == "win32":
-                    creation_flags = 0x08000000  # CREATE_NO_WINDOW
-                
-                # Launch uvicorn
-                self.backend_process = subprocess.Popen(
-                    [python_exe, "-m", "uvicorn", "main:app", "--reload", "--host", "0.0.0.0", "--port", "8000"],
-                    cwd=self.backend_dir,
+                process = subprocess.Popen(
+                    argv,
+                    cwd=cwd,
                     stdout=subprocess.PIPE,
                     stderr=subprocess.STDOUT,
-                    text=True,
-                    bufsize=1,
-                    creationflags=creation_flags
+                    bufsize=0,  # Raw pipe; read in bulk with os.read below
+                    creationflags=CREATE_NO_WINDOW
                 )
+                setattr(self, f"{name}_process", process)
                 
-                self.log_message("✅ Backend started on http://localhost:8000")
-                self.root.after(100, self.update_status)
+                self.log_message(started_message)
+                self.root.after_idle(self.update_status)
+                if on_started:
+                    on_started()
                 
-                # Also launch frontend
-                self.root.after(1500, self.launch_frontend)
+                splitter = OutputSplitter(label)
+                fd = process.stdout.fileno()
+                if MULTIPLEX_PIPES:
+                    os.set_blocking(fd, False)
+                    # Register the file object so the pipe stays open until its EOF is read
+                    self.stdout_selector.register(process.stdout, selectors.EVENT_READ, data=splitter)
+                    return
                 
-                # Read output
+                # One read syscall per chunk, returning whatever output is available
                 try:
-                    for line in self.backend_process.stdout:
-                        self.log_message(f"[Backend] {line.strip()}")
+                    while True:
+                        chunk = os.read(fd, 65536)
+                        if not chunk:
+                            break
+                        lines = splitter.feed(chunk)
+                        if lines:
+                            self.log_messages(lines)
+                    lines = splitter.flush()
+                    if lines:
+                        self.log_messages(lines)
                 except:
                     pass
                 
             except Exception as e:
-                self.log_message(f"❌ Error launching backend: {e}")
-                self.backend_process = None
-                self.root.after(100, self.update_status)
+                self.log_message(f"❌ Error launching {label}: {e}")
+                setattr(self, f"{name}_process", None)
+                self.root.after_idle(self.update_status)
         
-        threading.Thread(target=run, daemon=True).start()
-        self.root.after(500, self.update_status)
+        self.pool.submit(run)
+    
+    def read_pipes(self):
+        """Drain every registered service pipe from one thread (worker thread)"""
+        while True:
+            try:
+                events = self.stdout_selector.select(timeout=0.2)
+            except OSError:
+                time.sleep(0.2)
+                continue
+            
+            for key, _ in events:
+                splitter = key.data
+                try:
+                    chunk = os.read(key.fd, 65536)
+                except BlockingIOError:
+                    continue
+                except OSError:
+                    chunk = b""
+                
+                if chunk:
+                    lines = splitter.feed(chunk)
+                else:
+                    # Service exited and closed its end of the pipe
+                    self.stdout_selector.unregister(key.fileobj)
+                    key.fileobj.close()
+                    lines = splitter.flush()
+                if lines:
+                    self.log_messages(lines)
+    
+    def launch_backend(self):
+        """Launch the FastAPI backend"""
+        if self.is_running('backend'):
+            self.log_message("⚠️ Backend is already running")
+            return
+        if not self.check_backend_dir("main.py"):
+            return
+        
+        self.log_message("🚀 Launching Backend...")
+        self.log_message(f"Using directory: {self.backend_dir}")
+        self.log_message(f"Using Python: {self.python_exe}")
+        self.spawn_service(
+            'backend',
+            [self.python_exe, "-m", "uvicorn", "main:app", "--reload", "--host", "0.0.0.0", "--port", "8000"],
+            self.backend_dir,
+            "✅ Backend started on http://localhost:8000",
+            # Also launch frontend
+            on_started=lambda: self.root.after(1500, self.launch_frontend)
+        )
     
     def launch_frontend(self):
         """Launch the Vite frontend"""
-        # Check if already running
-        if self.frontend_process:
-            if self.frontend_process.poll() is None:
-                self.log_message("⚠️ Frontend is already running")
-                return
-            else:
-                self.frontend_process = None
+        if self.is_running('frontend'):
+            self.log_message("⚠️ Frontend is already running")
+            return
         
-        # Get frontend directory
-        frontend_dir = self.backend_dir.parent / "frontend"
+        frontend_dir = self.frontend_dir
         if not frontend_dir.exists():
             self.log_message(f"⚠️ Frontend directory not found: {frontend_dir}")
             return
         
-        if not (frontend_dir / "package.json").exists():
+        if not self.frontend_pkg.exists():
             self.log_message(f"⚠️ package.json not found in: {frontend_dir}")
             return
         
+        if not self.npm_exe:
+            self.log_message("❌ npm not found in PATH")
+            return
+        
         self.log_message("🌐 Launching Frontend...")
         self.log_message(f"Using directory: {frontend_dir}")
-        
-        def run():
-            try:
-                # Find npm executable
-                import shutil
-                npm_exe = shutil.which("npm")
-                if not npm_exe:
-                    self.log_message("❌ npm not found in PATH")
-                    return
-                
-                self.log_message(f"Using npm: {npm_exe}")
-                
-                # Use CREATE_NO_WINDOW on Windows
-                creation_flags = 0
-                if sys.platform == "win32":
-                    creation_flags = 0x08000000  # CREATE_NO_WINDOW
-                
-                # Launch vite dev server
-                self.frontend_process = subprocess.Popen(
-                    [npm_exe, "run", "dev"],
-                    cwd=frontend_dir,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.STDOUT,
-                    text=True,
-                    bufsize=1,
-                    creationflags=creation_flags
-                )
-                
-                self.log_message("✅ Frontend started on http://localhost:5173")
-                self.root.after(100, self.update_status)
-                
-                # Read output
-                try:
-                    for line in self.frontend_process.stdout:
-                        self.log_message(f"[Frontend] {line.strip()}")
-                except:
-                    pass
-                
-            except Exception as e:
-                self.log_message(f"❌ Error launching frontend: {e}")
-                self.frontend_process = None
-                self.root.after(100, self.update_status)
-        
-        threading.Thread(target=run, daemon=True).start()
-        self.root.after(500, self.update_status)
+        self.log_message(f"Using npm: {self.npm_exe}")
+        self.spawn_service(
+            'frontend',
+            [self.npm_exe, "run", "dev"],
+            frontend_dir,
+            "✅ Frontend started on http://localhost:5173"
+        )
     
     def launch_discord(self):
         """Launch the Discord bot"""
-        # Check if already running
-        if self.discord_process:
-            if self.discord_process.poll() is None:
-                self.log_message("⚠️ Discord bot is already running")
-                return
-            else:
-                # Process ended, clear it
-                self.discord_process = None
-        
-        # Update backend_dir from entry field
-        self.backend_dir = Path(self.dir_entry.get())
-        self.save_config()
-        
-        # Verify directory exists
-        if not self.backend_dir.exists():
-            self.log_message(f"❌ Backend directory not found: {self.backend_dir}")
-            messagebox.showerror("Directory Not Found", f"Backend directory does not exist:\n{self.backend_dir}")
+        if self.is_running('discord'):
+            self.log_message("⚠️ Discord bot is already running")
             return
-        
-        if not (self.backend_dir / "discord_bot.py").exists():
-            self.log_message(f"❌ discord_bot.py not found in: {self.backend_dir}")
-            messagebox.showerror("File Not Found", f"discord_bot.py not found in:\n{self.backend_dir}")
+        if not self.check_backend_dir("discord_bot.py"):
             return
         
         self.log_message("💬 Launching Discord Bot...")
         self.log_message(f"Using directory: {self.backend_dir}")
-        
-        def run():
-            try:
-                # Find Python executable
-                import shutil
-                python_exe = shutil.which("python")
-                if not python_exe:
-                    python_exe = shutil.which("python3")
-                if not python_exe:
-                    python_exe = sys.executable
-                
-                self.log_message(f"Using Python: {python_exe}")
-                
-                # Use CREATE_NO_WINDOW on Windows to prevent console popup but avoid window-close errors
-                creation_flags = 0
-                if sys.platform == "win32":
-                    creation_flags = 0x08000000  # CREATE_NO_WINDOW
-                
-                # Launch discord bot
-                self.discord_process = subprocess.Popen(
-                    [python_exe, "discord_bot.py"],
-                    cwd=self.backend_dir,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.STDOUT,
-                    text=True,
-                    bufsize=1,
-                    creationflags=creation_flags
-                )
-                
-                self.log_message("✅ Discord bot started")
-                self.root.after(100, self.update_status)
-                
-                # Read output
-                try:
-                    for line in self.discord_process.stdout:
-                        self.log_message(f"[Discord] {line.strip()}")
-                except:
-                    pass
-                
-            except Exception as e:
-                self.log_message(f"❌ Error launching Discord bot: {e}")
-                self.discord_process = None
-                self.root.after(100, self.update_status)
-        
-        threading.Thread(target=run, daemon=True).start()
-        self.root.after(500, self.update_status)
+        self.log_message(f"Using Python: {self.python_exe}")
+        self.spawn_service(
+            'discord',
+            [self.python_exe, "discord_bot.py"],
+            self.backend_dir,
+            "✅ Discord bot started"
+        )
     
     def launch_both(self):
         """Launch both backend and Discord bot"""
@@ -736,71 +810,73 @@ class NovaLauncher:
         self.launch_backend()
         self.root.after(1000, self.launch_discord)  # Delay Discord bot slightly
     
+    def stop_service(self, name):
+        """Stop one service; the terminate/wait runs on the pool and its future is returned"""
+        process = getattr(self, f"{name}_process")
+        if not (process and process.poll() is None):
+            return None
+        
+        setattr(self, f"{name}_process", None)
+        self.log_message(f"⏹ Stopping {SERVICES[name]}...")
+        return self.pool.submit(self.terminate_process, name, process)
+    
+    def terminate_process(self, name, process):
+        """Terminate a process, killing it if it ignores that for 5 seconds (worker thread)"""
+        process.terminate()
+        try:
+            process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+        self.log_message(f"✅ {SERVICES[name]} stopped")
+    
     def stop_backend(self):
-        """Stop the backend"""
-        if self.backend_process and self.backend_process.poll() is None:
-            self.log_message("⏹ Stopping backend...")
-            self.backend_process.terminate()
-            try:
-                self.backend_process.wait(timeout=5)
-            except subprocess.TimeoutExpired:
-                self.backend_process.kill()
-            self.backend_process = None
-            self.log_message("✅ Backend stopped")
-            
-            # Also stop frontend
-            if self.frontend_process:
-                self.stop_frontend()
+        """Stop the backend (and the frontend with it)"""
+        futures = [self.stop_service('backend'), self.stop_service('frontend')]
         self.update_status()
+        return [future for future in futures if future]
     
     def stop_frontend(self):
         """Stop the frontend"""
-        if self.frontend_process and self.frontend_process.poll() is None:
-            self.log_message("⏹ Stopping frontend...")
-            self.frontend_process.terminate()
-            try:
-                self.frontend_process.wait(timeout=5)
-            except subprocess.TimeoutExpired:
-                self.frontend_process.kill()
-            self.frontend_process = None
-            self.log_message("✅ Frontend stopped")
+        future = self.stop_service('frontend')
         self.update_status()
+        return [future] if future else []
     
     def stop_discord(self):
         """Stop the Discord bot"""
-        if self.discord_process and self.discord_process.poll() is None:
-            self.log_message("⏹ Stopping Discord bot...")
-            self.discord_process.terminate()
-            try:
-                self.discord_process.wait(timeout=5)
-            except subprocess.TimeoutExpired:
-                self.discord_process.kill()
-            self.discord_process = None
-            self.log_message("✅ Discord bot stopped")
+        future = self.stop_service('discord')
         self.update_status()
+        return [future] if future else []
     
     def stop_all(self):
-        """Stop all services"""
+        """Stop all services in parallel; returns the stop futures"""
         self.log_message("⏹ Stopping all services...")
-        self.stop_backend()
-        self.stop_frontend()
-        self.stop_discord()
+        return self.stop_backend() + self.stop_discord()
     
     def on_closing(self):
         """Handle window close event"""
         if self.backend_process or self.discord_process or self.frontend_process:
+            from tkinter import messagebox
             response = messagebox.askyesno(
                 "Confirm Exit",
                 "Services are still running. Stop all services and exit?"
             )
             if response:
-                self.stop_all()
-                self.root.destroy()
+                # Wait for the processes to go down so none are orphaned
+                wait(self.stop_all())
+                self.shutdown()
         else:
-            self.root.destroy()
+            self.shutdown()
+    
+    def shutdown(self):
+        """Release the monitor connection and worker pool, then close the window"""
+        with self.monitor_lock:
+            self.close_monitor_connection()
+        self.pool.shutdown(wait=False, cancel_futures=True)
+        self.root.destroy()
     
-    def refresh_monitor(self):
-        """Refresh Nova monitor stats"""
+    def refresh_monitor(self, read_db=True):
+        """Refresh Nova monitor stats (database reads run on a worker thread); True if a read started"""
         try:
             # Update uptime
             if hasattr(self, 'start_time'):
@@ -809,102 +885,219 @@ class NovaLauncher:
                 minutes, seconds = divmod(remainder, 60)
                 self.stats_labels['uptime'].config(text=f"⏱️ Uptime: {hours}:{minutes:02d}:{seconds:02d}")
             
-            # Try multiple possible database locations
-            possible_db_paths = [
-                self.backend_dir / "chatbot.db",
-                self.backend_dir / "nova.db",
-                self.backend_dir / "data" / "chatbot.db",
-                self.backend_dir / "data" / "nova.db",
-                Path("h:/TheAI/backend/chatbot.db"),
-                Path("h:/TheAI/backend/nova.db"),
-            ]
-            
-            db_path = None
-            for path in possible_db_paths:
-                if path.exists():
-                    db_path = path
-                    break
-            
-            if db_path and db_path.exists():
-                import sqlite3
-                try:
-                    conn = sqlite3.connect(str(db_path))
-                    cursor = conn.cursor()
-                    
-                    # Check if tables exist
-                    cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
-                    tables = [row[0] for row in cursor.fetchall()]
-                    
-                    # Handle both 'conversations' and 'messages' table names
-                    message_table = 'conversations' if 'conversations' in tables else 'messages' if 'messages' in tables else None
+            # Skip this tick if the previous read is still running (slow disk or locked DB)
+            if read_db and self.monitor_lock.acquire(blocking=False):
+                self.pool.submit(self.monitor_worker)
+                return True
+        except Exception as e:
+            self.log_message(f"⚠️ Monitor refresh error: {e}")
+        return False
+    
+    def monitor_worker(self):
+        """Read monitor stats from the database and hand them to the Tk loop"""
+        try:
+            stats = self.read_monitor_stats()
+        except Exception as e:
+            stats = {'labels': {}, 'activity': None}
+            self.log_message(f"⚠️ Monitor refresh error: {e}")
+        finally:
+            self.monitor_lock.release()
+        
+        try:
+            self.root.after_idle(self.apply_monitor_stats, stats)
+        except (RuntimeError, tk.TclError):
+            pass  # Window closed
+    
+    def read_monitor_stats(self):
+        """Collect label texts and activity text for the monitor (no Tk calls)"""
+        labels = {}
+        activity = None
+        db_path = self.find_db_path()
+        
+        if db_path:
+            try:
+                cursor = self.monitor_connection(db_path).cursor()
+                tables = self.monitor_tables(cursor)
+                
+                # Handle both 'conversations' and 'messages' table names
+                message_table = 'conversations' if 'conversations' in tables else 'messages' if 'messages' in tables else None
+                
+                if message_table:
+                    # Get conversation count
+                    conv_count = self.conversation_count(cursor, message_table)
+                    labels['conversations'] = f"💬 Total Conversations: {conv_count}"
                     
-                    if message_table:
-                        # Get conversation count
-                        cursor.execute(f"SELECT COUNT(DISTINCT session_id) FROM {message_table}")
-                        conv_count = cursor.fetchone()[0]
-                        self.stats_labels['conversations'].config(text=f"💬 Total Conversations: {conv_count}")
-                        
-                        # Get last message
-                        cursor.execute(f"SELECT role, content, timestamp FROM {message_table} ORDER BY timestamp DESC LIMIT 1")
-                        last_msg = cursor.fetchone()
-                        if last_msg:
-                            role, content, timestamp = last_msg
-                            preview = content[:50] + "..." if len(content) > 50 else content
-                            self.stats_labels['last_message'].config(text=f"💭 Last: [{role}] {preview}")
-                        else:
-                            self.stats_labels['last_message'].config(text=f"💭 Last Message: No messages yet")
-                        
-                        # Get recent activity
-                        cursor.execute(f"""
-                            SELECT role, content, timestamp 
-                            FROM {message_table}
-                            ORDER BY timestamp DESC 
-                            LIMIT 10
-                        """)
-                        activities = cursor.fetchall()
-                        
-                        self.activity_text.delete(1.0, tk.END)
-                        if activities:
-                            for role, content, timestamp in activities:
-                                preview = content[:80] + "..." if len(content) > 80 else content
-                                self.activity_text.insert(tk.END, f"[{timestamp}] {role}: {preview}\n\n")
-                        else:
-                            self.activity_text.insert(tk.END, "No activity yet. Start chatting with Nova!\n")
+                    # Get last message
+                    cursor.execute(f"SELECT role, content, timestamp FROM {message_table} ORDER BY timestamp DESC LIMIT 1")
+                    last_msg = cursor.fetchone()
+                    if last_msg:
+                        role, content, timestamp = last_msg
+                        preview = content[:50] + "..." if len(content) > 50 else content
+                        labels['last_message'] = f"💭 Last: [{role}] {preview}"
                     else:
-                        self.stats_labels['conversations'].config(text="💬 Database empty")
+                        labels['last_message'] = f"💭 Last Message: No messages yet"
                     
-                    # Get learned facts count
-                    if 'learned_facts' in tables:
-                        cursor.execute("SELECT COUNT(*) FROM learned_facts")
-                        facts_count = cursor.fetchone()[0]
-                        self.stats_labels['memory_usage'].config(text=f"🧠 Learned Facts: {facts_count}")
-                    else:
-                        self.stats_labels['memory_usage'].config(text=f"🧠 Learned Facts: 0")
+                    # Get recent activity
+                    cursor.execute(f"""
+                        SELECT role, content, timestamp 
+                        FROM {message_table}
+                        ORDER BY timestamp DESC 
+                        LIMIT 10
+                    """)
+                    activities = cursor.fetchall()
                     
-                    conn.close()
-                except Exception as e:
-                    self.activity_text.delete(1.0, tk.END)
-                    self.activity_text.insert(tk.END, f"Error reading database: {e}\n")
-                    self.log_message(f"⚠️ Monitor error: {e}")
-            else:
-                self.stats_labels['conversations'].config(text="💬 Database not found")
-                self.stats_labels['last_message'].config(text="💭 Start the backend to create database")
-                self.stats_labels['memory_usage'].config(text=f"🧠 Database not initialized")
-                self.activity_text.delete(1.0, tk.END)
-                self.activity_text.insert(tk.END, "Database not found. Make sure:\n")
-                self.activity_text.insert(tk.END, "1. Backend directory is set correctly\n")
-                self.activity_text.insert(tk.END, "2. Backend has been launched at least once\n")
-                self.activity_text.insert(tk.END, f"3. Looking for: {self.backend_dir}/chatbot.db\n")
-                self.activity_text.insert(tk.END, f"\nChecked locations:\n")
-                for path in possible_db_paths:
-                    self.activity_text.insert(tk.END, f"  - {path} {'✓' if path.exists() else '✗'}\n")
-        except Exception as e:
-            self.log_message(f"⚠️ Monitor refresh error: {e}")
+                    # Build the pane text first so the widget gets a single insert
+                    lines = []
+                    for role, content, timestamp in activities:
+                        preview = content[:80] + "..." if len(content) > 80 else content
+                        lines.append(f"[{timestamp}] {role}: {preview}\n\n")
+                    activity = "".join(lines) or "No activity yet. Start chatting with Nova!\n"
+                else:
+                    labels['conversations'] = "💬 Database empty"
+                
+                # Get learned facts count
+                if 'learned_facts' in tables:
+                    facts_count = self.facts_count(cursor)
+                    labels['memory_usage'] = f"🧠 Learned Facts: {facts_count}"
+                else:
+                    labels['memory_usage'] = f"🧠 Learned Facts: 0"
+            except Exception as e:
+                self.close_monitor_connection()  # Reconnect on the next refresh
+                activity = f"Error reading database: {e}\n"
+                self.log_message(f"⚠️ Monitor error: {e}")
+        else:
+            labels['conversations'] = "💬 Database not found"
+            labels['last_message'] = "💭 Start the backend to create database"
+            labels['memory_usage'] = f"🧠 Database not initialized"
+            lines = [
+                "Database not found. Make sure:\n",
+                "1. Backend directory is set correctly\n",
+                "2. Backend has been launched at least once\n",
+                f"3. Looking for: {self.backend_dir}/chatbot.db\n",
+                "\nChecked locations:\n",
+            ]
+            for path in self.db_candidates():
+                lines.append(f"  - {path} {'✓' if path.exists() else '✗'}\n")
+            activity = "".join(lines)
+        
+        return {'labels': labels, 'activity': activity}
+    
+    def apply_monitor_stats(self, stats):
+        """Show stats collected by monitor_worker (Tk thread only)"""
+        for key, text in stats['labels'].items():
+            self.stats_labels[key].config(text=text)
+        if stats['activity'] is not None:
+            self.set_activity_text(stats['activity'])
+    
+    def db_candidates(self):
+        """Possible database locations for the current backend directory"""
+        return self.db_candidate_paths
+    
+    def find_db_path(self):
+        """Locate the database, reusing the last hit while it still exists"""
+        if self.db_path and self.db_path_dir == self.backend_dir and self.db_path.exists():
+            return self.db_path
+        
+        self.db_path = next((path for path in self.db_candidates() if path.exists()), None)
+        self.db_path_dir = self.backend_dir
+        return self.db_path
+    
+    def monitor_connection(self, db_path):
+        """Open the monitor's read-only connection, or reuse it for the same database"""
+        if self.db_conn is None or self.db_conn_path != db_path:
+            self.close_monitor_connection()
+            self.db_conn = sqlite3.connect(str(db_path), check_same_thread=False)
+            self.db_conn.execute("PRAGMA query_only=1")
+            self.db_conn.execute("PRAGMA temp_store=MEMORY")
+            self.db_conn.execute("PRAGMA mmap_size=268435456")  # Read pages via mmap, up to 256 MB
+            self.db_conn_path = db_path
+        return self.db_conn
+    
+    def close_monitor_connection(self):
+        """Close the monitor's connection and forget what it cached"""
+        if self.db_conn is not None:
+            try:
+                self.db_conn.close()
+            except Exception:
+                pass
+        self.db_conn = None
+        self.db_conn_path = None
+        self.db_tables = None
+        self.count_cache = self.empty_count_cache()
+    
+    def empty_count_cache(self):
+        """Fresh monitor counts; -1 forces the first read"""
+        return {'messages_maxrowid': -1, 'session_ids': set(), 'facts_maxrowid': -1, 'facts_count': 0}
+    
+    def conversation_count(self, cursor, message_table):
+        """Distinct sessions, reading only rows added since the last refresh when rows were only appended"""
+        cache = self.count_cache
+        cursor.execute(f"SELECT MAX(rowid) FROM {message_table}")
+        max_rowid = cursor.fetchone()[0] or 0
+        if max_rowid <= cache['messages_maxrowid']:
+            # The database changed without new messages (e.g. !clear deleted a session); count again from scratch
+            cache['messages_maxrowid'] = -1
+            cache['session_ids'].clear()
+        cursor.execute(
+            f"SELECT DISTINCT session_id FROM {message_table} WHERE rowid > ? AND session_id IS NOT NULL",
+            (cache['messages_maxrowid'],)
+        )
+        cache['session_ids'].update(row[0] for row in cursor.fetchall())
+        cache['messages_maxrowid'] = max_rowid
+        return len(cache['session_ids'])
+    
+    def facts_count(self, cursor):
+        """Learned facts count, adding only new rows when rows were only appended"""
+        cache = self.count_cache
+        cursor.execute("SELECT MAX(rowid) FROM learned_facts")
+        max_rowid = cursor.fetchone()[0] or 0
+        if max_rowid <= cache['facts_maxrowid']:
+            # Changed without new facts, so rows may have been deleted; count again from scratch
+            cache['facts_maxrowid'] = -1
+            cache['facts_count'] = 0
+        cursor.execute("SELECT COUNT(*) FROM learned_facts WHERE rowid > ?", (cache['facts_maxrowid'],))
+        cache['facts_count'] += cursor.fetchone()[0]
+        cache['facts_maxrowid'] = max_rowid
+        return cache['facts_count']
+    
+    def monitor_tables(self, cursor):
+        """Table names in the monitored database, re-read only when db_signature() changes"""
+        signature = self.db_signature()
+        if self.db_tables is not None and self.db_tables[0] == signature:
+            return self.db_tables[1]
+        
+        cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
+        tables = [row[0] for row in cursor.fetchall()]
+        self.db_tables = (signature, tables)
+        return tables
+    
+    def set_activity_text(self, text):
+        """Replace the activity pane contents with one delete and one insert"""
+        self.activity_text.delete(1.0, tk.END)
+        self.activity_text.insert(tk.END, text)
+    
+    def db_signature(self):
+        """Path, mtime and size of the database and its WAL file; changes whenever either is written"""
+        db_path = self.find_db_path()
+        if not db_path:
+            return None
+        
+        signature = [db_path]
+        # In WAL mode commits land in the -wal file until a checkpoint touches the main file
+        for path in (db_path, db_path.with_name(db_path.name + "-wal")):
+            try:
+                stat = path.stat()
+                signature += [stat.st_mtime_ns, stat.st_size]
+            except OSError:
+                signature += [None, None]
+        return tuple(signature)
     
     def schedule_monitor_refresh(self):
-        """Schedule periodic monitor refresh"""
-        self.refresh_monitor()
-        self.root.after(5000, self.schedule_monitor_refresh)  # Refresh every 5 seconds
+        """Schedule a monitor refresh every second, reading the database only when it changed"""
+        signature = self.db_signature()
+        if self.refresh_monitor(read_db=signature != self.db_signature_seen):
+            self.db_signature_seen = signature
+        self.root.after(1000, self.schedule_monitor_refresh)
 
 
 def main():
@@ -2,11 +2,13 @@
 Learning System for Nova - Memory, preferences, and adaptive behavior
 """
 
+import atexit
+import copy
 import json
 import os
+import threading
 from datetime import datetime
 from typing import Dict, List, Optional
-import asyncio
 from pathlib import Path
 
 class LearningSystem:
@@ -23,6 +25,16 @@ class LearningSystem:
         self.interaction_stats = {}  # user_id -> stats
         self.topics_of_interest = {}  # user_id -> topics
         self.conversation_patterns = {}  # user_id -> patterns
+        self.data_versions = {}  # user_id -> counter bumped on every change (for caches)
+        # Held by every mutation and by the flush while it snapshots a user
+        self.data_lock = threading.Lock()
+        
+        # Debounced saves: changed users are written together at most flush_delay after the first edit
+        self.dirty_users = set()
+        self.flush_timer = None
+        self.flush_delay = 0.5  # Seconds from the first unsaved edit to the write
+        self.flush_lock = threading.Lock()  # Guards dirty_users and flush_timer
+        self.file_lock = threading.Lock()  # Held while user files are written or deleted
         
         # Learning settings
         self.learning_enabled = True
@@ -31,6 +43,9 @@ class LearningSystem:
         
         # Load existing data
         self._load_all_data()
+        
+        # Write anything still pending on shutdown
+        atexit.register(self.close)
     
     def _get_user_file(self, user_id: int) -> Path:
         """Get the file path for a user's data"""
@@ -52,54 +67,110 @@ class LearningSystem:
             except Exception as e:
                 print(f"⚠️ Error loading user data from {file}: {e}")
     
+    def _bump_version(self, user_id: int):
+        """Mark a user's learned data as changed"""
+        self.data_versions[user_id] = self.data_versions.get(user_id, 0) + 1
+    
+    def get_data_version(self, user_id: int) -> int:
+        """Get a counter that changes whenever the user's learned data changes"""
+        return self.data_versions.get(user_id, 0)
+    
     def _save_user_data(self, user_id: int):
-        """Save a user's data to disk"""
+        """Mark a user's data for saving; the write happens within flush_delay"""
         if not self.learning_enabled:
             return
         
-        try:
-            data = {
+        with self.flush_lock:
+            self.dirty_users.add(user_id)
+            self._schedule_flush()
+    
+    def _schedule_flush(self):
+        """Start the flush timer unless one is already pending (call with flush_lock held)"""
+        if self.flush_timer is not None:
+            return
+        self.flush_timer = threading.Timer(self.flush_delay, self._flush_all)
+        self.flush_timer.daemon = True
+        self.flush_timer.start()
+    
+    def _flush_all(self):
+        """Write every dirty user's file once"""
+        with self.file_lock:
+            with self.flush_lock:
+                self.flush_timer = None
+                dirty_users = self.dirty_users
+                self.dirty_users = set()
+            
+            failed = [user_id for user_id in dirty_users if not self._write_user_data(user_id)]
+            
+            # Retry failed writes later (e.g. a full disk)
+            if failed:
+                with self.flush_lock:
+                    self.dirty_users.update(failed)
+                    self._schedule_flush()
+    
+    def _snapshot_user_data(self, user_id: int) -> Dict:
+        """Copy a user's data so it can be serialized while the event loop keeps editing it"""
+        with self.data_lock:
+            return copy.deepcopy({
                 'profile': self.user_profiles.get(user_id, {}),
                 'facts': self.learned_facts.get(user_id, []),
                 'preferences': self.preferences.get(user_id, {}),
                 'stats': self.interaction_stats.get(user_id, {}),
                 'topics': self.topics_of_interest.get(user_id, {}),
                 'patterns': self.conversation_patterns.get(user_id, {}),
-                'last_updated': datetime.now().isoformat()
-            }
+            })
+    
+    def _write_user_data(self, user_id: int) -> bool:
+        """Write a user's data to disk (call with file_lock held)"""
+        try:
+            data = self._snapshot_user_data(user_id)
+            data['last_updated'] = datetime.now().isoformat()
             
+            # Serialize before opening so a failure can't leave a truncated file
+            text = json.dumps(data, indent=2, ensure_ascii=False)
             file_path = self._get_user_file(user_id)
             with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+                f.write(text)
+            return True
         except Exception as e:
             print(f"⚠️ Error saving user data: {e}")
+            return False
+    
+    def close(self):
+        """Stop the flush timer and write pending changes now"""
+        with self.flush_lock:
+            if self.flush_timer is not None:
+                self.flush_timer.cancel()
+        self._flush_all()
     
     def learn_fact(self, user_id: int, fact: str, category: str = "general"):
         """Learn a new fact about a user"""
         if not self.learning_enabled:
             return False
         
-        if user_id not in self.learned_facts:
-            self.learned_facts[user_id] = []
-        
-        # Check if fact already exists
-        existing_facts = [f['fact'].lower() for f in self.learned_facts[user_id]]
-        if fact.lower() in existing_facts:
-            return False
-        
-        # Add new fact
-        fact_entry = {
-            'fact': fact,
-            'category': category,
-            'learned_at': datetime.now().isoformat(),
-            'confidence': 1.0
-        }
-        
-        self.learned_facts[user_id].append(fact_entry)
-        
-        # Limit number of facts
-        if len(self.learned_facts[user_id]) > self.max_facts_per_user:
-            self.learned_facts[user_id] = self.learned_facts[user_id][-self.max_facts_per_user:]
+        with self.data_lock:
+            if user_id not in self.learned_facts:
+                self.learned_facts[user_id] = []
+            
+            # Check if fact already exists
+            existing_facts = [f['fact'].lower() for f in self.learned_facts[user_id]]
+            if fact.lower() in existing_facts:
+                return False
+            
+            # Add new fact
+            fact_entry = {
+                'fact': fact,
+                'category': category,
+                'learned_at': datetime.now().isoformat(),
+                'confidence': 1.0
+            }
+            
+            self.learned_facts[user_id].append(fact_entry)
+            self._bump_version(user_id)
+            
+            # Limit number of facts
+            if len(self.learned_facts[user_id]) > self.max_facts_per_user:
+                self.learned_facts[user_id] = self.learned_facts[user_id][-self.max_facts_per_user:]
         
         self._save_user_data(user_id)
         return True
@@ -118,10 +189,12 @@ class LearningSystem:
     
     def set_preference(self, user_id: int, key: str, value):
         """Set a user preference"""
-        if user_id not in self.preferences:
-            self.preferences[user_id] = {}
-        
-        self.preferences[user_id][key] = value
+        with self.data_lock:
+            if user_id not in self.preferences:
+                self.preferences[user_id] = {}
+            
+            self.preferences[user_id][key] = value
+            self._bump_version(user_id)
         self._save_user_data(user_id)
     
     def get_preference(self, user_id: int, key: str, default=None):
@@ -133,21 +206,24 @@ class LearningSystem:
     
     def track_interaction(self, user_id: int, interaction_type: str):
         """Track an interaction with a user"""
-        if user_id not in self.interaction_stats:
-            self.interaction_stats[user_id] = {
-                'total_messages': 0,
-                'first_interaction': datetime.now().isoformat(),
-                'last_interaction': datetime.now().isoformat(),
-                'interaction_types': {}
-            }
-        
-        stats = self.interaction_stats[user_id]
-        stats['total_messages'] += 1
-        stats['last_interaction'] = datetime.now().isoformat()
-        
-        if interaction_type not in stats['interaction_types']:
-            stats['interaction_types'][interaction_type] = 0
-        stats['interaction_types'][interaction_type] += 1
+        with self.data_lock:
+            if user_id not in self.interaction_stats:
+                self.interaction_stats[user_id] = {
+                    'total_messages': 0,
+                    'first_interaction': datetime.now().isoformat(),
+                    'last_interaction': datetime.now().isoformat(),
+                    'interaction_types': {}
+                }
+            
+            stats = self.interaction_stats[user_id]
+            stats['total_messages'] += 1
+            stats['last_interaction'] = datetime.now().isoformat()
+            
+            self._bump_version(user_id)
+            
+            if interaction_type not in stats['interaction_types']:
+                stats['interaction_types'][interaction_type] = 0
+            stats['interaction_types'][interaction_type] += 1
         
         # Save periodically (every 10 messages)
         if stats['total_messages'] % 10 == 0:
@@ -155,28 +231,30 @@ class LearningSystem:
     
     def add_topic_interest(self, user_id: int, topic: str, weight: float = 1.0):
         """Track a topic the user is interested in"""
-        if user_id not in self.topics_of_interest:
-            self.topics_of_interest[user_id] = {}
-        
-        topic = topic.lower()
-        
-        if topic in self.topics_of_interest[user_id]:
-            # Increase weight (with diminishing returns)
-            current = self.topics_of_interest[user_id][topic]
-            self.topics_of_interest[user_id][topic] = min(10.0, current + weight * 0.5)
-        else:
-            self.topics_of_interest[user_id][topic] = weight
-        
-        # Limit topics
-        if len(self.topics_of_interest[user_id]) > self.max_topics_per_user:
-            # Remove lowest weighted topics
-            sorted_topics = sorted(
-                self.topics_of_interest[user_id].items(),
-                key=lambda x: x[1],
-                reverse=True
-            )
-            self.topics_of_interest[user_id] = dict(sorted_topics[:self.max_topics_per_user])
-        
+        with self.data_lock:
+            if user_id not in self.topics_of_interest:
+                self.topics_of_interest[user_id] = {}
+            
+            topic = topic.lower()
+            
+            if topic in self.topics_of_interest[user_id]:
+                # Increase weight (with diminishing returns)
+                current = self.topics_of_interest[user_id][topic]
+                self.topics_of_interest[user_id][topic] = min(10.0, current + weight * 0.5)
+            else:
+                self.topics_of_interest[user_id][topic] = weight
+            
+            # Limit topics
+            if len(self.topics_of_interest[user_id]) > self.max_topics_per_user:
+                # Remove lowest weighted topics
+                sorted_topics = sorted(
+                    self.topics_of_interest[user_id].items(),
+                    key=lambda x: x[1],
+                    reverse=True
+                )
+                self.topics_of_interest[user_id] = dict(sorted_topics[:self.max_topics_per_user])
+            
+            self._bump_version(user_id)
         self._save_user_data(user_id)
     
     def get_top_topics(self, user_id: int, limit: int = 10) -> List[tuple]:
@@ -190,10 +268,12 @@ class LearningSystem:
     
     def update_profile(self, user_id: int, **kwargs):
         """Update user profile information"""
-        if user_id not in self.user_profiles:
-            self.user_profiles[user_id] = {}
-        
-        self.user_profiles[user_id].update(kwargs)
+        with self.data_lock:
+            if user_id not in self.user_profiles:
+                self.user_profiles[user_id] = {}
+            
+            self.user_profiles[user_id].update(kwargs)
+            self._bump_version(user_id)
         self._save_user_data(user_id)
     
     def get_profile(self, user_id: int) -> Dict:
@@ -298,17 +378,22 @@ class LearningSystem:
     
     def forget_user(self, user_id: int):
         """Forget all learned information about a user"""
-        self.user_profiles.pop(user_id, None)
-        self.learned_facts.pop(user_id, None)
-        self.preferences.pop(user_id, None)
-        self.interaction_stats.pop(user_id, None)
-        self.topics_of_interest.pop(user_id, None)
-        self.conversation_patterns.pop(user_id, None)
-        
-        # Delete file
-        file_path = self._get_user_file(user_id)
-        if file_path.exists():
-            file_path.unlink()
+        with self.data_lock:
+            self.user_profiles.pop(user_id, None)
+            self.learned_facts.pop(user_id, None)
+            self.preferences.pop(user_id, None)
+            self.interaction_stats.pop(user_id, None)
+            self.topics_of_interest.pop(user_id, None)
+            self.conversation_patterns.pop(user_id, None)
+            self._bump_version(user_id)
+        
+        # Delete file (and drop any pending save so it isn't recreated)
+        with self.file_lock:
+            with self.flush_lock:
+                self.dirty_users.discard(user_id)
+            file_path = self._get_user_file(user_id)
+            if file_path.exists():
+                file_path.unlink()
 
 # Global instance
 learning_system = LearningSystem()
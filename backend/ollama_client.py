@@ -1,6 +1,7 @@
 import aiohttp
 import base64
 import json
+import time
 from typing import Optional, AsyncGenerator
 from config import settings
 
@@ -10,6 +11,9 @@ class OllamaClient:
     def __init__(self):
         self.base_url = settings.ollama_host
         self.model = settings.ollama_model
+        # Last availability probe result and when it was taken (time.monotonic)
+        self._available = False
+        self._available_checked_at = 0.0
         
     async def chat(
         self, 
@@ -189,18 +193,27 @@ class OllamaClient:
                 result = await response.json()
                 return result.get('message', {}).get('content', '')
     
-    async def is_available(self) -> bool:
-        """Check if Ollama is running and model is available"""
+    async def is_available(self, max_age: float = 0.0) -> bool:
+        """Check if Ollama is running and model is available
+        
+        Args:
+            max_age: Reuse the last probe result if it is younger than this many seconds
+        """
+        if max_age and time.monotonic() - self._available_checked_at < max_age:
+            return self._available
+        
+        available = False
         try:
             async with aiohttp.ClientSession() as session:
                 async with session.get(f"{self.base_url}/api/tags") as response:
                     if response.status == 200:
                         data = await response.json()
-                        models = [m['name'] for m in data.get('models', [])]
-                        return any(self.model in m for m in models)
-            return False
+                        available = any(self.model in m['name'] for m in data.get('models', []))
         except:
-            return False
+            available = False
+        self._available = available
+        self._available_checked_at = time.monotonic()
+        return available
 
 # Global instance
 ollama_client = OllamaClient()
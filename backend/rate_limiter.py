@@ -0,0 +1,121 @@
+"""
+Discord rate limit helper - retries 429s with exponential backoff
+Tracks a coarse per-bucket cooldown so bursts of similar actions back off together,
+and paces outgoing messages through per-channel send queues
+"""
+import asyncio
+import random
+import time
+from collections import defaultdict, deque
+from typing import Any, Awaitable, Callable, Deque, Dict, TypeVar
+
+import discord
+
+T = TypeVar("T")
+
+class RateLimiter:
+    """Runs Discord API calls with 429-aware retry and per-bucket cooldowns"""
+
+    def __init__(self, base_delay: float = 1.0, max_delay: float = 60.0):
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.cooldowns: Dict[str, float] = {}  # bucket -> time.monotonic() when calls may resume
+
+    async def _wait_for_bucket(self, bucket: str):
+        """Sleep until the bucket's cooldown has passed"""
+        remaining = self.cooldowns.get(bucket, 0.0) - time.monotonic()
+        if remaining > 0:
+            await asyncio.sleep(remaining)
+
+    async def execute(self, coro_fn: Callable[[], Awaitable[T]], bucket: str = "default", max_attempts: int = 3) -> T:
+        """
+        Await coro_fn(), retrying on HTTP 429
+
+        Args:
+            coro_fn: Zero-argument callable returning the coroutine to run (e.g. request.accept)
+            bucket: Coarse endpoint name sharing a cooldown (e.g. "friend-accept")
+            max_attempts: Total attempts before the 429 is re-raised
+
+        Returns:
+            Whatever coro_fn's coroutine returns
+        """
+        for attempt in range(max_attempts):
+            await self._wait_for_bucket(bucket)
+            try:
+                return await coro_fn()
+            except discord.HTTPException as e:
+                if e.status != 429 or attempt == max_attempts - 1:
+                    raise
+                retry_after = getattr(e, "retry_after", None) or self.base_delay
+                delay = min(retry_after * 2 ** attempt, self.max_delay) + random.uniform(0, 0.25)
+                self.cooldowns[bucket] = time.monotonic() + delay
+                print(f"⏳ Rate limited on '{bucket}', retrying in {delay:.1f}s (attempt {attempt + 1}/{max_attempts})")
+
+# Global instance
+rate_limiter = RateLimiter()
+
+class SendQueue:
+    """Paces Discord sends to N per window per channel, one consumer task per busy channel
+
+    Each channel drains on its own, so a channel waiting out its bucket never
+    holds up replies queued for other channels.
+    """
+
+    def __init__(self, per_channel: int = 5, window: float = 5.0):
+        self.window = window
+        self.buckets: Dict[int, Deque[float]] = defaultdict(lambda: deque(maxlen=per_channel))
+        self.pending: Dict[int, Deque[tuple]] = defaultdict(deque)  # channel_id -> (coro_fn, future)
+        self.tasks: Dict[int, asyncio.Task] = {}
+
+    def _ensure_running(self, channel_id: int):
+        """Start the channel's consumer if it isn't already draining (needs a running loop)"""
+        task = self.tasks.get(channel_id)
+        if task is None or task.done():
+            self.tasks[channel_id] = asyncio.create_task(self._run(channel_id))
+
+    async def _run(self, channel_id: int):
+        pending = self.pending[channel_id]
+        stamps = self.buckets[channel_id]
+        # No await between the emptiness check and returning, so send() can't slip an item in unseen
+        while pending:
+            coro_fn, future = pending.popleft()
+            if future.cancelled():
+                continue
+
+            # Leaky bucket: wait until the oldest of the last N sends leaves the window
+            if len(stamps) == stamps.maxlen:
+                wait = stamps[0] + self.window - time.monotonic()
+                if wait > 0:
+                    await asyncio.sleep(wait)
+            stamps.append(time.monotonic())
+
+            try:
+                result = await rate_limiter.execute(coro_fn, bucket=f"send-{channel_id}")
+            except Exception as e:
+                if not future.done():
+                    future.set_exception(e)
+            else:
+                if not future.done():
+                    future.set_result(result)
+        del self.pending[channel_id]
+        self.tasks.pop(channel_id, None)
+
+    async def send(self, channel_id: int, coro_fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Queue a send and wait for it to go out
+
+        Args:
+            channel_id: Channel the message goes to (pacing key)
+            coro_fn: Zero-argument callable returning the send coroutine
+                (e.g. functools.partial(ctx.reply, text))
+
+        Returns:
+            Whatever the send returns (usually the sent Message); errors are re-raised here
+        """
+        future = asyncio.get_running_loop().create_future()
+        self.pending[channel_id].append((coro_fn, future))
+        self._ensure_running(channel_id)
+        return await future
+
+# Global instance
+send_queue = SendQueue()
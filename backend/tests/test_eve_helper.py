@@ -0,0 +1,44 @@
+"""Search tests for EVEHelper against a small synthetic SDE"""
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from eve_helper import EVEHelper
+
+TYPES = [
+    {'_key': 1, 'name': {'en': 'Canes Venatici'}, 'groupID': 15, 'published': True},
+    {'_key': 2, 'name': {'en': 'Hurricane'}, 'groupID': 419, 'mass': 1067000.0, 'published': True},
+    {'_key': 3, 'name': {'en': 'Hurricane Fleet Issue'}, 'groupID': 419, 'published': True},
+    {'_key': 4, 'name': {'en': 'Caldari Navy Hookbill'}, 'groupID': 25, 'published': True},
+    {'_key': 5, 'name': {'en': 'Unpublished Cane'}, 'groupID': 15, 'published': False},
+]
+
+
+def make_helper(tmp_path):
+    with open(tmp_path / "types.jsonl", 'w', encoding='utf-8') as f:
+        for entry in TYPES:
+            f.write(json.dumps(entry) + '\n')
+    helper = EVEHelper()
+    helper.sde_path = tmp_path
+    return helper
+
+
+def test_search_matches_mid_word(tmp_path):
+    helper = make_helper(tmp_path)
+    names = [item['name'] for item in helper.search_items("cane", limit=5)]
+    assert names == ['Canes Venatici', 'Hurricane', 'Hurricane Fleet Issue']
+
+
+def test_search_short_and_unknown_queries(tmp_path):
+    helper = make_helper(tmp_path)
+    assert [item['name'] for item in helper.search_items("ld", limit=5)] == ['Caldari Navy Hookbill']
+    assert helper.search_items("zzz", limit=5) == []
+
+
+def test_whole_number_columns_come_back_as_ints(tmp_path):
+    helper = make_helper(tmp_path)
+    info = helper.get_item_info(2)
+    assert info['mass'] == 1067000 and type(info['mass']) is int
+    assert info['volume'] is None
@@ -8,6 +8,17 @@ from typing import Optional, List
 from PIL import Image
 import io
 
+# Known video hosts, combined so a URL is scanned once
+VIDEO_URL_RE = re.compile(
+    r'(youtube\.com|youtu\.be)'
+    r'|(twitter\.com|x\.com)/.+/status/.+/video'
+    r'|(tiktok\.com)'
+    r'|(instagram\.com)/.+/reel'
+    r'|(reddit\.com)/.+/comments/.+'
+    r'|(twitch\.tv)',
+    re.IGNORECASE
+)
+
 class VideoAnalyzer:
     """Analyze videos from URLs or Discord attachments"""
     
@@ -17,19 +28,9 @@ class VideoAnalyzer:
         
     def is_video_url(self, url: str) -> bool:
         """Check if URL is a video link"""
-        video_patterns = [
-            r'(youtube\.com|youtu\.be)',
-            r'(twitter\.com|x\.com)/.+/status/.+/video',
-            r'(tiktok\.com)',
-            r'(instagram\.com)/.+/reel',
-            r'(reddit\.com)/.+/comments/.+',
-            r'(twitch\.tv)',
-        ]
-        
         # Check domain patterns
-        for pattern in video_patterns:
-            if re.search(pattern, url, re.IGNORECASE):
-                return True
+        if VIDEO_URL_RE.search(url):
+            return True
         
         # Check file extension
         return any(url.lower().endswith(ext) for ext in self.supported_formats)
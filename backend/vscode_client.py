@@ -1,19 +1,36 @@
 """VS Code Bridge Client - Communicate with Nova VS Code extension"""
+import time
 import aiohttp
 from typing import Optional, Dict, Any
 
 class VSCodeClient:
     def __init__(self, host: str = "localhost", port: int = 3737):
         self.base_url = f"http://{host}:{port}"
+        # Last health probe result and when it was taken (time.monotonic)
+        self._available = False
+        self._available_checked_at = 0.0
+        
+    async def is_available(self, max_age: float = 0.0) -> bool:
+        """Check if VS Code bridge is running
+        
+        Args:
+            max_age: Reuse the last probe result if it is younger than this many seconds
+        """
+        if max_age and time.monotonic() - self._available_checked_at < max_age:
+            return self._available
         
-    async def is_available(self) -> bool:
-        """Check if VS Code bridge is running"""
         try:
             async with aiohttp.ClientSession() as session:
                 async with session.get(f"{self.base_url}/health", timeout=aiohttp.ClientTimeout(total=2)) as response:
-                    return response.status == 200
+                    self._available = response.status == 200
         except:
-            return False
+            self._available = False
+        self._available_checked_at = time.monotonic()
+        return self._available
+    
+    def _invalidate_availability(self):
+        """Force the next is_available() call to probe the bridge again"""
+        self._available_checked_at = 0.0
     
     async def get_active_editor(self) -> Optional[Dict[str, Any]]:
         """Get information about the active editor"""
@@ -24,6 +41,7 @@ class VSCodeClient:
                         return await response.json()
                     return None
         except Exception as e:
+            self._invalidate_availability()
             print(f"Error getting active editor: {e}")
             return None
     
@@ -36,6 +54,7 @@ class VSCodeClient:
                         return await response.json()
                     return None
         except Exception as e:
+            self._invalidate_availability()
             print(f"Error reading file: {e}")
             return None
     
@@ -57,6 +76,7 @@ class VSCodeClient:
                     print(f"✅ VS Code API Response: {status} - {response_text}")
                     return status == 200
         except Exception as e:
+            self._invalidate_availability()
             print(f"❌ Error writing file: {e}")
             import traceback
             traceback.print_exc()
@@ -72,6 +92,7 @@ class VSCodeClient:
                 }) as response:
                     return response.status == 200
         except Exception as e:
+            self._invalidate_availability()
             print(f"Error opening file: {e}")
             return False
     
@@ -87,6 +108,7 @@ class VSCodeClient:
                 }) as response:
                     return response.status == 200
         except Exception as e:
+            self._invalidate_availability()
             print(f"Error editing file: {e}")
             return False
     
@@ -100,6 +122,7 @@ class VSCodeClient:
                         return data.get("folders", [])
                     return []
         except Exception as e:
+            self._invalidate_availability()
             print(f"Error getting workspace folders: {e}")
             return []
     
@@ -116,6 +139,7 @@ class VSCodeClient:
                         return data.get("result")
                     return None
         except Exception as e:
+            self._invalidate_availability()
             print(f"Error executing command: {e}")
             return None
     
@@ -129,6 +153,7 @@ class VSCodeClient:
                 }) as response:
                     return response.status == 200
         except Exception as e:
+            self._invalidate_availability()
             print(f"Error showing notification: {e}")
             return False
 